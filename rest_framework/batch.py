@@ -0,0 +1,212 @@
+"""
+The batch view runs several API requests within a single HTTP request, which
+saves clients the overhead of making each request separately.
+
+It is included by `DefaultRouter` if `include_batch_view` is set. The request
+body is a list of requests, such as:
+
+    [
+        {"method": "GET", "path": "/users/1/"},
+        {"method": "PATCH", "path": "/users/1/", "body": {"name": "Alice"}}
+    ]
+
+And the response is a list of `{"status", "headers", "body"}` results, in the
+same order.
+"""
+import contextlib
+import copy
+import io
+import json
+
+from asgiref.sync import async_to_sync
+from django.db import connections, transaction
+from django.http import QueryDict
+from django.urls import Resolver404, get_script_prefix, resolve
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import exceptions, serializers, status, views
+from rest_framework.compat import iscoroutinefunction
+from rest_framework.response import Response
+
+BATCH_METHODS = ('GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH', 'DELETE')
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    method = serializers.ChoiceField(choices=BATCH_METHODS)
+    path = serializers.CharField()
+    body = serializers.JSONField(required=False, allow_null=True, default=None)
+
+    def validate_path(self, value):
+        if not value.startswith('/'):
+            raise serializers.ValidationError(_('Must be an absolute path.'))
+        return value
+
+
+class BatchView(views.APIView):
+    """
+    Runs a list of API requests, and returns their responses.
+
+    Each request of the batch is authenticated again, by the authentication
+    classes of its own view. The session user and token or basic credentials
+    are only looked up once per batch, but other authentication classes may
+    repeat their lookups for every request of the batch.
+    """
+    _ignore_model_permissions = True
+    schema = None  # exclude from schema
+
+    # The maximum number of requests in a batch.
+    max_requests = 20
+
+    # Set to `True` to run the batch in a single transaction. If any request
+    # fails, the transaction is rolled back and the rest are not run.
+    atomic = False
+
+    def initial(self, request, *args, **kwargs):
+        # Shared by the copies of the request made for each request of the
+        # batch, so that their credentials are only looked up once.
+        request._request.credentials_cache = {}
+        super().initial(request, *args, **kwargs)
+
+    def post(self, request, *args, **kwargs):
+        serializer = BatchRequestSerializer(
+            data=request.data, many=True, allow_empty=False,
+            max_length=self.max_requests
+        )
+        serializer.is_valid(raise_exception=True)
+
+        results = []
+        failed = False
+        with contextlib.ExitStack() as stack:
+            if self.atomic:
+                stack.enter_context(transaction.atomic())
+
+            for sub_request in serializer.validated_data:
+                if failed:
+                    results.append(self.get_skipped_result())
+                    continue
+
+                result = self.run_request(request, **sub_request)
+                results.append(result)
+                if self.atomic and result['status'] >= 400:
+                    failed = True
+                    transaction.set_rollback(True)
+
+        if failed:
+            return Response(results, status=status.HTTP_400_BAD_REQUEST)
+        return Response(results)
+
+    def get_skipped_result(self):
+        return {
+            'status': status.HTTP_424_FAILED_DEPENDENCY,
+            'headers': {},
+            'body': {'detail': _('Not run, as an earlier request in the batch failed.')}
+        }
+
+    def run_request(self, request, method, path, body):
+        """
+        Run a single request of the batch through its API view, and return
+        a dict of its status, headers and body.
+        """
+        http_request = self.build_request(request, method, path, body)
+
+        try:
+            match = resolve(http_request.path_info, getattr(http_request, 'urlconf', None))
+        except Resolver404:
+            return self.get_error_result(exceptions.NotFound())
+
+        view_class = getattr(match.func, 'cls', None)
+        if (
+            view_class is None or
+            not issubclass(view_class, views.APIView) or
+            issubclass(view_class, BatchView)
+        ):
+            return self.get_error_result(exceptions.NotFound(
+                _('Only API views can be included in a batch.')
+            ))
+
+        http_request.resolver_match = match
+        view = match.func
+        if iscoroutinefunction(view):
+            view = async_to_sync(view)
+
+        # Run the view the way Django's request handler would, so that with
+        # `ATOMIC_REQUESTS`, an error only rolls back its own changes.
+        non_atomic_requests = getattr(match.func, '_non_atomic_requests', set())
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                if (
+                    connection.settings_dict['ATOMIC_REQUESTS'] and
+                    connection.alias not in non_atomic_requests
+                ):
+                    stack.enter_context(transaction.atomic(using=connection.alias))
+            response = view(http_request, *match.args, **match.kwargs)
+            # Render the response as Django's request handler would, so that
+            # its headers, such as `Content-Type`, are set.
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+
+        return {
+            'status': response.status_code,
+            'headers': dict(response.items()),
+            'body': self.get_response_body(response)
+        }
+
+    def build_request(self, request, method, path, body):
+        """
+        Return a copy of the batch's `HttpRequest`, for a request of the batch.
+        """
+        http_request = copy.copy(request._request)
+        path, sep, query_string = path.partition('?')
+        content = b'' if body is None else json.dumps(body).encode('utf-8')
+
+        # Paths are given as seen by the client, so include the script prefix.
+        path_info = path
+        script_prefix = get_script_prefix()
+        if path.startswith(script_prefix):
+            path_info = '/' + path[len(script_prefix):]
+
+        http_request.method = method
+        http_request.path = path
+        http_request.path_info = path_info
+        http_request.META = {
+            **request._request.META,
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path_info,
+            'QUERY_STRING': query_string,
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': str(len(content)),
+            'HTTP_ACCEPT': 'application/json',
+        }
+        http_request.GET = QueryDict(query_string)
+        http_request.content_type = 'application/json'
+        http_request.content_params = {}
+        http_request._stream = io.BytesIO(content)
+        http_request._read_started = False
+        for attr in ('_body', '_post', '_files', 'headers', 'resolver_match'):
+            http_request.__dict__.pop(attr, None)
+
+        # The request keeps the credentials of the batch, such as its
+        # session or `Authorization` header, and is authenticated by the
+        # authentication classes of the view it is run through. So the
+        # batch's user is only shared with views that accept the way in
+        # which the batch was authenticated.
+        return http_request
+
+    def get_response_body(self, response):
+        if isinstance(response, Response):
+            return response.data
+
+        if response.streaming:
+            content = b''.join(response.streaming_content)
+        else:
+            content = response.content
+        if content and response.get('Content-Type', '').startswith('application/json'):
+            return json.loads(content)
+        return content.decode(response.charset)
+
+    def get_error_result(self, exc):
+        return {
+            'status': exc.status_code,
+            'headers': {},
+            'body': {'detail': exc.detail}
+        }
@@ -2,6 +2,8 @@
 The `compat` module provides support for backwards compatibility with older
 versions of Django/Python, and compatibility wrappers around optional packages.
 """
+import asyncio
+
 import django
 from django.conf import settings
 from django.views.generic import View
@@ -55,6 +57,13 @@ except ImportError:
     yaml = None
 
 
+# orjson is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
 # requests is optional
 try:
     import requests
@@ -177,6 +186,25 @@ else:
         }
 
 
+# `classproperty` moved to `django.utils.functional` in Django 3.1
+try:
+    from django.utils.functional import classproperty
+except ImportError:
+    from django.utils.decorators import classproperty  # noqa
+
+
+# Django only awaits views that are marked as coroutine functions.
+# asgiref 3.6+ provides helpers for this that also work on Python 3.12+.
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:
+    iscoroutinefunction = asyncio.iscoroutinefunction
+
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
+
+
 # `separators` argument to `json.dumps()` differs between 2.x and 3.x
 # See: https://bugs.python.org/issue22767
 SHORT_SEPARATORS = (',', ':')
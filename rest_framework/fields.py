@@ -5,19 +5,22 @@ import decimal
 import functools
 import inspect
 import logging
+import operator
 import re
+import types
 import uuid
+import weakref
 from collections.abc import Mapping
 
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.validators import (
     EmailValidator, MaxLengthValidator, MaxValueValidator, MinLengthValidator,
     MinValueValidator, ProhibitNullCharactersValidator, RegexValidator,
     URLValidator, ip_address_validators
 )
-from django.db.models import IntegerChoices, TextChoices
+from django.db.models import IntegerChoices, QuerySet, TextChoices
 from django.forms import FilePathField as DjangoFilePathField
 from django.forms import ImageField as DjangoImageField
 from django.utils import timezone
@@ -27,6 +30,7 @@ from django.utils.dateparse import (
 from django.utils.duration import duration_string
 from django.utils.encoding import is_protected_type, smart_str
 from django.utils.formats import localize_input, sanitize_separators
+from django.utils.functional import cached_property
 from django.utils.ipv6 import clean_ipv6_address
 from django.utils.translation import gettext_lazy as _
 
@@ -64,6 +68,12 @@ class BuiltinSignatureError(Exception):
     pass
 
 
+# Results of `is_simple_callable()` for functions and for methods, keyed by
+# the underlying function object.
+_simple_functions = weakref.WeakKeyDictionary()
+_simple_methods = weakref.WeakKeyDictionary()
+
+
 def is_simple_callable(obj):
     """
     True if the object is a callable that takes no arguments.
@@ -77,9 +87,24 @@ def is_simple_callable(obj):
             'Built-in function signatures are not inspectable. '
             'Wrap the function call in a simple, pure Python function.')
 
-    if not (inspect.isfunction(obj) or inspect.ismethod(obj) or isinstance(obj, functools.partial)):
+    # Inspecting signatures is slow, so the result is cached per function.
+    if isinstance(obj, types.MethodType) and isinstance(obj.__func__, types.FunctionType):
+        cache, key = _simple_methods, obj.__func__
+    elif isinstance(obj, types.FunctionType):
+        cache, key = _simple_functions, obj
+    elif isinstance(obj, (types.MethodType, functools.partial)):
+        return _has_simple_signature(obj)
+    else:
         return False
 
+    try:
+        return cache[key]
+    except KeyError:
+        result = cache[key] = _has_simple_signature(obj)
+        return result
+
+
+def _has_simple_signature(obj):
     sig = inspect.signature(obj)
     params = sig.parameters.values()
     return all(
@@ -117,6 +142,63 @@ def get_attribute(instance, attrs):
     return instance
 
 
+def compile_attribute_getter(attrs):
+    """
+    Return a function that behaves like `get_attribute(instance, attrs)`,
+    specialised for the given list of attributes.
+
+    Each lookup is compiled into an `itemgetter` or an `attrgetter`, chosen
+    once per type of the object being looked up, and callable checks are
+    only made for values that are actually callable.
+    """
+    lookups = [
+        (attr, operator.itemgetter(attr), operator.attrgetter(attr))
+        for attr in attrs
+    ]
+    # Maps each type of object seen to whether it is a `Mapping`.
+    mapping_types = {}
+
+    def attribute_getter(instance):
+        for attr, get_item, get_attr in lookups:
+            cls = type(instance)
+            try:
+                is_mapping = mapping_types[cls]
+            except KeyError:
+                is_mapping = mapping_types[cls] = isinstance(instance, Mapping)
+            try:
+                instance = get_item(instance) if is_mapping else get_attr(instance)
+            except ObjectDoesNotExist:
+                return None
+            if callable(instance) and is_simple_callable(instance):
+                try:
+                    instance = instance()
+                except (AttributeError, KeyError) as exc:
+                    raise ValueError('Exception raised in callable attribute "{}"; original exception was: {}'.format(attr, exc))
+        return instance
+
+    attribute_getter.attrs = attrs
+    return attribute_getter
+
+
+_cached_property_names = weakref.WeakKeyDictionary()
+
+
+def get_cached_property_names(cls):
+    """
+    Return the names of the `cached_property` attributes of a class.
+    """
+    try:
+        return _cached_property_names[cls]
+    except KeyError:
+        names = _cached_property_names[cls] = frozenset(
+            name
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if isinstance(attr, cached_property)
+        )
+        return names
+
+
 def to_choices_dict(choices):
     """
     Convert choices into key/value dicts.
@@ -286,6 +368,12 @@ MISSING_ERROR_MESSAGE = (
 )
 
 
+# Types of field attributes that may be shared between clones of a field.
+CLONE_IMMUTABLE_TYPES = frozenset((
+    type(None), bool, int, float, str, tuple, type, decimal.Decimal, REGEX_TYPE
+))
+
+
 class Field:
     _creation_counter = 0
 
@@ -435,7 +523,7 @@ class Field:
         that should be used for this field.
         """
         try:
-            return get_attribute(instance, self.source_attrs)
+            return self.get_attribute_getter()(instance)
         except BuiltinSignatureError as exc:
             msg = (
                 'Field source for `{serializer}.{field}` maps to a built-in '
@@ -470,6 +558,17 @@ class Field:
             )
             raise type(exc)(msg)
 
+    def get_attribute_getter(self):
+        """
+        Return the compiled lookup for `self.source_attrs`, that is used to
+        get the value for this field from the *outgoing* object instance.
+        """
+        # Compiled once per set of source attrs, which are set by `.bind()`.
+        getter = self.__dict__.get('_attribute_getter')
+        if getter is None or getter.attrs is not self.source_attrs:
+            getter = self._attribute_getter = compile_attribute_getter(self.source_attrs)
+        return getter
+
     def get_default(self):
         """
         Return the default value to use when validating data if no input
@@ -632,7 +731,13 @@ class Field:
         """
         When cloning fields we instantiate using the arguments it was
         originally created with, rather than copying the complete state.
+
+        Fields that have not been bound yet, such as the declared fields
+        of a serializer class, are instead cloned directly from their state.
         """
+        if self.parent is None:
+            return self._clone()
+
         # Treat regexes and validators as immutable.
         # See https://github.com/encode/django-rest-framework/issues/1954
         # and https://github.com/encode/django-rest-framework/pull/4489
@@ -646,6 +751,39 @@ class Field:
         }
         return self.__class__(*args, **kwargs)
 
+    def _clone(self):
+        """
+        Return a copy of the field that shares the immutable parts of its
+        state, so that the field's `__init__()` doesn't need to run again.
+
+        Mutable containers are copied, so that modifying a clone does not
+        affect any other clones, and child fields are cloned and rebound to
+        the new field. Values cached with `cached_property`, such as the
+        bound fields of a serializer, are left to be rebuilt by the clone.
+        """
+        cls = self.__class__
+        clone = object.__new__(cls)
+        state = self.__dict__.copy()
+        for key in get_cached_property_names(cls):
+            state.pop(key, None)
+        for key, value in state.items():
+            if value.__class__ in CLONE_IMMUTABLE_TYPES:
+                continue
+            elif isinstance(value, (list, dict, set)):
+                state[key] = value.copy()
+            elif isinstance(value, Field) and key != 'parent':
+                child = value._clone()
+                if value.parent is self:
+                    child.parent = clone
+                state[key] = child
+            elif isinstance(value, QuerySet):
+                # Querysets are copied without their result cache.
+                state[key] = copy.deepcopy(value)
+        state['_creation_counter'] = Field._creation_counter
+        Field._creation_counter += 1
+        clone.__dict__ = state
+        return clone
+
     def __repr__(self):
         """
         Fields are represented using their initial calling arguments.
@@ -1876,6 +2014,74 @@ class SerializerMethodField(Field):
         return method(value)
 
 
+class BatchedSerializerMethodField(SerializerMethodField):
+    """
+    A read-only field that gets its representation for many objects at once,
+    by calling a method on the parent serializer class. The method called
+    will be of the form "get_{field_name}", and should take a single
+    argument, which is the list of objects being serialized, and return a
+    mapping of object -> value, or of pk -> value. Objects missing from the
+    mapping are represented as `None`. The method may instead return a list
+    of values, in the same order as the objects.
+
+    When the parent serializer is used with `many=True`, or is nested within
+    a serializer that is, the method is called once for all of the objects,
+    including those of nested lists at the same depth.
+
+    For example:
+
+    class ExampleSerializer(Serializer):
+        extra_info = BatchedSerializerMethodField()
+
+        def get_extra_info(self, objs):
+            return {obj: ... for obj in objs}  # Calculate data for all objs.
+    """
+    def __init__(self, method_name=None, **kwargs):
+        # Set by `ListSerializer` while values are collected for a batch.
+        self.batch_loader = None
+        super().__init__(method_name, **kwargs)
+
+    def get_batch(self, objs):
+        """
+        Returns the list of values for a list of objects.
+        """
+        method = getattr(self.parent, self.method_name)
+        values = method(objs)
+        if isinstance(values, Mapping):
+            return [self.get_batch_value(values, obj) for obj in objs]
+
+        values = list(values)
+        if len(values) != len(objs):
+            raise ImproperlyConfigured(
+                'Expected `{serializer}.{method_name}()` to return a mapping, '
+                'or {expected} values, one for each object, but got {count} '
+                'values.'.format(
+                    serializer=self.parent.__class__.__name__,
+                    method_name=self.method_name,
+                    expected=len(objs),
+                    count=len(values)
+                )
+            )
+        return values
+
+    def get_batch_value(self, values, obj):
+        """
+        Returns the value for an object from a mapping of object -> value or
+        pk -> value, or `None` if the object is missing.
+        """
+        with contextlib.suppress(TypeError):
+            if obj in values:
+                return values[obj]
+        pk = getattr(obj, 'pk', None)
+        return None if pk is None else values.get(pk)
+
+    def to_representation(self, value):
+        if self.batch_loader is not None:
+            # The value is filled in once the whole batch has been collected.
+            return self.batch_loader.collect(self, value)
+        return self.get_batch([value])[0]
+
+
 class ModelField(Field):
     """
     A generic field that can be used against an arbitrary model field.
@@ -1,13 +1,19 @@
 """
 Generic views that provide commonly needed behaviour.
 """
+from itertools import islice
+
 from django.core.exceptions import ValidationError
 from django.db.models.query import QuerySet
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404 as _get_object_or_404
 
 from rest_framework import mixins, views
+from rest_framework.pagination import CursorPagination
 from rest_framework.settings import api_settings
+from rest_framework.utils.query_plan import (
+    QueryPlan, get_prune_columns, get_query_plan
+)
 
 
 def get_object_or_404(queryset, *filter_args, **filter_kwargs):
@@ -45,6 +51,19 @@ class GenericAPIView(views.APIView):
     # The style to use for queryset pagination.
     pagination_class = api_settings.DEFAULT_PAGINATION_CLASS
 
+    # Set to `True` to automatically apply the `select_related()` and
+    # `prefetch_related()` lookups that the serializer requires.
+    auto_prefetch = False
+
+    # Set to `True` to only load the model fields that the serializer reads.
+    # Defaults to the `prune_columns` option on the serializer's `Meta`.
+    prune_columns = None
+
+    # Set to `True` to stream unpaginated lists, serializing and rendering
+    # `stream_chunk_size` items at a time.
+    stream_results = False
+    stream_chunk_size = 2000
+
     # Allow generic typing checking for generic views.
     def __class_getitem__(cls, *args, **kwargs):
         return cls
@@ -84,7 +103,7 @@ class GenericAPIView(views.APIView):
         queryset lookups.  Eg if objects are referenced using multiple
         keyword arguments in the url conf.
         """
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.apply_query_plan(self.filter_queryset(self.get_queryset()))
 
         # Perform the lookup filtering.
         lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
@@ -154,6 +173,109 @@ class GenericAPIView(views.APIView):
             queryset = backend().filter_queryset(self.request, queryset, self)
         return queryset
 
+    def get_query_plan(self, queryset):
+        """
+        Return the `QueryPlan` with the related lookups required to serialize
+        instances from the given queryset.
+
+        This is useful for inspecting the lookups used by `auto_prefetch`,
+        and the fields loaded by `prune_columns`.
+        """
+        return get_query_plan(
+            self.get_serializer(), queryset.model,
+            prune_columns=self.get_prune_columns()
+        )
+
+    def get_prune_columns(self):
+        """
+        Return `True` if only the model fields read by the serializer
+        should be loaded.
+        """
+        if self.prune_columns is not None:
+            return self.prune_columns
+        return get_prune_columns(self.get_serializer_class())
+
+    def apply_query_plan(self, queryset):
+        """
+        Given a queryset, apply the related lookups required by the serializer
+        if `auto_prefetch` is enabled, and load only the fields it reads if
+        `prune_columns` is enabled.
+        """
+        if not isinstance(queryset, QuerySet):
+            return queryset
+        if not (self.auto_prefetch or self.get_prune_columns()):
+            return queryset
+        plan = self.get_query_plan(queryset)
+        if not self.auto_prefetch:
+            plan = QueryPlan(only=plan.only)
+        return plan.apply(queryset)
+
+    def apply_values_plan(self, queryset):
+        """
+        Given a queryset, return a `.values()` queryset if the serializer
+        reads rows from values rather than model instances, so that the
+        paginated page of results doesn't need to load model instances.
+        """
+        if not isinstance(queryset, QuerySet) or isinstance(self.paginator, CursorPagination):
+            # The cursor pagination reads its ordering from the results.
+            return queryset
+        meta = getattr(self.get_serializer_class(), 'Meta', None)
+        if not getattr(meta, 'use_values', False):
+            return queryset
+        values_plan = self.get_serializer().get_values_plan()
+        if values_plan is None:
+            return queryset
+        return values_plan.apply(queryset)
+
+    def iter_chunks(self, queryset):
+        """
+        Given a queryset, yield lists of up to `stream_chunk_size` items,
+        without loading all of the results into memory.
+        """
+        if isinstance(queryset, QuerySet):
+            iterator = queryset.iterator(chunk_size=self.stream_chunk_size)
+        else:
+            iterator = iter(queryset)
+        while True:
+            chunk = list(islice(iterator, self.stream_chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def get_streaming_response(self, queryset):
+        """
+        Return a `StreamingHttpResponse` that serializes and renders the
+        queryset in chunks, or `None` if the accepted renderer doesn't
+        support streaming.
+        """
+        renderer = self.request.accepted_renderer
+        if not self.renderer_supports_streaming(renderer):
+            return None
+
+        chunks = (
+            self.get_serializer(chunk, many=True).data
+            for chunk in self.iter_chunks(queryset)
+        )
+        content = renderer.render_stream(
+            chunks, self.request.accepted_media_type, self.get_renderer_context()
+        )
+        content_type = renderer.media_type
+        if renderer.charset is not None:
+            content_type = '{}; charset={}'.format(content_type, renderer.charset)
+        return StreamingHttpResponse(content, content_type=content_type)
+
+    def renderer_supports_streaming(self, renderer):
+        """
+        Return `True` if the renderer implements `render_stream()`, and its
+        `render()` isn't overridden by a subclass of the class that does,
+        since the streamed output wouldn't match a customized `render()`.
+        """
+        renderer_class = type(renderer)
+        for klass in renderer_class.__mro__:
+            if 'render_stream' in vars(klass):
+                return renderer_class.render is klass.render
+        return False
+
     @property
     def paginator(self):
         """
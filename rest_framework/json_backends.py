@@ -0,0 +1,191 @@
+"""
+JSON backends encode and decode the JSON used by `JSONRenderer` and
+`JSONParser`, and are set by the `JSON_BACKEND` setting.
+
+The default backend uses the standard library `json` module. Other backends
+may use a faster library, but must give the same results.
+"""
+import codecs
+import decimal
+import json as _json
+
+from rest_framework.compat import INDENT_SEPARATORS, SHORT_SEPARATORS, orjson
+from rest_framework.utils import json
+
+# Maps digits to b'0' and other bytes to b' ', so that integers that may not
+# fit in 64 bits can be found with a substring search.
+DIGITS_TABLE = bytes(ord('0') if chr(idx).isdigit() and idx < 128 else ord(' ') for idx in range(256))
+WIDE_INTEGER = b'0' * 19
+
+
+def has_non_finite_floats(data):
+    """
+    Returns `True` if the data contains NaN or infinite floats or decimals.
+    """
+    stack = [(data,)]
+    while stack:
+        obj = stack.pop()
+        for value in (obj.values() if isinstance(obj, dict) else obj):
+            # Check the common types first, as this is run on whole responses.
+            value_type = type(value)
+            if value is None or value_type in (str, int, bool):
+                continue
+            if isinstance(value, float):
+                # Only NaN and infinite values give a non-zero difference.
+                if value - value:
+                    return True
+            elif isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+            elif isinstance(value, decimal.Decimal) and not value.is_finite():
+                return True
+    return False
+
+
+class BaseJSONBackend:
+    """
+    All JSON backends should extend this class, and override the `.dumps()`
+    and `.loads()` methods.
+    """
+    def dumps(self, data, encoder_class, indent=None, ensure_ascii=True,
+              allow_nan=False, separators=None):
+        """
+        Encode `data` into JSON, returning a bytestring. The U+2028 and
+        U+2029 characters are always escaped.
+        """
+        raise NotImplementedError('JSON backends must implement .dumps()')
+
+    def loads(self, data, encoding='utf-8', strict=True):
+        """
+        Decode the JSON in the bytestring `data`. Raises `ValueError` for
+        invalid JSON, and for NaN or infinite values if `strict` is set.
+        """
+        raise NotImplementedError('JSON backends must implement .loads()')
+
+
+class JSONBackend(BaseJSONBackend):
+    """
+    Encodes and decodes JSON with the standard library `json` module.
+    """
+    def dumps(self, data, encoder_class, indent=None, ensure_ascii=True,
+              allow_nan=False, separators=None):
+        ret = json.dumps(
+            data, cls=encoder_class,
+            indent=indent, ensure_ascii=ensure_ascii,
+            allow_nan=allow_nan, separators=separators
+        )
+
+        # We always fully escape \u2028 and \u2029 to ensure we output JSON
+        # that is a strict javascript subset. ASCII output is already escaped,
+        # and the check avoids copying the output in the usual case that
+        # neither character is present.
+        # See: https://gist.github.com/damncabbage/623b879af56f850a6ddc
+        if not ensure_ascii and ('\u2028' in ret or '\u2029' in ret):
+            ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+        return ret.encode()
+
+    def loads(self, data, encoding='utf-8', strict=True):
+        parse_constant = json.strict_constant if strict else None
+        return json.loads(data.decode(encoding), parse_constant=parse_constant)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    Encodes and decodes JSON with `orjson`, which must be installed.
+
+    Anything that `orjson` can't handle in the same way as the standard
+    library is passed on to it instead. This includes ASCII-only or
+    non-compact output, indents other than two spaces, NaN and infinite
+    floats, integers wider than 64 bits, and encoders that override more than
+    `.default()`. Values of types that `orjson` doesn't support, and dates and
+    times, are converted by the encoder's `.default()` method. Floats may be
+    formatted differently, such as `1e16` rather than `1e+16`, but decode to
+    the same values.
+    """
+    # Set to `False` to skip checking for NaN and infinite floats, which are
+    # then encoded as null, rather than as with the standard library.
+    check_floats = True
+
+    dumps_option = 0
+    if orjson is not None:
+        dumps_option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def __init__(self):
+        assert orjson is not None, 'orjson must be installed to use OrjsonBackend'
+
+    def can_dump(self, encoder_class, indent, ensure_ascii, separators):
+        return (
+            not ensure_ascii and
+            (indent, separators) in ((None, SHORT_SEPARATORS), (2, INDENT_SEPARATORS)) and
+            encoder_class.encode is _json.JSONEncoder.encode and
+            encoder_class.iterencode is _json.JSONEncoder.iterencode
+        )
+
+    def dumps(self, data, encoder_class, indent=None, ensure_ascii=True,
+              allow_nan=False, separators=None):
+        kwargs = {
+            'indent': indent, 'ensure_ascii': ensure_ascii,
+            'allow_nan': allow_nan, 'separators': separators
+        }
+        if not self.can_dump(encoder_class, indent, ensure_ascii, separators):
+            return super().dumps(data, encoder_class, **kwargs)
+
+        # Keep the values returned by `.default()`, as the values passed to it
+        # may be iterators, which can't be converted again if the standard
+        # library is needed.
+        converted = {}
+        encoder_default = encoder_class().default
+
+        def default(obj):
+            ret = encoder_default(obj)
+            converted[id(obj)] = (obj, ret)
+            return ret
+
+        option = self.dumps_option
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2
+        try:
+            ret = orjson.dumps(data, default=default, option=option)
+        except TypeError:
+            # Raise the same error as the standard library, if any.
+            ret = None
+
+        # `orjson` encodes NaN and infinite floats as null.
+        if ret is None or (
+            self.check_floats and b'null' in ret and
+            has_non_finite_floats([data] + [value for obj, value in converted.values()])
+        ):
+            return super().dumps(data, self.get_converted_encoder_class(encoder_class, converted), **kwargs)
+
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+    def get_converted_encoder_class(self, encoder_class, converted):
+        """
+        Returns a subclass of the encoder class that reuses the values
+        already returned by `.default()`.
+        """
+        if not converted:
+            return encoder_class
+
+        class ConvertedJSONEncoder(encoder_class):
+            def default(self, obj):
+                if id(obj) in converted:
+                    return converted[id(obj)][1]
+                return super().default(obj)
+
+        return ConvertedJSONEncoder
+
+    def loads(self, data, encoding='utf-8', strict=True):
+        if codecs.lookup(encoding).name != 'utf-8':
+            return super().loads(data, encoding, strict)
+        try:
+            # `orjson` decodes integers wider than 64 bits as floats.
+            if WIDE_INTEGER in data.translate(DIGITS_TABLE):
+                raise orjson.JSONDecodeError('Wide integer', '', 0)
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Either the JSON is invalid, in which case the standard library
+            # raises the same error as usual, or it has values that `orjson`
+            # rejects, such as NaN.
+            return super().loads(data, encoding, strict)
@@ -37,13 +37,19 @@ class ListModelMixin:
     List a queryset.
     """
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.apply_query_plan(self.filter_queryset(self.get_queryset()))
+        queryset = self.apply_values_plan(queryset)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
 
+        if self.stream_results:
+            response = self.get_streaming_response(queryset)
+            if response is not None:
+                return response
+
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
@@ -69,7 +75,7 @@ class UpdateModelMixin:
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.apply_query_plan(self.filter_queryset(self.get_queryset()))
         if queryset._prefetch_related_lookups:
             # If 'prefetch_related' has been applied to a queryset, we need to
             # forcibly invalidate the prefetch cache on the instance,
@@ -2,6 +2,8 @@
 Content negotiation deals with selecting an appropriate renderer given the
 incoming request.  Typically this will be based on the request's Accept header.
 """
+import weakref
+
 from django.http import Http404
 
 from rest_framework import exceptions
@@ -11,7 +13,85 @@ from rest_framework.utils.mediatypes import (
 )
 
 
+# The results of negotiation, keyed by view class and then by the media types
+# they depend on. Each view class keeps at most `NEGOTIATION_CACHE_SIZE`
+# results of each kind, so one view's clients can't evict another view's.
+_renderer_cache = weakref.WeakKeyDictionary()
+_parser_cache = weakref.WeakKeyDictionary()
+NEGOTIATION_CACHE_SIZE = 256
+
+
+def _cached_match(cache, request, match, *args):
+    """
+    Return `match(*args)`, cached for the class of the request's view. The
+    results aren't cached for requests without a view.
+    """
+    view = getattr(request, 'parser_context', {}).get('view')
+    if view is None:
+        return match(*args)
+    class_cache = cache.setdefault(type(view), {})
+    try:
+        return class_cache[args]
+    except KeyError:
+        pass
+    result = match(*args)
+    if len(class_cache) >= NEGOTIATION_CACHE_SIZE:
+        class_cache.clear()
+    class_cache[args] = result
+    return result
+
+
+def _match_renderer(accepts, media_types):
+    """
+    Given a tuple of accepted media types, and a tuple of the renderers'
+    media types, return a two-tuple of (renderer index, media type), or
+    `None` if no renderer is acceptable.
+    """
+    # Check the acceptable media types against each renderer,
+    # attempting more specific media types first
+    # NB. The inner loop here isn't as bad as it first looks :)
+    #     Worst case is we're looping over len(accepts) * len(media_types)
+    for media_type_set in order_by_precedence(accepts):
+        for index, renderer_media_type in enumerate(media_types):
+            for media_type in media_type_set:
+                if media_type_matches(renderer_media_type, media_type):
+                    # Return the most specific media type as accepted.
+                    media_type_wrapper = _MediaType(media_type)
+                    if (
+                        _MediaType(renderer_media_type).precedence >
+                        media_type_wrapper.precedence
+                    ):
+                        # Eg client requests '*/*'
+                        # Accepted media type is 'application/json'
+                        full_media_type = ';'.join(
+                            (renderer_media_type,) +
+                            tuple(
+                                '{}={}'.format(key, value)
+                                for key, value in media_type_wrapper.params.items()
+                            )
+                        )
+                        return index, full_media_type
+                    else:
+                        # Eg client requests 'application/json; indent=8'
+                        # Accepted media type is 'application/json; indent=8'
+                        return index, media_type
+    return None
+
+
+def _match_parser(content_type, media_types):
+    """
+    Return the index of the first parser media type that matches the
+    content type, or `None`.
+    """
+    for index, media_type in enumerate(media_types):
+        if media_type_matches(media_type, content_type):
+            return index
+    return None
+
+
 class BaseContentNegotiation:
+    stateless = False
+
     def select_parser(self, request, parsers):
         raise NotImplementedError('.select_parser() must be implemented')
 
@@ -20,6 +100,7 @@ class BaseContentNegotiation:
 
 
 class DefaultContentNegotiation(BaseContentNegotiation):
+    stateless = True
     settings = api_settings
 
     def select_parser(self, request, parsers):
@@ -27,10 +108,19 @@ class DefaultContentNegotiation(BaseContentNegotiation):
         Given a list of parsers and a media type, return the appropriate
         parser to handle the incoming request.
         """
-        for parser in parsers:
-            if media_type_matches(parser.media_type, request.content_type):
-                return parser
-        return None
+        # Negotiation only depends on the media types, so the results for
+        # the content types seen by each view class are cached.
+        content_type = request.content_type
+        media_types = tuple(parser.media_type for parser in parsers)
+        if content_type and not any(';' in (media_type or '') for media_type in media_types):
+            # Parameters are only compared when the parser's media type has
+            # them, so parameters such as a multipart boundary are dropped.
+            content_type = content_type.partition(';')[0]
+
+        index = _cached_match(_parser_cache, request, _match_parser, content_type, media_types)
+        if index is None:
+            return None
+        return parsers[index]
 
     def select_renderer(self, request, renderers, format_suffix=None):
         """
@@ -45,37 +135,15 @@ class DefaultContentNegotiation(BaseContentNegotiation):
             renderers = self.filter_renderers(renderers, format)
 
         accepts = self.get_accept_list(request)
+        media_types = tuple(renderer.media_type for renderer in renderers)
 
-        # Check the acceptable media types against each renderer,
-        # attempting more specific media types first
-        # NB. The inner loop here isn't as bad as it first looks :)
-        #     Worst case is we're looping over len(accept_list) * len(self.renderers)
-        for media_type_set in order_by_precedence(accepts):
-            for renderer in renderers:
-                for media_type in media_type_set:
-                    if media_type_matches(renderer.media_type, media_type):
-                        # Return the most specific media type as accepted.
-                        media_type_wrapper = _MediaType(media_type)
-                        if (
-                            _MediaType(renderer.media_type).precedence >
-                            media_type_wrapper.precedence
-                        ):
-                            # Eg client requests '*/*'
-                            # Accepted media type is 'application/json'
-                            full_media_type = ';'.join(
-                                (renderer.media_type,) +
-                                tuple(
-                                    '{}={}'.format(key, value)
-                                    for key, value in media_type_wrapper.params.items()
-                                )
-                            )
-                            return renderer, full_media_type
-                        else:
-                            # Eg client requests 'application/json; indent=8'
-                            # Accepted media type is 'application/json; indent=8'
-                            return renderer, media_type
-
-        raise exceptions.NotAcceptable(available_renderers=renderers)
+        # Negotiation only depends on the media types, so the results for
+        # the Accept headers seen by each view class are cached.
+        match = _cached_match(_renderer_cache, request, _match_renderer, tuple(accepts), media_types)
+        if match is None:
+            raise exceptions.NotAcceptable(available_renderers=renderers)
+        index, media_type = match
+        return renderers[index], media_type
 
     def filter_renderers(self, renderers, format):
         """
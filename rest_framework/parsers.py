@@ -7,8 +7,11 @@ on the request, such as form content or json encoded data.
 
 import codecs
 import contextlib
+import json as _json
+import re
 
 from django.conf import settings
+from django.core.exceptions import RequestDataTooBig
 from django.core.files.uploadhandler import StopFutureHandlers
 from django.http import QueryDict
 from django.http.multipartparser import ChunkIter
@@ -22,6 +25,9 @@ from rest_framework.exceptions import ParseError
 from rest_framework.settings import api_settings
 from rest_framework.utils import json
 
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+DELIMITER = re.compile(r'[ \t\n\r]*[,\]]')
+
 
 class DataAndFiles:
     def __init__(self, data, files):
@@ -35,6 +41,7 @@ class BaseParser:
     attribute, and overriding the `.parse()` method.
     """
     media_type = None
+    stateless = False
 
     def parse(self, stream, media_type=None, parser_context=None):
         """
@@ -49,6 +56,7 @@ class JSONParser(BaseParser):
     """
     Parses JSON-serialized data.
     """
+    stateless = True
     media_type = 'application/json'
     renderer_class = renderers.JSONRenderer
     strict = api_settings.STRICT_JSON
@@ -60,10 +68,124 @@ class JSONParser(BaseParser):
         parser_context = parser_context or {}
         encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
 
+        data = self.read_body(stream)
+        try:
+            return self.get_json_backend().loads(data, encoding, strict=self.strict)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+    def read_body(self, stream):
+        """
+        Read the whole request body as a bytestring, raising
+        `RequestDataTooBig` if it is larger than `DATA_UPLOAD_MAX_MEMORY_SIZE`.
+        """
+        max_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        if max_size is None:
+            return stream.read()
+        data = stream.read(max_size + 1)
+        if len(data) > max_size:
+            raise RequestDataTooBig('Request body exceeded settings.DATA_UPLOAD_MAX_MEMORY_SIZE.')
+        return data
+
+    def get_json_backend(self):
+        """
+        Returns the backend used to decode JSON, as set by `JSON_BACKEND`.
+        """
+        return api_settings.JSON_BACKEND()
+
+
+class StreamingJSONParser(JSONParser):
+    """
+    Parses a JSON array incrementally, returning an iterator over its items
+    rather than a list, so that only part of the request body is held in
+    memory at a time.
+    """
+    read_size = 64 * 1024
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Returns an iterator over the items of the JSON array in the incoming
+        bytestream. Errors in the JSON are raised as the items are read.
+        """
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return self.iter_items(stream, encoding)
+
+    def iter_items(self, stream, encoding):
+        parse_constant = json.strict_constant if self.strict else None
+        decoder = _json.JSONDecoder(parse_constant=parse_constant)
+        reader = codecs.getincrementaldecoder(encoding)()
+        max_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        # The buffer holds the text read but not yet parsed, from `pos`.
+        buffer = ''
+        pos = offset = 0
+        eof = False
+
+        def read():
+            nonlocal buffer, pos, offset, eof
+            pending = len(buffer) - pos
+            if max_size is not None and pending > max_size:
+                raise RequestDataTooBig('Request body exceeded settings.DATA_UPLOAD_MAX_MEMORY_SIZE.')
+            # Read at least as much as is pending, so that items larger than
+            # `read_size` aren't parsed from the start too many times.
+            data = stream.read(max(self.read_size, pending))
+            eof = not data
+            offset += pos
+            buffer = buffer[pos:] + reader.decode(data, final=eof)
+            pos = 0
+
+        def skip_whitespace():
+            nonlocal pos
+            while True:
+                pos = WHITESPACE.match(buffer, pos).end()
+                if pos < len(buffer) or eof:
+                    return
+                read()
+
+        def expect(chars, message):
+            nonlocal pos
+            skip_whitespace()
+            char = buffer[pos:pos + 1]
+            if not char or char not in chars:
+                raise _json.JSONDecodeError(message, buffer, pos)
+            pos += 1
+            return char
+
         try:
-            decoded_stream = codecs.getreader(encoding)(stream)
-            parse_constant = json.strict_constant if self.strict else None
-            return json.load(decoded_stream, parse_constant=parse_constant)
+            expect('[', 'Expecting JSON array')
+            skip_whitespace()
+            end = buffer[pos:pos + 1] == ']'
+            if end:
+                pos += 1
+            while not end:
+                skip_whitespace()
+                try:
+                    item, item_end = decoder.raw_decode(buffer, pos)
+                except _json.JSONDecodeError:
+                    # The item may continue in the next read.
+                    if eof:
+                        raise
+                    read()
+                    continue
+                # Items such as numbers may be parsed from part of their text,
+                # so they must be followed by a delimiter that has been read.
+                match = DELIMITER.match(buffer, item_end)
+                if match is None and not eof:
+                    read()
+                    continue
+                pos = item_end
+                yield item
+                if match is None:
+                    # The whole body has been read, and no delimiter follows.
+                    pos = WHITESPACE.match(buffer, pos).end()
+                    raise _json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                pos = match.end()
+                end = buffer[pos - 1] == ']'
+            skip_whitespace()
+            if pos < len(buffer):
+                raise _json.JSONDecodeError('Extra data', buffer, pos)
+        except _json.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s: char %d' % (exc.msg, offset + exc.pos))
         except ValueError as exc:
             raise ParseError('JSON parse error - %s' % str(exc))
 
@@ -72,6 +194,7 @@ class FormParser(BaseParser):
     """
     Parser for form data.
     """
+    stateless = True
     media_type = 'application/x-www-form-urlencoded'
 
     def parse(self, stream, media_type=None, parser_context=None):
@@ -88,6 +211,7 @@ class MultiPartParser(BaseParser):
     """
     Parser for multipart form data, which may include file data.
     """
+    stateless = True
     media_type = 'multipart/form-data'
 
     def parse(self, stream, media_type=None, parser_context=None):
@@ -117,6 +241,7 @@ class FileUploadParser(BaseParser):
     """
     Parser for file upload data.
     """
+    stateless = True
     media_type = '*/*'
     errors = {
         'unhandled': 'FileUpload parse error - none of upload handlers can handle the stream',
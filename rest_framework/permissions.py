@@ -1,6 +1,7 @@
 """
 Provides a set of pluggable permission policies.
 """
+from asgiref.sync import sync_to_async
 from django.http import Http404
 
 from rest_framework import exceptions
@@ -29,17 +30,34 @@ class SingleOperandHolder(OperationHolderMixin):
     def __init__(self, operator_class, op1_class):
         self.operator_class = operator_class
         self.op1_class = op1_class
+        # Set on the instance, as `stateless` is only honoured when it is
+        # declared by the policy itself, rather than inherited.
+        self.stateless = vars(op1_class).get('stateless', False)
 
     def __call__(self, *args, **kwargs):
         op1 = self.op1_class(*args, **kwargs)
         return self.operator_class(op1)
 
+    def __eq__(self, other):
+        return (
+            isinstance(other, SingleOperandHolder) and
+            self.operator_class == other.operator_class and
+            self.op1_class == other.op1_class
+        )
+
+    def __hash__(self):
+        return hash((self.operator_class, self.op1_class))
+
 
 class OperandHolder(OperationHolderMixin):
     def __init__(self, operator_class, op1_class, op2_class):
         self.operator_class = operator_class
         self.op1_class = op1_class
         self.op2_class = op2_class
+        self.stateless = (
+            vars(op1_class).get('stateless', False) and
+            vars(op2_class).get('stateless', False)
+        )
 
     def __call__(self, *args, **kwargs):
         op1 = self.op1_class(*args, **kwargs)
@@ -54,6 +72,9 @@ class OperandHolder(OperationHolderMixin):
             self.op2_class == other.op2_class
         )
 
+    def __hash__(self):
+        return hash((self.operator_class, self.op1_class, self.op2_class))
+
 
 class AND:
     def __init__(self, op1, op2):
@@ -72,6 +93,18 @@ class AND:
             self.op2.has_object_permission(request, view, obj)
         )
 
+    async def ahas_permission(self, request, view):
+        return (
+            await self.op1.ahas_permission(request, view) and
+            await self.op2.ahas_permission(request, view)
+        )
+
+    async def ahas_object_permission(self, request, view, obj):
+        return (
+            await self.op1.ahas_object_permission(request, view, obj) and
+            await self.op2.ahas_object_permission(request, view, obj)
+        )
+
 
 class OR:
     def __init__(self, op1, op2):
@@ -93,6 +126,21 @@ class OR:
             and self.op2.has_object_permission(request, view, obj)
         )
 
+    async def ahas_permission(self, request, view):
+        return (
+            await self.op1.ahas_permission(request, view) or
+            await self.op2.ahas_permission(request, view)
+        )
+
+    async def ahas_object_permission(self, request, view, obj):
+        return (
+            await self.op1.ahas_permission(request, view)
+            and await self.op1.ahas_object_permission(request, view, obj)
+        ) or (
+            await self.op2.ahas_permission(request, view)
+            and await self.op2.ahas_object_permission(request, view, obj)
+        )
+
 
 class NOT:
     def __init__(self, op1):
@@ -104,6 +152,12 @@ class NOT:
     def has_object_permission(self, request, view, obj):
         return not self.op1.has_object_permission(request, view, obj)
 
+    async def ahas_permission(self, request, view):
+        return not await self.op1.ahas_permission(request, view)
+
+    async def ahas_object_permission(self, request, view, obj):
+        return not await self.op1.ahas_object_permission(request, view, obj)
+
 
 class BasePermissionMetaclass(OperationHolderMixin, type):
     pass
@@ -113,6 +167,7 @@ class BasePermission(metaclass=BasePermissionMetaclass):
     """
     A base class from which all permission classes should inherit.
     """
+    stateless = False
 
     def has_permission(self, request, view):
         """
@@ -126,6 +181,20 @@ class BasePermission(metaclass=BasePermissionMetaclass):
         """
         return True
 
+    async def ahas_permission(self, request, view):
+        """
+        Async version of `.has_permission()`, used by async views.
+        By default `.has_permission()` is run in a thread.
+        """
+        return await sync_to_async(self.has_permission)(request, view)
+
+    async def ahas_object_permission(self, request, view, obj):
+        """
+        Async version of `.has_object_permission()`, used by async views.
+        By default `.has_object_permission()` is run in a thread.
+        """
+        return await sync_to_async(self.has_object_permission)(request, view, obj)
+
 
 class AllowAny(BasePermission):
     """
@@ -134,33 +203,48 @@ class AllowAny(BasePermission):
     permission_classes list, but it's useful because it makes the intention
     more explicit.
     """
+    stateless = True
 
     def has_permission(self, request, view):
         return True
 
+    async def ahas_permission(self, request, view):
+        return True
+
 
 class IsAuthenticated(BasePermission):
     """
     Allows access only to authenticated users.
     """
+    stateless = True
 
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_authenticated)
 
+    async def ahas_permission(self, request, view):
+        user = await request.auser()
+        return bool(user and user.is_authenticated)
+
 
 class IsAdminUser(BasePermission):
     """
     Allows access only to admin users.
     """
+    stateless = True
 
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_staff)
 
+    async def ahas_permission(self, request, view):
+        user = await request.auser()
+        return bool(user and user.is_staff)
+
 
 class IsAuthenticatedOrReadOnly(BasePermission):
     """
     The request is authenticated as a user, or is a read-only request.
     """
+    stateless = True
 
     def has_permission(self, request, view):
         return bool(
@@ -169,6 +253,12 @@ class IsAuthenticatedOrReadOnly(BasePermission):
             request.user.is_authenticated
         )
 
+    async def ahas_permission(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        user = await request.auser()
+        return bool(user and user.is_authenticated)
+
 
 class DjangoModelPermissions(BasePermission):
     """
@@ -181,6 +271,7 @@ class DjangoModelPermissions(BasePermission):
     This permission can only be applied against view classes that
     provide a `.queryset` attribute.
     """
+    stateless = True
 
     # Map methods into required permission codes.
     # Override this if you need to also provide 'view' permissions,
@@ -1,19 +1,28 @@
 import contextlib
 import sys
+from functools import lru_cache
 from operator import attrgetter
 from urllib import parse
 
-from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.core.exceptions import (
+    FieldDoesNotExist, ImproperlyConfigured, ObjectDoesNotExist
+)
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.signals import setting_changed
+from django.db import DataError
 from django.db.models import Manager
 from django.db.models.query import QuerySet
-from django.urls import NoReverseMatch, Resolver404, get_script_prefix, resolve
+from django.urls import (
+    NoReverseMatch, Resolver404, get_script_prefix, get_urlconf, resolve
+)
 from django.utils.encoding import smart_str, uri_to_iri
 from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import ValidationError
 from rest_framework.fields import (
     Field, SkipField, empty, get_attribute, is_simple_callable, iter_options
 )
-from rest_framework.reverse import reverse
+from rest_framework.reverse import URLTemplates, reverse
 from rest_framework.settings import api_settings
 from rest_framework.utils import html
 
@@ -27,6 +36,47 @@ def method_overridden(method_name, klass, instance):
     return default_method is not getattr(instance, method_name).__func__
 
 
+@lru_cache(maxsize=1024)
+def _resolve(path, urlconf):
+    return resolve(path, urlconf)
+
+
+def resolve_path(path):
+    """
+    Same as `django.urls.resolve`, but with the matches for the most recently
+    used paths cached, as hyperlinked fields often resolve the same paths.
+    """
+    return _resolve(path, get_urlconf())
+
+
+def clear_resolve_cache(*args, **kwargs):
+    _resolve.cache_clear()
+
+
+setting_changed.connect(clear_resolve_cache)
+
+
+def get_lookup_model_field(model, lookup):
+    """
+    Returns the model field for a lookup such as `'pk'` or
+    `'author__username'`, or `None` if it can't be determined.
+    """
+    field = None
+    for name in lookup.split('__'):
+        if field is not None:
+            if not field.is_relation or field.related_model is None:
+                return None
+            model = field.related_model
+        try:
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+    # Lookups on a foreign key compare against the key of the related object.
+    while field is not None and field.many_to_one and hasattr(field, 'target_field'):
+        field = field.target_field
+    return field
+
+
 class ObjectValueError(ValueError):
     """
     Raised when `queryset.get()` failed due to an underlying `ValueError`.
@@ -169,6 +219,102 @@ class RelatedField(Field):
     def use_pk_only_optimization(self):
         return False
 
+    def get_lookup_field(self):
+        """
+        Returns the name of the model field that input values are looked up
+        by, or `None` if the objects can't be resolved in a single query.
+        """
+        return None
+
+    def prepare_lookup_value(self, data):
+        """
+        Returns the value to look up for an input value.
+        """
+        return data
+
+    def get_lookup_key(self, value):
+        """
+        Returns a key that is equal for a lookup value and the value of the
+        same field on a model instance. Raises `TypeError` or `ValueError`
+        for values that can't be looked up.
+        """
+        model_field = get_lookup_model_field(self.get_queryset().model, self.get_lookup_field())
+        if model_field is not None:
+            value = model_field.get_prep_value(value)
+        return str(value)
+
+    def get_resolved_object(self, value):
+        """
+        Returns the object for a lookup value from the objects resolved by
+        `resolving()`, or `None` if the value hasn't been resolved. Raises
+        `ObjectDoesNotExist` if the object is known not to exist.
+        """
+        resolved = getattr(self, '_resolved_objects', None)
+        if not resolved:
+            return None
+        try:
+            key = self.get_lookup_key(value)
+        except (TypeError, ValueError, DjangoValidationError):
+            return None
+        if key not in resolved:
+            return None
+        if resolved[key] is None:
+            raise ObjectDoesNotExist()
+        return resolved[key]
+
+    @contextlib.contextmanager
+    def resolving(self, data):
+        """
+        Look up the objects for a list of input values with a single query,
+        so that `to_internal_value()` doesn't need to query for each value.
+        """
+        previous = getattr(self, '_resolved_objects', None)
+        lookup_field = self.get_lookup_field()
+        if lookup_field is None:
+            yield
+            return
+
+        resolved = dict(previous or {})
+        lookups = {}
+        for item in data:
+            try:
+                value = self.prepare_lookup_value(item)
+                key = self.get_lookup_key(value)
+            except (TypeError, ValueError, ValidationError, DjangoValidationError):
+                continue
+            if key not in resolved:
+                lookups.setdefault(key, value)
+
+        if lookups:
+            objects = {}
+            ambiguous = set()
+            try:
+                queryset = self.get_queryset().filter(**{lookup_field + '__in': list(lookups.values())})
+                for obj in queryset:
+                    key = self.get_lookup_key(attrgetter(lookup_field.replace('__', '.'))(obj))
+                    if key in objects:
+                        ambiguous.add(key)
+                    objects[key] = obj
+            except (TypeError, ValueError, DataError, DjangoValidationError):
+                objects = None
+
+            if objects is not None:
+                # Values that match more than one object are left to be
+                # looked up individually, as are missing values if the
+                # database matched any object by a different value.
+                exact = all(key in lookups for key in objects)
+                for key in lookups:
+                    if key in ambiguous:
+                        continue
+                    if key in objects or exact:
+                        resolved[key] = objects.get(key)
+
+        self._resolved_objects = resolved
+        try:
+            yield
+        finally:
+            self._resolved_objects = previous
+
     def get_attribute(self, instance):
         if self.use_pk_only_optimization() and self.source_attrs:
             # Optimized case, return a mock object only containing the pk attribute.
@@ -249,6 +395,18 @@ class PrimaryKeyRelatedField(RelatedField):
     def use_pk_only_optimization(self):
         return True
 
+    def get_lookup_field(self):
+        if method_overridden('to_internal_value', PrimaryKeyRelatedField, self):
+            return None
+        return 'pk'
+
+    def prepare_lookup_value(self, data):
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+        if isinstance(data, bool):
+            raise TypeError
+        return data
+
     def to_internal_value(self, data):
         if self.pk_field is not None:
             data = self.pk_field.to_internal_value(data)
@@ -256,6 +414,9 @@ class PrimaryKeyRelatedField(RelatedField):
         try:
             if isinstance(data, bool):
                 raise TypeError
+            obj = self.get_resolved_object(data)
+            if obj is not None:
+                return obj
             return queryset.get(pk=data)
         except ObjectDoesNotExist:
             self.fail('does_not_exist', pk_value=data)
@@ -330,10 +491,40 @@ class HyperlinkedRelatedField(RelatedField):
             return None
 
         lookup_value = getattr(obj, self.lookup_field)
-        kwargs = {self.lookup_url_kwarg: lookup_value}
-        return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+        return self.get_url_templates(request).get_url(
+            view_name, self.lookup_url_kwarg, lookup_value, format=format
+        )
 
-    def to_internal_value(self, data):
+    def get_url_templates(self, request):
+        """
+        Returns the `URLTemplates` used to build URLs for the given request.
+        """
+        templates = getattr(self, '_url_templates', None)
+        if templates is None or templates.request is not request or templates.reverse is not self.reverse:
+            templates = URLTemplates(request, reverse=self.reverse)
+            self._url_templates = templates
+        return templates
+
+    def get_lookup_field(self):
+        if (
+            method_overridden('to_internal_value', HyperlinkedRelatedField, self) or
+            method_overridden('get_object', HyperlinkedRelatedField, self)
+        ):
+            return None
+        return self.lookup_field
+
+    def prepare_lookup_value(self, data):
+        match = self.resolve_url(data)
+        try:
+            return match.kwargs[self.lookup_url_kwarg]
+        except KeyError:
+            raise ValueError('The URL has no %r argument.' % self.lookup_url_kwarg)
+
+    def resolve_url(self, data):
+        """
+        Return the URL conf match for a hyperlink, checking that it matches
+        the view of this field.
+        """
         request = self.context.get('request')
         try:
             http_prefix = data.startswith(('http:', 'https:'))
@@ -350,7 +541,7 @@ class HyperlinkedRelatedField(RelatedField):
         data = uri_to_iri(parse.unquote(data))
 
         try:
-            match = resolve(data)
+            match = resolve_path(data)
         except Resolver404:
             self.fail('no_match')
 
@@ -364,8 +555,18 @@ class HyperlinkedRelatedField(RelatedField):
         if match.view_name != expected_viewname:
             self.fail('incorrect_match')
 
+        return match
+
+    def to_internal_value(self, data):
+        match = self.resolve_url(data)
+
         try:
-            return self.get_object(match.view_name, match.args, match.kwargs)
+            obj = None
+            if self.lookup_url_kwarg in match.kwargs:
+                obj = self.get_resolved_object(match.kwargs[self.lookup_url_kwarg])
+            if obj is None:
+                obj = self.get_object(match.view_name, match.args, match.kwargs)
+            return obj
         except (ObjectDoesNotExist, ObjectValueError, ObjectTypeError):
             self.fail('does_not_exist')
 
@@ -451,9 +652,17 @@ class SlugRelatedField(RelatedField):
         self.slug_field = slug_field
         super().__init__(**kwargs)
 
+    def get_lookup_field(self):
+        if method_overridden('to_internal_value', SlugRelatedField, self):
+            return None
+        return self.slug_field
+
     def to_internal_value(self, data):
         queryset = self.get_queryset()
         try:
+            obj = self.get_resolved_object(data)
+            if obj is not None:
+                return obj
             return queryset.get(**{self.slug_field: data})
         except ObjectDoesNotExist:
             self.fail('does_not_exist', slug_name=self.slug_field, value=smart_str(data))
@@ -524,10 +733,17 @@ class ManyRelatedField(Field):
         if not self.allow_empty and len(data) == 0:
             self.fail('empty')
 
-        return [
-            self.child_relation.to_internal_value(item)
-            for item in data
-        ]
+        ret = []
+        errors = []
+        with self.child_relation.resolving(data):
+            for item in data:
+                try:
+                    ret.append(self.child_relation.to_internal_value(item))
+                except ValidationError as exc:
+                    errors.extend(exc.detail)
+        if errors:
+            raise ValidationError(errors)
+        return ret
 
     def get_attribute(self, instance):
         # Can't have any relationships if not created
@@ -535,7 +751,7 @@ class ManyRelatedField(Field):
             return []
 
         try:
-            relationship = get_attribute(instance, self.source_attrs)
+            relationship = self.get_attribute_getter()(instance)
         except (KeyError, AttributeError) as exc:
             if self.default is not empty:
                 return self.get_default()
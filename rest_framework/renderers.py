@@ -47,6 +47,7 @@ class BaseRenderer:
     format = None
     charset = 'utf-8'
     render_style = 'text'
+    stateless = False
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
         raise NotImplementedError('Renderer class requires .render() to be implemented')
@@ -56,12 +57,15 @@ class JSONRenderer(BaseRenderer):
     """
     Renderer which serializes to JSON.
     """
+    stateless = True
     media_type = 'application/json'
     format = 'json'
     encoder_class = encoders.JSONEncoder
     ensure_ascii = not api_settings.UNICODE_JSON
     compact = api_settings.COMPACT_JSON
     strict = api_settings.STRICT_JSON
+    # Lists with more items than this are rendered in chunks of this size.
+    chunk_size = 1000
 
     # We don't set a charset because JSON is a binary encoding,
     # that can be encoded as utf-8, utf-16 or utf-32.
@@ -81,6 +85,11 @@ class JSONRenderer(BaseRenderer):
         # E.g. If we're being called by the BrowsableAPIRenderer.
         return renderer_context.get('indent', None)
 
+    def get_separators(self, indent):
+        if indent is None:
+            return SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        return INDENT_SEPARATORS
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
         """
         Render `data` into JSON, returning a bytestring.
@@ -91,22 +100,55 @@ class JSONRenderer(BaseRenderer):
         renderer_context = renderer_context or {}
         indent = self.get_indent(accepted_media_type, renderer_context)
 
-        if indent is None:
-            separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
-        else:
-            separators = INDENT_SEPARATORS
+        if isinstance(data, list) and len(data) > self.chunk_size:
+            # Encode long lists a chunk of items at a time, so that the JSON
+            # for all of the items is only held in memory once, as bytes.
+            chunks = (
+                data[idx:idx + self.chunk_size]
+                for idx in range(0, len(data), self.chunk_size)
+            )
+            return b''.join(self.render_stream(chunks, accepted_media_type, renderer_context))
 
-        ret = json.dumps(
-            data, cls=self.encoder_class,
+        return self._encode(data, indent)
+
+    def _encode(self, data, indent):
+        return self.get_json_backend().dumps(
+            data, self.encoder_class,
             indent=indent, ensure_ascii=self.ensure_ascii,
-            allow_nan=not self.strict, separators=separators
+            allow_nan=not self.strict, separators=self.get_separators(indent)
         )
 
-        # We always fully escape \u2028 and \u2029 to ensure we output JSON
-        # that is a strict javascript subset.
-        # See: https://gist.github.com/damncabbage/623b879af56f850a6ddc
-        ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
-        return ret.encode()
+    def get_json_backend(self):
+        """
+        Returns the backend used to encode JSON, as set by `JSON_BACKEND`.
+        """
+        return api_settings.JSON_BACKEND()
+
+    def render_stream(self, chunks, accepted_media_type=None, renderer_context=None):
+        """
+        Render an iterable of lists of items into a single JSON array,
+        yielding bytestrings, so that only one list of items is held in
+        memory at a time. The output is the same as rendering all of the
+        items as one list.
+        """
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        item_separator = self.get_separators(indent)[0].encode()
+
+        yield b'['
+        empty = True
+        for chunk in chunks:
+            if not chunk:
+                continue
+            # Strip the brackets, and the newline before the closing
+            # bracket if indented, from the encoded list of items. This
+            # uses `_encode()` rather than `render()`, as subclasses may
+            # wrap the output of `render()`.
+            ret = self._encode(chunk, indent)
+            ret = ret[1:-1] if indent is None else ret[1:-2]
+            yield ret if empty else item_separator + ret
+            empty = False
+        yield b']' if (empty or indent is None) else b'\n]'
 
 
 class TemplateHTMLRenderer(BaseRenderer):
@@ -128,6 +170,7 @@ class TemplateHTMLRenderer(BaseRenderer):
 
     For pre-rendered HTML, see StaticHTMLRenderer.
     """
+    stateless = True
     media_type = 'text/html'
     format = 'html'
     template_name = None
@@ -246,6 +289,7 @@ class HTMLFormRenderer(BaseRenderer):
 
     Note that rendering of field and form errors is not currently supported.
     """
+    stateless = True
     media_type = 'text/html'
     format = 'form'
     charset = 'utf-8'
@@ -846,6 +890,7 @@ class AdminRenderer(BrowsableAPIRenderer):
 
 
 class DocumentationRenderer(BaseRenderer):
+    stateless = True
     media_type = 'text/html'
     format = 'html'
     charset = 'utf-8'
@@ -881,6 +926,7 @@ class DocumentationRenderer(BaseRenderer):
 
 
 class SchemaJSRenderer(BaseRenderer):
+    stateless = True
     media_type = 'application/javascript'
     format = 'javascript'
     charset = 'utf-8'
@@ -897,6 +943,7 @@ class SchemaJSRenderer(BaseRenderer):
 
 
 class MultiPartRenderer(BaseRenderer):
+    stateless = True
     media_type = 'multipart/form-data; boundary=BoUnDaRyStRiNg'
     format = 'multipart'
     charset = 'utf-8'
@@ -917,6 +964,7 @@ class MultiPartRenderer(BaseRenderer):
 
 
 class CoreJSONRenderer(BaseRenderer):
+    stateless = True
     media_type = 'application/coreapi+json'
     charset = None
     format = 'corejson'
@@ -1050,6 +1098,7 @@ class CoreAPIJSONOpenAPIRenderer(_BaseOpenAPIRenderer):
 
 
 class OpenAPIRenderer(BaseRenderer):
+    stateless = True
     media_type = 'application/vnd.oai.openapi'
     charset = None
     format = 'openapi'
@@ -1068,6 +1117,7 @@ class OpenAPIRenderer(BaseRenderer):
 
 
 class JSONOpenAPIRenderer(BaseRenderer):
+    stateless = True
     media_type = 'application/vnd.oai.openapi+json'
     charset = None
     encoder_class = encoders.JSONEncoder
@@ -20,6 +20,7 @@ from django.utils.datastructures import MultiValueDict
 from rest_framework import exceptions
 from rest_framework.compat import parse_header_parameters
 from rest_framework.settings import api_settings
+from rest_framework.timing import NULL_TIMER
 
 
 def is_form_media_type(media_type):
@@ -136,6 +137,9 @@ class ForcedAuthentication:
     def authenticate(self, request):
         return (self.force_user, self.force_token)
 
+    async def aauthenticate(self, request):
+        return self.authenticate(request)
+
 
 class Request:
     """
@@ -148,6 +152,8 @@ class Request:
         - authenticators(list/tuple). The authenticators used to try
           authenticating the request's user.
     """
+    # Replaced with a `RequestTimer` by views that have timing enabled.
+    timer = NULL_TIMER
 
     def __init__(self, request, parsers=None, authenticators=None,
                  negotiator=None, parser_context=None):
@@ -231,6 +237,16 @@ class Request:
                 self._authenticate()
         return self._user
 
+    async def auser(self):
+        """
+        Async version of `.user`, for use in async views. The request is
+        authenticated with each authenticator's `.aauthenticate()` method.
+        """
+        if not hasattr(self, '_user'):
+            with wrap_attributeerrors():
+                await self._aauthenticate()
+        return self._user
+
     @user.setter
     def user(self, value):
         """
@@ -280,7 +296,8 @@ class Request:
         Parses the request content into `self.data`.
         """
         if not _hasattr(self, '_data'):
-            self._data, self._files = self._parse()
+            with self.timer.phase('parsing'):
+                self._data, self._files = self._parse()
             if self._files:
                 self._full_data = self._data.copy()
                 self._full_data.update(self._files)
@@ -393,6 +410,24 @@ class Request:
 
         self._not_authenticated()
 
+    async def _aauthenticate(self):
+        """
+        Async version of `._authenticate()`.
+        """
+        for authenticator in self.authenticators:
+            try:
+                user_auth_tuple = await authenticator.aauthenticate(self)
+            except exceptions.APIException:
+                self._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                self._authenticator = authenticator
+                self.user, self.auth = user_auth_tuple
+                return
+
+        self._not_authenticated()
+
     def _not_authenticated(self):
         """
         Set authenticator, user & authtoken representing an unauthenticated request.
@@ -9,6 +9,7 @@ from http.client import responses
 from django.template.response import SimpleTemplateResponse
 
 from rest_framework.serializers import Serializer
+from rest_framework.timing import get_timer
 
 
 class Response(SimpleTemplateResponse):
@@ -71,7 +72,8 @@ class Response(SimpleTemplateResponse):
             content_type = media_type
         self['Content-Type'] = content_type
 
-        ret = renderer.render(self.data, accepted_media_type, context)
+        with get_timer(context.get('request')).phase('rendering'):
+            ret = renderer.render(self.data, accepted_media_type, context)
         if isinstance(ret, str):
             assert charset, (
                 'renderer returned unicode, and did not specify '
@@ -1,7 +1,11 @@
 """
 Provide urlresolver functions that return fully qualified URLs or view names
 """
-from django.urls import NoReverseMatch
+import re
+import string
+import uuid
+
+from django.urls import NoReverseMatch, converters, get_resolver, get_urlconf
 from django.urls import reverse as django_reverse
 from django.utils.functional import lazy
 
@@ -64,3 +68,124 @@ def _reverse(viewname, args=None, kwargs=None, request=None, format=None, **extr
 
 
 reverse_lazy = lazy(reverse, str)
+
+
+# Characters that are never quoted in URLs, so that a value made up of these
+# characters is included in a reversed URL unchanged.
+UNRESERVED_CHARACTERS = frozenset(string.ascii_letters + string.digits + '-._~')
+
+
+def get_template_key(value):
+    """
+    Returns a key for the lookup values that can share a URL template with
+    `value`, or `None` if URLs for the value should always be reversed.
+
+    Values share a template if they have the same type and length, and use
+    the same kinds of characters, so that they match the same URL patterns.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, str, uuid.UUID)):
+        return None
+    text = str(value)
+    if not text or not UNRESERVED_CHARACTERS.issuperset(text):
+        return None
+    kinds = frozenset(
+        '0' if char.isdigit() else 'a' if char.islower() else 'A' if char.isupper() else char
+        for char in text
+    )
+    return (type(value), len(text), kinds)
+
+
+# The URL converters that include a value in the URL as `str(value)`, so that
+# a URL template can be used for any value that matches their regex.
+TEMPLATE_CONVERTERS = (
+    converters.IntConverter, converters.StringConverter, converters.SlugConverter,
+    converters.UUIDConverter, converters.PathConverter,
+)
+
+
+def get_lookup_regexes(viewname, lookup_url_kwarg):
+    """
+    Returns the compiled regexes of the converters for `lookup_url_kwarg` in
+    the URL patterns named `viewname`, or `None` if URLs for the view should
+    always be reversed, such as for regex groups or custom converters.
+    """
+    resolver = get_resolver(get_urlconf())
+    *namespaces, name = viewname.split(':')
+    for namespace in namespaces:
+        app_list = resolver.app_dict.get(namespace)
+        if app_list and namespace not in app_list:
+            namespace = app_list[0]
+        try:
+            resolver = resolver.namespace_dict[namespace][1]
+        except KeyError:
+            return None
+
+    regexes = set()
+    for possibilities, pattern, defaults, url_converters in resolver.reverse_dict.getlist(name):
+        if not any(lookup_url_kwarg in params for result, params in possibilities):
+            continue
+        converter = url_converters.get(lookup_url_kwarg)
+        if type(converter) not in TEMPLATE_CONVERTERS:
+            return None
+        regexes.add(converter.regex)
+    return [re.compile(regex) for regex in regexes] or None
+
+
+class URLTemplates:
+    """
+    Builds the URLs for a view that takes a single lookup keyword argument,
+    using string formatting instead of calling `reverse()` for each URL.
+
+    The URL for the first value of each kind is reversed, and split around
+    the value to give a template. The template is used once it has given the
+    same URL as `reverse()` for a second value. As the URLs depend on the
+    request, through the versioning scheme and the host, the templates
+    should only be used for a single request.
+
+    Templates are only used for lookup arguments that are captured by the
+    built-in `int`, `str`, `slug`, `uuid` and `path` converters, and for
+    values that match the converter's regex, so that a template never gives
+    a URL that `reverse()` would reject.
+    """
+    def __init__(self, request=None, reverse=reverse):
+        self.request = request
+        self.reverse = reverse
+        self.templates = {}
+        self.regexes = {}
+
+    def get_regexes(self, viewname, lookup_url_kwarg):
+        try:
+            return self.regexes[viewname, lookup_url_kwarg]
+        except KeyError:
+            regexes = get_lookup_regexes(viewname, lookup_url_kwarg)
+            self.regexes[viewname, lookup_url_kwarg] = regexes
+            return regexes
+
+    def get_url(self, viewname, lookup_url_kwarg, lookup_value, format=None):
+        key = get_template_key(lookup_value)
+        text = str(lookup_value)
+        if key is not None:
+            # Values the URL pattern wouldn't accept are left to `reverse()`.
+            regexes = self.get_regexes(viewname, lookup_url_kwarg)
+            if regexes is None or not all(regex.fullmatch(text) for regex in regexes):
+                key = None
+        if key is not None:
+            key = (viewname, lookup_url_kwarg, format) + key
+            template = self.templates.get(key)
+            if template is not None and template[2]:
+                return template[0] + text + template[1]
+
+        url = self.reverse(
+            viewname, kwargs={lookup_url_kwarg: lookup_value}, request=self.request, format=format
+        )
+        if key is None or template is False:
+            return url
+
+        if template is not None:
+            # Only use the template once it has been checked against `reverse()`.
+            confirmed = template[0] + text + template[1] == url
+            self.templates[key] = (template[0], template[1], True) if confirmed else False
+        elif url.count(text) == 1:
+            prefix, suffix = url.split(text)
+            self.templates[key] = (prefix, suffix, False)
+        return url
@@ -20,6 +20,7 @@ from django.core.exceptions import ImproperlyConfigured
 from django.urls import NoReverseMatch, path, re_path
 
 from rest_framework import views
+from rest_framework.batch import BatchView
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from rest_framework.schemas import SchemaGenerator
@@ -347,10 +348,13 @@ class DefaultRouter(SimpleRouter):
     API root view, and adds format suffix patterns to the URLs.
     """
     include_root_view = True
+    include_batch_view = False
     include_format_suffixes = True
     root_view_name = 'api-root'
+    batch_view_name = 'api-batch'
     default_schema_renderers = None
     APIRootView = APIRootView
+    BatchView = BatchView
     APISchemaView = SchemaView
     SchemaGenerator = SchemaGenerator
 
@@ -372,6 +376,12 @@ class DefaultRouter(SimpleRouter):
 
         return self.APIRootView.as_view(api_root_dict=api_root_dict)
 
+    def get_batch_view(self):
+        """
+        Return a view that runs a list of API requests in a single request.
+        """
+        return self.BatchView.as_view()
+
     def get_urls(self):
         """
         Generate the list of URL patterns, including a default root view
@@ -384,6 +394,17 @@ class DefaultRouter(SimpleRouter):
             root_url = path('', view, name=self.root_view_name)
             urls.append(root_url)
 
+        if self.include_batch_view:
+            if any(prefix == 'batch' for prefix, viewset, basename in self.registry):
+                raise ImproperlyConfigured(
+                    'Cannot include the batch view, as a viewset is registered '
+                    'with the "batch" prefix. Set `include_batch_view = False`, '
+                    'or register the viewset with a different prefix.'
+                )
+            view = self.get_batch_view()
+            batch_url = path('batch' + self.trailing_slash, view, name=self.batch_view_name)
+            urls.append(batch_url)
+
         if self.include_format_suffixes:
             urls = format_suffix_patterns(urls)
 
@@ -14,13 +14,17 @@ response content is handled by parsers and renderers.
 import contextlib
 import copy
 import inspect
+import itertools
 import traceback
+import weakref
 from collections import defaultdict
 from collections.abc import Mapping
 
+from asgiref.sync import sync_to_async
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.db import models
+from django.core.signals import setting_changed
+from django.db import models, router, transaction
 from django.db.models.fields import Field as DjangoModelField
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -30,18 +34,19 @@ from rest_framework.compat import postgres_fields
 from rest_framework.exceptions import ErrorDetail, ValidationError
 from rest_framework.fields import get_error_detail
 from rest_framework.settings import api_settings
+from rest_framework.timing import get_timer
 from rest_framework.utils import html, model_meta, representation
 from rest_framework.utils.field_mapping import (
     ClassLookupDict, get_field_kwargs, get_nested_relation_kwargs,
     get_relation_kwargs, get_url_kwargs
 )
 from rest_framework.utils.serializer_helpers import (
-    BindingDict, BoundField, JSONBoundField, NestedBoundField, ReturnDict,
-    ReturnList
+    BatchLoader, BindingDict, BoundField, JSONBoundField, NestedBoundField,
+    ReturnDict, ReturnList, ValuesRow
 )
 from rest_framework.validators import (
     UniqueForDateValidator, UniqueForMonthValidator, UniqueForYearValidator,
-    UniqueTogetherValidator
+    UniquenessBatch, UniqueTogetherValidator
 )
 
 # Note: We do the following so that users of the framework can use this style:
@@ -51,8 +56,9 @@ from rest_framework.validators import (
 # This helps keep the separation between model fields, form fields, and
 # serializer fields more explicit.
 from rest_framework.fields import (  # NOQA # isort:skip
-    BooleanField, CharField, ChoiceField, DateField, DateTimeField, DecimalField,
-    DictField, DurationField, EmailField, Field, FileField, FilePathField, FloatField,
+    BatchedSerializerMethodField, BooleanField, CharField, ChoiceField, DateField,
+    DateTimeField, DecimalField, DictField, DurationField, EmailField, Field,
+    FileField, FilePathField, FloatField,
     HiddenField, HStoreField, IPAddressField, ImageField, IntegerField, JSONField,
     ListField, ModelField, MultipleChoiceField, ReadOnlyField,
     RegexField, SerializerMethodField, SlugField, TimeField, URLField, UUIDField,
@@ -74,11 +80,35 @@ LIST_SERIALIZER_KWARGS = (
     'read_only', 'write_only', 'required', 'default', 'initial', 'source',
     'label', 'help_text', 'style', 'error_messages', 'allow_empty',
     'instance', 'data', 'partial', 'context', 'allow_null',
-    'max_length', 'min_length'
+    'max_length', 'min_length', 'lookup_field', 'allow_create', 'allow_delete',
+    'batch_relations', 'chunk_size'
 )
 
 ALL_FIELDS = '__all__'
 
+# The `ModelSerializer` methods that determine which fields get built from
+# the model. Serializer classes that override any of these outside of this
+# module may depend on instance state, and are never cached.
+MODEL_FIELD_BUILDERS = (
+    'build_fields', 'get_field_names', 'get_default_field_names', 'build_field',
+    'build_standard_field', 'build_relational_field', 'build_nested_field',
+    'build_property_field', 'build_url_field', 'build_unknown_field',
+    'include_extra_kwargs', 'get_extra_kwargs', 'get_unique_together_constraints',
+    'get_uniqueness_extra_kwargs', '_get_model_fields',
+)
+
+# Unbound field prototypes built by `ModelSerializer.get_fields()`, keyed by
+# serializer class and then by url field name. Classes that cannot be cached
+# map to `None`.
+_model_fields_cache = weakref.WeakKeyDictionary()
+
+
+def clear_model_fields_cache(*args, **kwargs):
+    _model_fields_cache.clear()
+
+
+setting_changed.connect(clear_model_fields_cache)
+
 
 # BaseSerializer
 # --------------
@@ -148,6 +178,11 @@ class BaseSerializer(Field):
         allow_empty = kwargs.pop('allow_empty', None)
         max_length = kwargs.pop('max_length', None)
         min_length = kwargs.pop('min_length', None)
+        update_kwargs = {
+            key: kwargs.pop(key)
+            for key in ('lookup_field', 'allow_create', 'allow_delete', 'batch_relations', 'chunk_size')
+            if key in kwargs
+        }
         child_serializer = cls(*args, **kwargs)
         list_kwargs = {
             'child': child_serializer,
@@ -158,6 +193,7 @@ class BaseSerializer(Field):
             list_kwargs['max_length'] = max_length
         if min_length is not None:
             list_kwargs['min_length'] = min_length
+        list_kwargs.update(update_kwargs)
         list_kwargs.update({
             key: value for key, value in kwargs.items()
             if key in LIST_SERIALIZER_KWARGS
@@ -238,6 +274,24 @@ class BaseSerializer(Field):
 
         return not bool(self._errors)
 
+    # Async versions of the serializer API, for use in async views.
+    # Validation, saving and serialization may all query the database,
+    # including through lazily loaded relations, so each one is run with
+    # a single hop to a thread.
+
+    async def ais_valid(self, *, raise_exception=False):
+        return await sync_to_async(self.is_valid)(raise_exception=raise_exception)
+
+    async def asave(self, **kwargs):
+        return await sync_to_async(self.save)(**kwargs)
+
+    @property
+    def adata(self):
+        """
+        Awaitable version of `.data`, eg. `await serializer.adata`.
+        """
+        return sync_to_async(getattr)(self, 'data')
+
     @property
     def data(self):
         if hasattr(self, 'initial_data') and not hasattr(self, '_validated_data'):
@@ -251,12 +305,13 @@ class BaseSerializer(Field):
             raise AssertionError(msg)
 
         if not hasattr(self, '_data'):
-            if self.instance is not None and not getattr(self, '_errors', None):
-                self._data = self.to_representation(self.instance)
-            elif hasattr(self, '_validated_data') and not getattr(self, '_errors', None):
-                self._data = self.to_representation(self.validated_data)
-            else:
-                self._data = self.get_initial()
+            with get_timer(self.context.get('request')).phase('serialization'):
+                if self.instance is not None and not getattr(self, '_errors', None):
+                    self._data = self.to_representation(self.instance)
+                elif hasattr(self, '_validated_data') and not getattr(self, '_errors', None):
+                    self._data = self.to_representation(self.validated_data)
+                else:
+                    self._data = self.get_initial()
         return self._data
 
     @property
@@ -391,6 +446,29 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
             if not field.write_only:
                 yield field
 
+    def get_read_plan(self):
+        """
+        Returns a list of `(field_name, get_attribute, to_representation)`
+        tuples for the readable fields, used by `.to_representation()`.
+
+        The plan is built once for the bound set of fields, so that
+        serializing many instances does not repeatedly walk `.fields`,
+        check `write_only`, and look up the field methods.
+
+        Note that the plan is cached on the serializer's own `.fields`, not
+        on the class, since it holds the methods of this instance's copies
+        of the fields. A `many=True` serializer shares a single plan across
+        all of the items in the list, but each new serializer instance
+        builds its own plan the first time it serializes an object.
+        """
+        fields = self.fields
+        if fields.read_plan is None:
+            fields.read_plan = [
+                (field.field_name, field.get_attribute, field.to_representation)
+                for field in self._readable_fields
+            ]
+        return fields.read_plan
+
     def get_fields(self):
         """
         Returns a dictionary of {field_name: field_instance}.
@@ -524,11 +602,10 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
         Object instance -> Dict of primitive datatypes.
         """
         ret = {}
-        fields = self._readable_fields
 
-        for field in fields:
+        for field_name, get_attribute, to_representation in self.get_read_plan():
             try:
-                attribute = field.get_attribute(instance)
+                attribute = get_attribute(instance)
             except SkipField:
                 continue
 
@@ -539,9 +616,9 @@ class Serializer(BaseSerializer, metaclass=SerializerMetaclass):
             # resolve the pk value.
             check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
             if check_for_none is None:
-                ret[field.field_name] = None
+                ret[field_name] = None
             else:
-                ret[field.field_name] = field.to_representation(attribute)
+                ret[field_name] = to_representation(attribute)
 
         return ret
 
@@ -595,24 +672,45 @@ class ListSerializer(BaseSerializer):
     child = None
     many = True
 
+    # Multiple updates match each item to an instance by this field.
+    lookup_field = 'id'
+    # Whether items that don't match an instance are created, and whether
+    # instances that don't match an item are deleted, on multiple updates.
+    allow_create = False
+    allow_delete = False
+    # Whether related objects are looked up for all of the items at once.
+    batch_relations = False
+    # If set, `.save()` validates and creates the items this many at a time.
+    chunk_size = None
+
     default_error_messages = {
         'not_a_list': _('Expected a list of items but got type "{input_type}".'),
         'empty': _('This list may not be empty.'),
         'max_length': _('Ensure this field has no more than {max_length} elements.'),
-        'min_length': _('Ensure this field has at least {min_length} elements.')
+        'min_length': _('Ensure this field has at least {min_length} elements.'),
+        'does_not_exist': _('Object with {lookup_field}={value} does not exist.'),
+        'duplicate': _('Object with {lookup_field}={value} is included more than once.'),
     }
 
     def __init__(self, *args, **kwargs):
-        self.child = kwargs.pop('child', copy.deepcopy(self.child))
+        if 'child' in kwargs:
+            self.child = kwargs.pop('child')
+        else:
+            self.child = copy.deepcopy(self.child)
         self.allow_empty = kwargs.pop('allow_empty', True)
         self.max_length = kwargs.pop('max_length', None)
         self.min_length = kwargs.pop('min_length', None)
+        self.lookup_field = kwargs.pop('lookup_field', self.lookup_field)
+        self.allow_create = kwargs.pop('allow_create', self.allow_create)
+        self.allow_delete = kwargs.pop('allow_delete', self.allow_delete)
+        self.batch_relations = kwargs.pop('batch_relations', self.batch_relations)
+        self.chunk_size = kwargs.pop('chunk_size', self.chunk_size)
         assert self.child is not None, '`child` is a required argument.'
         assert not inspect.isclass(self.child), '`child` has not been instantiated.'
 
         instance = kwargs.get('instance', [])
         data = kwargs.get('data', [])
-        if instance and data:
+        if instance and data and not self.uses_lookup(data):
             assert len(data) == len(instance), 'Data and instance should have same length'
 
         super().__init__(*args, **kwargs)
@@ -668,24 +766,75 @@ class ListSerializer(BaseSerializer):
                 api_settings.NON_FIELD_ERRORS_KEY: [message]
             }, code='not_a_list')
 
-        if not self.allow_empty and len(data) == 0:
+        # The length of the whole list is checked by `.save_chunks()` when
+        # validating a chunk of it.
+        if self.chunk_size is None:
+            self.run_length_checks(len(data))
+
+        self._matched_instances = None
+        # Uniqueness validators defer their checks to the batch, so that
+        # they run one query for all of the items.
+        self._uniqueness_batch = UniquenessBatch()
+        try:
+            with self.resolving_relations(data):
+                if getattr(self, 'instance', None) is not None and self.uses_lookup(data):
+                    return self.to_internal_value_by_lookup(data)
+                return self.to_internal_value_by_position(data)
+        finally:
+            self._uniqueness_batch = None
+
+    def run_length_checks(self, length):
+        if not self.allow_empty and length == 0:
             message = self.error_messages['empty']
             raise ValidationError({
                 api_settings.NON_FIELD_ERRORS_KEY: [message]
             }, code='empty')
 
-        if self.max_length is not None and len(data) > self.max_length:
+        if self.max_length is not None and length > self.max_length:
             message = self.error_messages['max_length'].format(max_length=self.max_length)
             raise ValidationError({
                 api_settings.NON_FIELD_ERRORS_KEY: [message]
             }, code='max_length')
 
-        if self.min_length is not None and len(data) < self.min_length:
+        if self.min_length is not None and length < self.min_length:
             message = self.error_messages['min_length'].format(min_length=self.min_length)
             raise ValidationError({
                 api_settings.NON_FIELD_ERRORS_KEY: [message]
             }, code='min_length')
 
+    @contextlib.contextmanager
+    def resolving_relations(self, data):
+        """
+        If `batch_relations` is set, look up the related objects for each
+        relational field of the child with one query for all of the items,
+        rather than one query for each item.
+        """
+        if not self.batch_relations or not hasattr(self.child, 'fields'):
+            yield
+            return
+
+        with contextlib.ExitStack() as stack:
+            for field in self.child._writable_fields:
+                relation = field.child_relation if isinstance(field, ManyRelatedField) else field
+                if not isinstance(relation, RelatedField) or relation.get_lookup_field() is None:
+                    continue
+                values = []
+                for item in data:
+                    if not isinstance(item, Mapping):
+                        continue
+                    value = field.get_value(item)
+                    if isinstance(field, ManyRelatedField):
+                        if isinstance(value, (list, tuple)):
+                            values.extend(value)
+                    elif value not in (empty, None, ''):
+                        values.append(value)
+                stack.enter_context(relation.resolving(values))
+            yield
+
+    def to_internal_value_by_position(self, data):
+        """
+        Validate each item against the instance at the same position, if any.
+        """
         ret = []
         errors = []
 
@@ -697,13 +846,101 @@ class ListSerializer(BaseSerializer):
             ):
                 self.child.instance = self.instance[idx]
             try:
-                validated = self.child.run_validation(item)
+                validated = self.run_child_validation(item, len(errors))
             except ValidationError as exc:
                 errors.append(exc.detail)
             else:
                 ret.append(validated)
                 errors.append({})
 
+        self.run_uniqueness_checks(errors)
+        if any(errors):
+            raise ValidationError(errors)
+
+        return ret
+
+    def run_child_validation(self, data, index):
+        """
+        Validate a single item, which is at `index` in the list of errors.
+        """
+        batch = getattr(self, '_uniqueness_batch', None)
+        if batch is not None:
+            batch.index = index
+        return self.child.run_validation(data)
+
+    def run_uniqueness_checks(self, errors):
+        """
+        Run the uniqueness checks deferred while validating the items, adding
+        any errors to the errors of each item.
+        """
+        batch = getattr(self, '_uniqueness_batch', None)
+        if batch is not None:
+            batch.apply(errors)
+
+    def uses_lookup(self, data):
+        """
+        Returns `True` if the items of the input data are matched to
+        instances by `lookup_field`, rather than by their position. This is
+        the case if any of the items includes a value for the field.
+        """
+        return (
+            self.lookup_field is not None and isinstance(data, list) and
+            any(isinstance(item, Mapping) and item.get(self.lookup_field) is not None for item in data)
+        )
+
+    def get_lookup_value(self, instance):
+        """
+        Returns the value of `lookup_field` for an instance.
+        """
+        field = self.child.fields.get(self.lookup_field) if hasattr(self.child, 'fields') else None
+        if field is not None:
+            return field.get_attribute(instance)
+        if isinstance(instance, Mapping):
+            return instance[self.lookup_field]
+        return getattr(instance, self.lookup_field)
+
+    def get_lookup_error(self, key, value):
+        message = self.error_messages[key].format(lookup_field=self.lookup_field, value=value)
+        return {self.lookup_field: [ErrorDetail(message, code=key)]}
+
+    def to_internal_value_by_lookup(self, data):
+        """
+        Validate each item against the instance with the same `lookup_field`
+        value, using a dictionary of instances keyed by that value.
+        """
+        # Values are compared as strings, as the input data may not have
+        # the same types as the instance attributes.
+        instances = {str(self.get_lookup_value(obj)): obj for obj in self.instance}
+        matched = set()
+
+        ret = []
+        errors = []
+        self._matched_instances = []
+
+        for item in data:
+            value = item.get(self.lookup_field) if isinstance(item, Mapping) else None
+            instance = None if value is None else instances.get(str(value))
+            if value is not None and str(value) in matched:
+                errors.append(self.get_lookup_error('duplicate', value))
+                continue
+            if instance is None and not self.allow_create:
+                errors.append(self.get_lookup_error('does_not_exist', value))
+                continue
+            if value is not None:
+                matched.add(str(value))
+
+            self.child.instance = instance
+            try:
+                validated = self.run_child_validation(item, len(errors))
+            except ValidationError as exc:
+                errors.append(exc.detail)
+            else:
+                ret.append(validated)
+                errors.append({})
+                self._matched_instances.append(instance)
+        self.child.instance = None
+
+        self.run_uniqueness_checks(errors)
         if any(errors):
             raise ValidationError(errors)
 
@@ -716,24 +953,131 @@ class ListSerializer(BaseSerializer):
         # Dealing with nested relationships, data can be a Manager,
         # so, first get a queryset from the Manager if needed
         iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        if isinstance(iterable, models.QuerySet) and hasattr(self.child, 'get_values_plan'):
+            values_plan = self.child.get_values_plan()
+            if values_plan is not None:
+                iterable = values_plan.apply(iterable)
+        to_representation = self.child.to_representation
+
+        if not self.has_batched_fields():
+            return [
+                to_representation(item) for item in iterable
+            ]
+
+        # Batched fields are filled in by the outermost list, once all of
+        # the objects at each depth have been collected.
+        loader = self.get_batch_loader()
+        if loader is None:
+            loader = self._batch_loader = BatchLoader()
+            try:
+                ret = self._batched_to_representation(iterable, loader)
+                loader.resolve()
+            finally:
+                loader.clear()
+                del self._batch_loader
+            return ret
+        return self._batched_to_representation(iterable, loader)
+
+    def _batched_to_representation(self, iterable, loader):
+        # Batched fields of the child, and of any single serializers nested
+        # within it, along with the nested serializer fields leading to them.
+        fields = list(_get_batched_fields(self.child))
+        for path, field in fields:
+            loader.defer(field)
+        ret = [self.child.to_representation(item) for item in iterable]
+        for path, field in fields:
+            rets = ret
+            for serializer_field in path:
+                rets = _get_nested_representations(serializer_field, rets)
+            loader.add(field, rets)
+        return ret
 
-        return [
-            self.child.to_representation(item) for item in iterable
-        ]
+    def has_batched_fields(self):
+        """
+        Returns `True` if the child, or any serializer nested within it,
+        has a `BatchedSerializerMethodField`.
+        """
+        if '_has_batched_fields' not in self.__dict__:
+            self._has_batched_fields = _has_batched_fields(self.child)
+        return self._has_batched_fields
+
+    def get_batch_loader(self):
+        """
+        Returns the `BatchLoader` of the outermost list being serialized,
+        or `None` if this is the outermost list.
+        """
+        parent = self.parent
+        while parent is not None:
+            loader = getattr(parent, '_batch_loader', None)
+            if loader is not None:
+                return loader
+            parent = parent.parent
+        return None
 
     def validate(self, attrs):
         return attrs
 
     def update(self, instance, validated_data):
-        raise NotImplementedError(
-            "Serializers with many=True do not support multiple update by "
-            "default, only multiple create. For updates it is unclear how to "
-            "deal with insertions and deletions. If you need to support "
-            "multiple update, use a `ListSerializer` class and override "
-            "`.update()` so you can specify the behavior exactly."
-        )
+        """
+        Update the instances matched to each item by `lookup_field` during
+        validation, creating and deleting instances if `allow_create` and
+        `allow_delete` are set. Returns the instances in the order of the data.
+        """
+        matched_instances = getattr(self, '_matched_instances', None)
+        if matched_instances is None:
+            raise NotImplementedError(
+                "Serializers with many=True only support multiple update when "
+                "the items include the `lookup_field` (`%s`) used to match them "
+                "to instances. If you need to support multiple update "
+                "otherwise, use a `ListSerializer` class and override "
+                "`.update()` so you can specify the behavior exactly." % self.lookup_field
+            )
+
+        updates = [
+            (obj, attrs) for obj, attrs in zip(matched_instances, validated_data)
+            if obj is not None
+        ]
+        creates = [
+            attrs for obj, attrs in zip(matched_instances, validated_data)
+            if obj is None
+        ]
+
+        # The updates, creates and deletes are applied in one transaction, so
+        # that the list is never left partly updated.
+        model = getattr(getattr(self.child, 'Meta', None), 'model', None)
+        using = router.db_for_write(model) if model is not None else None
+        with transaction.atomic(using=using):
+            if getattr(self.child, 'can_bulk_update', None) and self.child.can_bulk_update():
+                updated = self.child.bulk_update(updates)
+            else:
+                updated = [self.child.update(obj, attrs) for obj, attrs in updates]
+            created = self.create(creates) if creates else []
+
+            if self.allow_delete:
+                kept = {id(obj) for obj in matched_instances}
+                self.delete([obj for obj in instance if id(obj) not in kept])
+
+        updated, created = iter(updated), iter(created)
+        return [
+            next(updated) if obj is not None else next(created)
+            for obj in matched_instances
+        ]
+
+    def delete(self, instances):
+        """
+        Delete the instances that weren't matched by any item, when
+        `allow_delete` is set.
+        """
+        model = getattr(getattr(self.child, 'Meta', None), 'model', None)
+        if model is not None and all(isinstance(obj, model) for obj in instances):
+            model._default_manager.filter(pk__in=[obj.pk for obj in instances]).delete()
+            return
+        for obj in instances:
+            obj.delete()
 
     def create(self, validated_data):
+        if getattr(self.child, 'can_bulk_create', None) and self.child.can_bulk_create():
+            return self.child.bulk_create(validated_data)
         return [
             self.child.create(attrs) for attrs in validated_data
         ]
@@ -752,6 +1096,9 @@ class ListSerializer(BaseSerializer):
             "For example: 'serializer.save(owner=request.user)'.'"
         )
 
+        if self.chunk_size is not None:
+            return self.save_chunks(**kwargs)
+
         validated_data = [
             {**attrs, **kwargs} for attrs in self.validated_data
         ]
@@ -769,6 +1116,53 @@ class ListSerializer(BaseSerializer):
 
         return self.instance
 
+    def save_chunks(self, **kwargs):
+        """
+        Validate and create the items `chunk_size` at a time, so that only one
+        chunk of the input data is held in memory. The chunks are saved in one
+        transaction, and none of them are saved if any of the items are
+        invalid. The saved instances aren't kept, and an empty list is
+        returned.
+        """
+        assert self.instance is None, (
+            'Serializers with many=True and `chunk_size` set only support '
+            'creating instances.'
+        )
+        assert hasattr(self, '_errors'), (
+            'You must call `.is_valid()` before calling `.save()`.'
+        )
+        assert not self.errors, (
+            'You cannot call `.save()` on a serializer with invalid data.'
+        )
+
+        model = getattr(getattr(self.child, 'Meta', None), 'model', None)
+        using = router.db_for_write(model) if model is not None else None
+        data = iter(self.initial_data)
+        count = 0
+        with transaction.atomic(using=using):
+            for chunk in iter(lambda: list(itertools.islice(data, self.chunk_size)), []):
+                count += len(chunk)
+                if self.max_length is not None and count > self.max_length:
+                    self.run_length_checks(count)
+                try:
+                    validated_data = self.run_validation(chunk)
+                except ValidationError as exc:
+                    raise ValidationError(self.get_chunk_errors(exc.detail, count - len(chunk)))
+                self.create([{**attrs, **kwargs} for attrs in validated_data])
+            self.run_length_checks(count)
+
+        self.instance = []
+        return self.instance
+
+    def get_chunk_errors(self, errors, start):
+        """
+        Returns the errors for the items of a chunk as a dictionary keyed by
+        the index of each invalid item in the whole list.
+        """
+        if not isinstance(errors, list):
+            return errors
+        return {start + idx: detail for idx, detail in enumerate(errors) if detail}
+
     def is_valid(self, *, raise_exception=False):
         # This implementation is the same as the default,
         # except that we use lists, rather than dicts, as the empty case.
@@ -779,7 +1173,12 @@ class ListSerializer(BaseSerializer):
 
         if not hasattr(self, '_validated_data'):
             try:
-                self._validated_data = self.run_validation(self.initial_data)
+                if self.chunk_size is not None:
+                    # The items are validated as they are saved.
+                    self.validate_chunked_data(self.initial_data)
+                    self._validated_data = []
+                else:
+                    self._validated_data = self.run_validation(self.initial_data)
             except ValidationError as exc:
                 self._validated_data = []
                 self._errors = exc.detail
@@ -791,6 +1190,21 @@ class ListSerializer(BaseSerializer):
 
         return not bool(self._errors)
 
+    def validate_chunked_data(self, data):
+        """
+        Check that data to be saved in chunks is a list or other iterable of
+        items, without reading the items.
+        """
+        if data is None:
+            self.fail('null')
+        if isinstance(data, (str, bytes, Mapping)) or not hasattr(data, '__iter__'):
+            message = self.error_messages['not_a_list'].format(
+                input_type=type(data).__name__
+            )
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [message]
+            }, code='not_a_list')
+
     def __repr__(self):
         return representation.list_repr(self, indent=1)
 
@@ -815,6 +1229,44 @@ class ListSerializer(BaseSerializer):
         return ReturnList(ret, serializer=self)
 
 
+def _has_batched_fields(serializer):
+    if not isinstance(serializer, Serializer):
+        return False
+    for field in serializer._readable_fields:
+        if isinstance(field, BatchedSerializerMethodField):
+            return True
+        if isinstance(field, ListSerializer):
+            field = field.child
+        if isinstance(field, Serializer) and _has_batched_fields(field):
+            return True
+    return False
+
+
+def _get_batched_fields(serializer, path=()):
+    """
+    Yields a `(path, field)` pair for each batched field of the serializer,
+    or of the single serializers nested within it, where `path` is the tuple
+    of nested serializer fields that leads to the field. Nested lists batch
+    their own fields.
+    """
+    for field in serializer._readable_fields:
+        if isinstance(field, BatchedSerializerMethodField):
+            yield path, field
+        elif isinstance(field, Serializer):
+            yield from _get_batched_fields(field, path + (field,))
+
+
+def _get_nested_representations(field, rets):
+    """
+    Given a nested serializer field, and the representations of its parents,
+    returns the representations of the nested objects.
+    """
+    return [
+        ret[field.field_name] for ret in rets
+        if isinstance(ret, dict) and isinstance(ret.get(field.field_name), dict)
+    ]
+
+
 # ModelSerializer & HyperlinkedModelSerializer
 # --------------------------------------------
 
@@ -1022,6 +1474,115 @@ class ModelSerializer(Serializer):
 
         return instance
 
+    def can_bulk_create(self):
+        """
+        Returns `True` if `ListSerializer.create()` should use `.bulk_create()`
+        rather than calling `.create()` for each item.
+
+        This requires `bulk_create = True` on the `Meta` class, the default
+        `.create()` implementation, and a model and database that support
+        setting the primary keys of bulk created instances.
+        """
+        if not getattr(self.Meta, 'bulk_create', False):
+            return False
+        if type(self).create is not ModelSerializer.create:
+            return False
+        ModelClass = self.Meta.model
+        opts = ModelClass._meta
+        if any(
+            parent._meta.concrete_model is not opts.concrete_model
+            for parent in opts.get_parent_list()
+        ):
+            # Multi-table inherited models can't be bulk created.
+            return False
+        connection = transaction.get_connection(router.db_for_write(ModelClass))
+        return connection.features.can_return_rows_from_bulk_insert
+
+    def bulk_create(self, validated_data):
+        """
+        Create the instances for a list of validated data with `.bulk_create()`,
+        in batches of `batch_size` set on the `Meta` class.
+
+        Many to many relationships are then set for all of the instances
+        together, by bulk creating the rows of their through tables. Note
+        that the model's `.save()` method is not called, and that neither
+        `pre_save`/`post_save` nor `m2m_changed` signals are sent.
+        """
+        ModelClass = self.Meta.model
+        info = model_meta.get_field_info(ModelClass)
+        batch_size = getattr(self.Meta, 'batch_size', None)
+
+        instances = []
+        many_to_many = []
+        for attrs in validated_data:
+            raise_errors_on_nested_writes('create', self, attrs)
+            attrs = dict(attrs)
+            many_to_many.append({
+                field_name: attrs.pop(field_name)
+                for field_name, relation_info in info.relations.items()
+                if relation_info.to_many and field_name in attrs
+            })
+            try:
+                instances.append(ModelClass(**attrs))
+            except TypeError:
+                tb = traceback.format_exc()
+                msg = (
+                    'Got a `TypeError` when instantiating `%s`. '
+                    'This may be because you have a writable field on the '
+                    'serializer class that is not a valid argument to '
+                    '`%s()`. You may need to make the field read-only, or '
+                    'override the %s.create() method to handle this '
+                    'correctly.\nOriginal exception was:\n %s' %
+                    (
+                        ModelClass.__name__,
+                        ModelClass.__name__,
+                        self.__class__.__name__,
+                        tb
+                    )
+                )
+                raise TypeError(msg)
+
+        with transaction.atomic(using=router.db_for_write(ModelClass)):
+            ModelClass._default_manager.bulk_create(instances, batch_size=batch_size)
+            self.bulk_set_many_to_many(instances, many_to_many, batch_size)
+        return instances
+
+    def bulk_set_many_to_many(self, instances, many_to_many, batch_size=None):
+        """
+        Set the many to many relationships of newly created instances, given
+        a list of `{field_name: value}` dicts in the same order.
+
+        Relationships with an auto-created through table are set with one
+        `.bulk_create()` per field, including the mirrored rows of symmetrical
+        relationships. Any other to-many relationship is set with the related
+        manager of each instance.
+        """
+        through_rows = {}
+        for instance, relations in zip(instances, many_to_many):
+            for field_name, value in relations.items():
+                manager = getattr(instance, field_name)
+                through = getattr(manager, 'through', None)
+                if through is None or not through._meta.auto_created:
+                    manager.set(value)
+                    continue
+                source = through._meta.get_field(manager.source_field_name).attname
+                target = through._meta.get_field(manager.target_field_name).attname
+                # Rows are keyed by their (source, target) pair, so that
+                # duplicates, and the mirrored rows of two new instances
+                # that are related to each other, are only created once.
+                rows = through_rows.setdefault(through, {})
+                for obj in value:
+                    pk = obj.pk if isinstance(obj, models.Model) else obj
+                    pairs = [(instance.pk, pk)]
+                    if manager.symmetrical:
+                        pairs.append((pk, instance.pk))
+                    for source_pk, target_pk in pairs:
+                        if (source_pk, target_pk) not in rows:
+                            rows[source_pk, target_pk] = through(**{source: source_pk, target: target_pk})
+
+        for through, rows in through_rows.items():
+            through._default_manager.bulk_create(list(rows.values()), batch_size=batch_size)
+
     def update(self, instance, validated_data):
         raise_errors_on_nested_writes('update', self, validated_data)
         info = model_meta.get_field_info(instance)
@@ -1048,6 +1609,93 @@ class ModelSerializer(Serializer):
 
         return instance
 
+    def can_bulk_update(self):
+        """
+        Returns `True` if `ListSerializer.update()` should use `.bulk_update()`
+        rather than calling `.update()` for each item.
+
+        This requires `bulk_update = True` on the `Meta` class, and the
+        default `.update()` implementation.
+        """
+        if not getattr(self.Meta, 'bulk_update', False):
+            return False
+        return type(self).update is ModelSerializer.update
+
+    def bulk_update(self, updates):
+        """
+        Given a list of `(instance, validated_data)` pairs, update the
+        instances with `.bulk_update()`, in batches of `batch_size` set on
+        the `Meta` class.
+
+        Only the instances and fields whose values changed are written.
+        Note that the model's `.save()` method is not called, and that no
+        `pre_save` or `post_save` signals are sent.
+        """
+        ModelClass = self.Meta.model
+        info = model_meta.get_field_info(ModelClass)
+        batch_size = getattr(self.Meta, 'batch_size', None)
+
+        changed_instances = []
+        changed_fields = []
+        m2m_fields = []
+        for instance, attrs in updates:
+            raise_errors_on_nested_writes('update', self, attrs)
+            changed = False
+            for attr, value in attrs.items():
+                if attr in info.relations and info.relations[attr].to_many:
+                    m2m_fields.append((instance, attr, value))
+                    continue
+                if attr in info.forward_relations:
+                    # Compare foreign keys by their column value, so that the
+                    # current related instances don't need to be fetched.
+                    model_field = info.forward_relations[attr].model_field
+                    current = getattr(instance, model_field.attname)
+                    new = None if value is None else getattr(value, model_field.target_field.attname)
+                else:
+                    current = getattr(instance, attr)
+                    new = value
+                if current != new:
+                    setattr(instance, attr, value)
+                    changed = True
+                    if attr not in changed_fields:
+                        changed_fields.append(attr)
+            if changed:
+                changed_instances.append(instance)
+
+        with transaction.atomic(using=router.db_for_write(ModelClass)):
+            if changed_instances:
+                ModelClass._default_manager.bulk_update(
+                    changed_instances, changed_fields, batch_size=batch_size
+                )
+            for instance, attr, value in m2m_fields:
+                getattr(instance, attr).set(value)
+
+        return [instance for instance, attrs in updates]
+
+    def to_representation(self, instance):
+        if isinstance(instance, ValuesRow):
+            return self.get_values_plan().to_representation(instance)
+        return super().to_representation(instance)
+
+    def get_values_plan(self):
+        """
+        Returns the `ValuesPlan` used to serialize rows of a `.values()`
+        queryset, or `None` if the serializer reads model instances.
+
+        Only serializers with `use_values = True` set on their `Meta` class
+        use a values plan, and only if all of their fields support it.
+        """
+        fields = self.fields
+        if fields.values_plan is None:
+            if getattr(self.Meta, 'use_values', False):
+                from rest_framework.utils.query_plan import get_values_plan
+                values_plan = get_values_plan(self, self.Meta.model)
+            else:
+                values_plan = None
+            # Cache unsupported plans as `False`, as `None` means not built.
+            fields.values_plan = values_plan or False
+        return fields.values_plan or None
+
     # Determine the fields to apply...
 
     def get_fields(self):
@@ -1073,7 +1721,35 @@ class ModelSerializer(Serializer):
                 'Cannot use ModelSerializer with Abstract Models.'
             )
 
-        declared_fields = copy.deepcopy(self._declared_fields)
+        # Building the fields from the model is costly, so we only do it
+        # once per serializer class, and hand each new serializer instance
+        # a clone of those fields.
+        class_cache = _model_fields_cache.setdefault(self.__class__, {})
+        try:
+            prototypes = class_cache[self.url_field_name]
+        except KeyError:
+            if self._can_cache_fields():
+                prototypes = self.build_fields(self._declared_fields)
+            else:
+                prototypes = None
+            class_cache[self.url_field_name] = prototypes
+
+        if prototypes is None:
+            return self.build_fields(copy.deepcopy(self._declared_fields))
+        return copy.deepcopy(prototypes)
+
+    @classmethod
+    def _can_cache_fields(cls):
+        return all(
+            getattr(cls, method_name).__module__ == __name__
+            for method_name in MODEL_FIELD_BUILDERS
+        )
+
+    def build_fields(self, declared_fields):
+        """
+        Return the dict of field names -> field instances built from the
+        model and the declared fields.
+        """
         model = getattr(self.Meta, 'model')
         depth = getattr(self.Meta, 'depth', 0)
 
@@ -48,6 +48,7 @@ DEFAULTS = {
     'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'rest_framework.negotiation.DefaultContentNegotiation',
     'DEFAULT_METADATA_CLASS': 'rest_framework.metadata.SimpleMetadata',
     'DEFAULT_VERSIONING_CLASS': None,
+    'DEFAULT_TIMING_COLLECTORS': [],
 
     # Generic view behavior
     'DEFAULT_PAGINATION_CLASS': None,
@@ -113,6 +114,7 @@ DEFAULTS = {
     'UNICODE_JSON': True,
     'COMPACT_JSON': True,
     'STRICT_JSON': True,
+    'JSON_BACKEND': 'rest_framework.json_backends.JSONBackend',
     'COERCE_DECIMAL_TO_STRING': True,
     'UPLOADED_FILES_USE_URL': True,
 
@@ -139,10 +141,12 @@ IMPORT_STRINGS = [
     'DEFAULT_CONTENT_NEGOTIATION_CLASS',
     'DEFAULT_METADATA_CLASS',
     'DEFAULT_VERSIONING_CLASS',
+    'DEFAULT_TIMING_COLLECTORS',
     'DEFAULT_PAGINATION_CLASS',
     'DEFAULT_FILTER_BACKENDS',
     'DEFAULT_SCHEMA_CLASS',
     'EXCEPTION_HANDLER',
+    'JSON_BACKEND',
     'TEST_REQUEST_RENDERER_CLASSES',
     'UNAUTHENTICATED_USER',
     'UNAUTHENTICATED_TOKEN',
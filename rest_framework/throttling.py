@@ -3,6 +3,7 @@ Provides various throttling policies.
 """
 import time
 
+from asgiref.sync import sync_to_async
 from django.core.cache import cache as default_cache
 from django.core.exceptions import ImproperlyConfigured
 
@@ -13,6 +14,7 @@ class BaseThrottle:
     """
     Rate throttling of requests.
     """
+    stateless = False
 
     def allow_request(self, request, view):
         """
@@ -20,6 +22,13 @@ class BaseThrottle:
         """
         raise NotImplementedError('.allow_request() must be overridden')
 
+    async def aallow_request(self, request, view):
+        """
+        Async version of `.allow_request()`, used by async views.
+        By default `.allow_request()` is run in a thread.
+        """
+        return await sync_to_async(self.allow_request)(request, view)
+
     def get_ident(self, request):
         """
         Identify the machine making the request by parsing HTTP_X_FORWARDED_FOR
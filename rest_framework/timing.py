@@ -0,0 +1,114 @@
+"""
+Timing of the phases of handling a request, such as authentication,
+permission checks, parsing, serialization and rendering.
+
+Timing is enabled for a view by setting its `timing_collectors`, or the
+`DEFAULT_TIMING_COLLECTORS` setting. Each collector is called with
+`(request, response, view)` once the response has been rendered, and can
+read the phase timings from `request.timer`.
+
+Database queries are not counted for async views. Their queries run in
+other threads through `sync_to_async()`, on connections that the phases
+of the request can't see.
+"""
+import time
+
+from django.db import connections
+
+
+class _NullPhase:
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class NullTimer:
+    """
+    The timer used when timing is disabled, which records nothing.
+    """
+    enabled = False
+    _phase = _NullPhase()
+
+    def phase(self, name):
+        return self._phase
+
+
+NULL_TIMER = NullTimer()
+
+
+class _Phase:
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+        self.queries = 0
+
+    def count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self.connections = connections.all() if self.timer.count_queries else []
+        for connection in self.connections:
+            connection.execute_wrappers.append(self.count_query)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start
+        for connection in self.connections:
+            connection.execute_wrappers.remove(self.count_query)
+        self.timer.add(self.name, duration, self.queries if self.timer.count_queries else None)
+
+
+class RequestTimer:
+    """
+    Records the time spent, and the number of database queries run, in each
+    phase of a request.
+
+    Phases may be nested, eg. parsing and serialization happen within the
+    handler phase, and a phase that runs more than once is summed.
+
+    If `count_queries` is `False`, no queries are recorded, and `queries`
+    is left empty.
+    """
+    enabled = True
+
+    def __init__(self, count_queries=True):
+        self.count_queries = count_queries
+        self.durations = {}
+        self.queries = {}
+
+    def phase(self, name):
+        """
+        Return a context manager that times the given phase.
+        """
+        return _Phase(self, name)
+
+    def add(self, name, duration, queries=0):
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+        if queries is not None:
+            self.queries[name] = self.queries.get(name, 0) + queries
+
+
+def get_timer(request):
+    """
+    Return the timer for a request, which may be `None`, a Django
+    `HttpRequest` or a REST framework `Request`.
+    """
+    return getattr(request, 'timer', NULL_TIMER)
+
+
+def server_timing(request, response, view):
+    """
+    Timing collector that adds the phase timings to the response as a
+    `Server-Timing` header.
+    """
+    timer = request.timer
+    metrics = []
+    for name, duration in timer.durations.items():
+        metric = '%s;dur=%.3f' % (name, duration * 1000)
+        if timer.queries.get(name):
+            metric += ';desc="%d queries"' % timer.queries[name]
+        metrics.append(metric)
+    response['Server-Timing'] = ', '.join(metrics)
@@ -5,6 +5,7 @@ Helper classes for parsers.
 import contextlib
 import datetime
 import decimal
+import functools
 import json  # noqa
 import uuid
 
@@ -16,40 +17,122 @@ from django.utils.functional import Promise
 from rest_framework.compat import coreapi
 
 
+def encode_promise(obj):
+    return force_str(obj)
+
+
+def encode_datetime(obj):
+    # For Date Time string spec, see ECMA 262
+    # https://ecma-international.org/ecma-262/5.1/#sec-15.9.1.15
+    representation = obj.isoformat()
+    if representation.endswith('+00:00'):
+        representation = representation[:-6] + 'Z'
+    return representation
+
+
+def encode_date(obj):
+    return obj.isoformat()
+
+
+def encode_time(obj):
+    if timezone and timezone.is_aware(obj):
+        raise ValueError("JSON can't represent timezone-aware times.")
+    return obj.isoformat()
+
+
+def encode_timedelta(obj):
+    return str(obj.total_seconds())
+
+
+def encode_decimal(obj):
+    # Serializers will coerce decimals to strings by default.
+    return float(obj)
+
+
+def encode_uuid(obj):
+    return str(obj)
+
+
+def encode_queryset(obj):
+    return tuple(obj)
+
+
+def encode_bytes(obj):
+    # Best-effort for binary blobs. See #4187.
+    return obj.decode()
+
+
 class JSONEncoder(json.JSONEncoder):
     """
     JSONEncoder subclass that knows how to encode date/time/timedelta,
     decimal types, generators and other basic python objects.
+
+    Values are encoded by the function registered for the nearest type in
+    their class's MRO, and otherwise by checking for `tolist()`, mappings
+    and sequences, and iterables. Use `JSONEncoder.register()` to add
+    functions for other types.
     """
+    encoders = {
+        Promise: encode_promise,
+        datetime.datetime: encode_datetime,
+        datetime.date: encode_date,
+        datetime.time: encode_time,
+        datetime.timedelta: encode_timedelta,
+        decimal.Decimal: encode_decimal,
+        uuid.UUID: encode_uuid,
+        QuerySet: encode_queryset,
+        bytes: encode_bytes,
+    }
+    _encoder_cache = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._encoder_cache = {}
+
+    @classmethod
+    def register(cls, type_, encoder=None):
+        """
+        Register a function that returns a JSON serializable value for
+        instances of `type_` and its subclasses. May be used as a decorator.
+
+        Functions registered on a subclass aren't used by its parents.
+        """
+        if encoder is None:
+            return functools.partial(cls.register, type_)
+        if 'encoders' not in cls.__dict__:
+            cls.encoders = dict(cls.encoders)
+        cls.encoders[type_] = encoder
+        cls._clear_encoder_cache()
+        return encoder
+
+    @classmethod
+    def _clear_encoder_cache(cls):
+        cls._encoder_cache.clear()
+        for subclass in cls.__subclasses__():
+            subclass._clear_encoder_cache()
+
+    @classmethod
+    def get_encoder(cls, type_):
+        """
+        Returns the function registered for the nearest type in the MRO of
+        `type_`, or `None`.
+        """
+        try:
+            return cls._encoder_cache[type_]
+        except KeyError:
+            pass
+        encoders = cls.encoders
+        encoder = next((encoders[base] for base in type_.__mro__ if base in encoders), None)
+        cls._encoder_cache[type_] = encoder
+        return encoder
+
     def default(self, obj):
-        # For Date Time string spec, see ECMA 262
-        # https://ecma-international.org/ecma-262/5.1/#sec-15.9.1.15
-        if isinstance(obj, Promise):
-            return force_str(obj)
-        elif isinstance(obj, datetime.datetime):
-            representation = obj.isoformat()
-            if representation.endswith('+00:00'):
-                representation = representation[:-6] + 'Z'
-            return representation
-        elif isinstance(obj, datetime.date):
-            return obj.isoformat()
-        elif isinstance(obj, datetime.time):
-            if timezone and timezone.is_aware(obj):
-                raise ValueError("JSON can't represent timezone-aware times.")
-            representation = obj.isoformat()
-            return representation
-        elif isinstance(obj, datetime.timedelta):
-            return str(obj.total_seconds())
-        elif isinstance(obj, decimal.Decimal):
-            # Serializers will coerce decimals to strings by default.
-            return float(obj)
-        elif isinstance(obj, uuid.UUID):
-            return str(obj)
-        elif isinstance(obj, QuerySet):
-            return tuple(obj)
-        elif isinstance(obj, bytes):
-            # Best-effort for binary blobs. See #4187.
-            return obj.decode()
+        try:
+            encoder = self._encoder_cache[type(obj)]
+        except KeyError:
+            encoder = self.get_encoder(type(obj))
+        if encoder is not None:
+            return encoder(obj)
         elif hasattr(obj, 'tolist'):
             # Numpy arrays and array scalars.
             return obj.tolist()
@@ -0,0 +1,452 @@
+"""
+Helper functions for deriving the database lookups that a serializer
+needs, so that they can be applied to a queryset up front instead of
+being resolved with one query per object.
+
+Usage: `get_query_plan(serializer, model)` returns a `QueryPlan` instance,
+and `plan.apply(queryset)` returns the queryset with the plan applied.
+
+Similarly `get_values_plan(serializer, model)` returns a `ValuesPlan`, which
+reads the serializer's fields with a `.values()` queryset instead of loading
+model instances, or `None` if the serializer can't be read that way.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models.query import ModelIterable, QuerySet, ValuesIterable
+
+from rest_framework.fields import Field
+from rest_framework.relations import (
+    HyperlinkedIdentityField, HyperlinkedRelatedField, PKOnlyObject,
+    RelatedField, SlugRelatedField
+)
+from rest_framework.serializers import (
+    ListSerializer, ModelSerializer, Serializer
+)
+from rest_framework.utils import model_meta
+from rest_framework.utils.serializer_helpers import ValuesRow
+
+
+class QueryPlan:
+    """
+    The `select_related()` and `prefetch_related()` lookups required to
+    serialize instances of a model without any further queries.
+
+    Optionally, `only` lists the model fields that are read, for use with
+    `QuerySet.only()`. A value of `None` means that all fields are loaded.
+    """
+
+    def __init__(self, select_related=None, prefetch_related=None, only=None):
+        self.select_related = list(select_related or [])
+        self.prefetch_related = list(prefetch_related or [])
+        self.only = None if only is None else list(only)
+
+    def add_lookup(self, path, to_many):
+        """
+        Include the relationship given by a list of attribute names.
+
+        Any path that traverses a to-many relationship has to be prefetched,
+        all other relationships can be joined with `select_related()`.
+        """
+        lookup = '__'.join(path)
+        lookups = self.prefetch_related if to_many else self.select_related
+        if lookup not in lookups:
+            lookups.append(lookup)
+
+    def apply(self, queryset):
+        """
+        Return the queryset with the planned lookups applied.
+
+        Querysets that do not return model instances, such as `.values()`
+        or combined querysets, are returned unchanged. Fields are not pruned
+        from querysets that already use `.only()` or `.defer()`.
+        """
+        if not isinstance(queryset, QuerySet):
+            return queryset
+        if not issubclass(queryset._iterable_class, ModelIterable) or queryset.query.combinator:
+            return queryset
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        only = self.get_only(queryset)
+        if only is not None:
+            queryset = queryset.only(*only)
+        return queryset
+
+    def get_only(self, queryset):
+        """
+        Return the arguments for `queryset.only()`, or `None` if the fields
+        should not be pruned.
+
+        Every relationship followed by `select_related()` has to be loaded,
+        including any that were already present on the queryset.
+        """
+        if self.only is None or queryset.query.deferred_loading != (frozenset(), True):
+            return None
+        select_related = queryset.query.select_related
+        if select_related is True:
+            # `select_related()` without arguments follows every non-null
+            # foreign key, so we can't tell which ones must be kept.
+            return None
+        only = list(self.only)
+        for path in _get_select_related_paths(select_related or {}):
+            lookup = '__'.join(path)
+            parent = '__'.join(path[:-1]) + '__'
+            if lookup in only:
+                continue
+            # Only add the relationship if its parent model is being pruned,
+            # otherwise all of the parent's fields are loaded already.
+            if len(path) == 1 or any(item.startswith(parent) for item in only):
+                only.append(lookup)
+        return only
+
+    def __bool__(self):
+        return bool(self.select_related or self.prefetch_related or self.only is not None)
+
+    def __eq__(self, other):
+        if not isinstance(other, QueryPlan):
+            return NotImplemented
+        return (
+            self.select_related == other.select_related and
+            self.prefetch_related == other.prefetch_related and
+            self.only == other.only
+        )
+
+    def __repr__(self):
+        if self.only is None:
+            return '<%s select_related=%r prefetch_related=%r>' % (
+                self.__class__.__name__, self.select_related, self.prefetch_related
+            )
+        return '<%s select_related=%r prefetch_related=%r only=%r>' % (
+            self.__class__.__name__, self.select_related, self.prefetch_related, self.only
+        )
+
+
+def get_query_plan(serializer, model, prune_columns=None):
+    """
+    Given a serializer instance and the model class of the instances it
+    will serialize, returns the `QueryPlan` for its readable fields.
+
+    Nested serializers, relational fields and dotted `source` arguments
+    that traverse model relationships are all followed. Sources that
+    can't be mapped onto the model, such as properties, methods and
+    `SerializerMethodField`, are skipped.
+
+    If `prune_columns` is set, the plan also lists the model fields that
+    are read. Any model with sources that can't be mapped onto its fields
+    has all of its fields loaded instead. Defaults to the `prune_columns`
+    option on the serializer's `Meta` class.
+    """
+    plan = QueryPlan()
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+    if prune_columns is None:
+        prune_columns = get_prune_columns(serializer)
+    if isinstance(serializer, Serializer):
+        columns = {(): {}} if prune_columns else None
+        _plan_serializer(plan, columns, serializer, model, (), False, {})
+        if columns is not None:
+            plan.only = _get_only(columns)
+    return plan
+
+
+def get_prune_columns(serializer_class):
+    """
+    Returns the `prune_columns` option for a serializer class or instance.
+    """
+    meta = getattr(serializer_class, 'Meta', None)
+    return getattr(meta, 'prune_columns', False)
+
+
+def _get_relations(model, field_info):
+    # `get_field_info()` is not cached, so cache it for a single plan.
+    if model not in field_info:
+        field_info[model] = model_meta.get_field_info(model).relations
+    return field_info[model]
+
+
+def _get_select_related_paths(select_related, prefix=()):
+    # `query.select_related` is a nested dict of relationship names.
+    for name, children in select_related.items():
+        path = prefix + (name,)
+        yield path
+        yield from _get_select_related_paths(children, path)
+
+
+def _get_only(columns):
+    # `columns` maps the path of each model loaded through `select_related()`
+    # to the fields read from it, or to `None` if they can't be determined.
+    if columns[()] is None:
+        return None
+    only = []
+    for path, names in columns.items():
+        if any(columns.get(path[:index]) is None for index in range(len(path) + 1)):
+            continue
+        only.extend('__'.join(path + (name,)) for name in names)
+    return only
+
+
+def _add_column(columns, model, path, name):
+    """
+    Record that the model field `name` is read from the model loaded at
+    `path`, or that its fields can't be determined if it isn't a field.
+    """
+    if columns is None:
+        return
+    if name == 'pk':
+        # The primary key is always loaded.
+        columns.setdefault(path, {})
+        return
+    try:
+        model_field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        model_field = None
+    if model_field is None or not model_field.concrete:
+        columns[path] = None
+    elif columns.setdefault(path, {}) is not None:
+        columns[path][model_field.name] = None
+
+
+def _plan_columns(columns, field, model, path):
+    """
+    Record the fields read from `model` by a relational or `source='*'`
+    field that is given the model instance itself.
+    """
+    if isinstance(field, Serializer):
+        return
+    if isinstance(field, RelatedField) and field.use_pk_only_optimization():
+        name = 'pk'
+    elif isinstance(field, (HyperlinkedRelatedField, HyperlinkedIdentityField)):
+        name = field.lookup_field
+    elif isinstance(field, SlugRelatedField):
+        name = field.slug_field
+    else:
+        # Eg. `SerializerMethodField` or `StringRelatedField`.
+        columns[path] = None
+        return
+    _add_column(columns, model, path, name)
+
+
+def _plan_serializer(plan, columns, serializer, model, prefix, to_many, field_info):
+    for field in serializer._readable_fields:
+        _plan_field(plan, columns, field, model, prefix, to_many, field_info)
+
+
+def _plan_field(plan, columns, field, model, prefix, to_many, field_info):
+    nested = field.child if isinstance(field, ListSerializer) else field
+    if to_many:
+        # Fields of prefetched models are always loaded in full.
+        columns = None
+
+    # Related fields using the pk only optimization read a forward
+    # relationship from its `<name>_id` column, without fetching it.
+    pk_only = isinstance(field, RelatedField) and field.use_pk_only_optimization()
+
+    path = prefix
+    for index, attr in enumerate(field.source_attrs):
+        relation = _get_relations(model, field_info).get(attr)
+        if relation is None:
+            # Either a regular model field, or a source we can't follow.
+            _add_column(columns, model, path, attr)
+            nested = None
+            break
+        is_last = index == len(field.source_attrs) - 1
+        if relation.to_many:
+            columns = None
+        elif not relation.reverse:
+            _add_column(columns, model, path, attr)
+        if is_last and pk_only and not relation.reverse and not relation.to_many:
+            nested = None
+            break
+        path = path + (attr,)
+        to_many = to_many or relation.to_many
+        model = relation.related_model
+        if columns is not None:
+            columns.setdefault(path, {})
+    else:
+        if columns is not None:
+            _plan_columns(columns, nested, model, path)
+
+    if len(path) > len(prefix):
+        plan.add_lookup(path, to_many)
+    if isinstance(nested, Serializer):
+        _plan_serializer(plan, columns, nested, model, path, to_many, field_info)
+
+
+class ValuesRowIterable(ValuesIterable):
+    """
+    Yields a `ValuesRow` for each row, so that serializers can tell the
+    rows of a values plan apart from other dictionaries.
+    """
+
+    def __iter__(self):
+        for row in super().__iter__():
+            yield ValuesRow(row)
+
+
+class ValuesPlan:
+    """
+    The `.values()` lookups required to serialize instances of a model, and
+    the fields that each lookup is mapped onto.
+
+    `entries` is a list of `(field_name, lookup, to_representation, pk_only,
+    nested)` tuples. For nested serializers `nested` is the list of entries
+    for the nested fields, and `lookup` is used to check whether the related
+    instance exists.
+    """
+
+    def __init__(self, lookups, entries):
+        self.lookups = list(lookups)
+        self.entries = entries
+
+    def apply(self, queryset):
+        """
+        Return a `.values()` queryset that yields a `ValuesRow` for each
+        instance in the given queryset.
+
+        Querysets that do not return model instances, or that have already
+        been evaluated, are returned unchanged.
+        """
+        if not isinstance(queryset, QuerySet) or queryset._result_cache is not None:
+            return queryset
+        if not issubclass(queryset._iterable_class, ModelIterable) or queryset.query.combinator:
+            return queryset
+        queryset = queryset.values(*self.lookups)
+        queryset._iterable_class = ValuesRowIterable
+        return queryset
+
+    def to_representation(self, row):
+        return _represent_row(self.entries, row)
+
+    def __repr__(self):
+        return '<%s lookups=%r>' % (self.__class__.__name__, self.lookups)
+
+
+def _represent_row(entries, row):
+    ret = {}
+    for field_name, lookup, to_representation, pk_only, nested in entries:
+        value = None if lookup is None else row[lookup]
+        if nested is not None:
+            if lookup is not None and value is None:
+                ret[field_name] = None
+            else:
+                ret[field_name] = _represent_row(nested, row)
+        elif value is None:
+            ret[field_name] = None
+        elif pk_only:
+            ret[field_name] = to_representation(PKOnlyObject(pk=value))
+        else:
+            ret[field_name] = to_representation(value)
+    return ret
+
+
+class ValuesNotSupported(Exception):
+    pass
+
+
+def get_values_plan(serializer, model):
+    """
+    Given a serializer instance and the model class of the instances it
+    will serialize, returns the `ValuesPlan` for its readable fields.
+
+    Returns `None` if any of the fields can't be read from a `.values()`
+    queryset. This is the case for `source='*'`, `SerializerMethodField`,
+    properties and methods, to-many relationships, relational fields that
+    need the related instance, file fields, and serializers or fields that
+    override `to_representation()` or `get_attribute()` respectively.
+    """
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+    lookups = []
+    try:
+        entries = _plan_values(serializer, model, (), lookups, {})
+    except ValuesNotSupported:
+        return None
+    return ValuesPlan(lookups, entries)
+
+
+def _add_lookup(lookups, path):
+    lookup = '__'.join(path)
+    if lookup not in lookups:
+        lookups.append(lookup)
+    return lookup
+
+
+def _plan_values(serializer, model, prefix, lookups, field_info):
+    if not isinstance(serializer, Serializer) or type(serializer).to_representation not in (
+        Serializer.to_representation, ModelSerializer.to_representation
+    ):
+        raise ValuesNotSupported()
+    return [
+        _plan_values_field(field, model, prefix, lookups, field_info)
+        for field in serializer._readable_fields
+    ]
+
+
+def _plan_values_field(field, model, prefix, lookups, field_info):
+    if isinstance(field, Serializer):
+        return _plan_values_nested(field, model, prefix, lookups, field_info)
+
+    if type(field).get_attribute not in (Field.get_attribute, RelatedField.get_attribute):
+        raise ValuesNotSupported()
+    pk_only = isinstance(field, RelatedField) and field.use_pk_only_optimization()
+    if isinstance(field, RelatedField) and not pk_only:
+        raise ValuesNotSupported()
+    if not field.source_attrs:
+        raise ValuesNotSupported()
+
+    path = prefix
+    *attrs, last = field.source_attrs
+    for attr in attrs:
+        model = _follow_forward_relation(model, attr, field_info)
+        path = path + (attr,)
+
+    relation = _get_relations(model, field_info).get(last)
+    if relation is not None:
+        if not pk_only or relation.to_many:
+            raise ValuesNotSupported()
+        lookup = path + (last,) if not relation.reverse else path + (last, 'pk')
+    elif pk_only:
+        raise ValuesNotSupported()
+    else:
+        try:
+            model_field = model._meta.get_field(last)
+        except FieldDoesNotExist:
+            raise ValuesNotSupported()
+        if not model_field.concrete or isinstance(model_field, models.FileField):
+            raise ValuesNotSupported()
+        lookup = path + (last,)
+
+    lookup = _add_lookup(lookups, lookup)
+    return (field.field_name, lookup, field.to_representation, pk_only, None)
+
+
+def _plan_values_nested(field, model, prefix, lookups, field_info):
+    if not field.source_attrs:
+        # `source='*'` nested serializers read from the same instance.
+        nested = _plan_values(field, model, prefix, lookups, field_info)
+        return (field.field_name, None, None, False, nested)
+
+    path = prefix
+    *attrs, last = field.source_attrs
+    for attr in attrs:
+        model = _follow_forward_relation(model, attr, field_info)
+        path = path + (attr,)
+
+    relation = _get_relations(model, field_info).get(last)
+    if relation is None or relation.to_many:
+        raise ValuesNotSupported()
+    path = path + (last,)
+    # The related instance may not exist, so look up its primary key first.
+    lookup = _add_lookup(lookups, path if not relation.reverse else path + ('pk',))
+    nested = _plan_values(field, relation.related_model, path, lookups, field_info)
+    return (field.field_name, lookup, None, False, nested)
+
+
+def _follow_forward_relation(model, attr, field_info):
+    # Dotted sources can only follow relationships that always exist, as
+    # a missing instance is handled by the field rather than the plan.
+    relation = _get_relations(model, field_info).get(attr)
+    if relation is None or relation.reverse or relation.to_many or relation.model_field.null:
+        raise ValuesNotSupported()
+    return relation.related_model
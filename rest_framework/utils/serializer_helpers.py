@@ -66,6 +66,82 @@ class ReturnList(list):
         return (list, (list(self),))
 
 
+class ValuesRow(dict):
+    """
+    A row from a `.values()` queryset built by a serializer's values plan.
+    Serializers given a `ValuesRow` map its columns straight onto their
+    fields, instead of reading attributes from a model instance.
+    """
+    pass
+
+
+class PendingValue:
+    """
+    Placeholder for the value of a batched field, until the loader is
+    resolved. `index` is the position of the object in the field's batch.
+    """
+    __slots__ = ('index',)
+
+    def __init__(self, index):
+        self.index = index
+
+
+class BatchLoader:
+    """
+    Collects the objects serialized by `ListSerializer` for each batched
+    field, so that all of the values for a field can be resolved with a
+    single call, once the outermost list has been serialized.
+    """
+
+    def __init__(self):
+        self.batches = {}
+
+    def defer(self, field):
+        """
+        Mark the field's values as pending, until the loader is resolved.
+        """
+        field.batch_loader = self
+        self.batches.setdefault(field, ([], []))
+
+    def collect(self, field, obj):
+        """
+        Add an object to the field's batch, and return the placeholder that
+        stands in for its value.
+        """
+        objs = self.batches[field][0]
+        objs.append(obj)
+        return PendingValue(len(objs) - 1)
+
+    def add(self, field, rets):
+        """
+        Add a list of serialized representations that may hold placeholders
+        for the field's values.
+        """
+        self.batches[field][1].extend(rets)
+
+    def resolve(self):
+        """
+        Fill in the values of each field, with one call per field.
+        """
+        for field, (objs, rets) in self.batches.items():
+            field.batch_loader = None
+            if not objs:
+                continue
+            values = field.get_batch(objs)
+            field_name = field.field_name
+            for ret in rets:
+                if isinstance(ret, dict):
+                    value = ret.get(field_name)
+                    if isinstance(value, PendingValue):
+                        ret[field_name] = values[value.index]
+        self.batches = {}
+
+    def clear(self):
+        for field in self.batches:
+            field.batch_loader = None
+        self.batches = {}
+
+
 class BoundField:
     """
     A field object that also includes `.value` and `.error` properties.
@@ -161,9 +237,16 @@ class BindingDict(MutableMapping):
     def __init__(self, serializer):
         self.serializer = serializer
         self.fields = {}
+        # Cached output of `Serializer.get_read_plan()` and
+        # `ModelSerializer.get_values_plan()`. Any change to the set of
+        # fields invalidates them.
+        self.read_plan = None
+        self.values_plan = None
 
     def __setitem__(self, key, field):
         self.fields[key] = field
+        self.read_plan = None
+        self.values_plan = None
         field.bind(field_name=key, parent=self.serializer)
 
     def __getitem__(self, key):
@@ -171,6 +254,8 @@ class BindingDict(MutableMapping):
 
     def __delitem__(self, key):
         del self.fields[key]
+        self.read_plan = None
+        self.values_plan = None
 
     def __iter__(self):
         return iter(self.fields)
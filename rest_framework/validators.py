@@ -6,10 +6,17 @@ This gives us better separation of concerns, allows us to use single-step
 object creation, and makes it possible to switch between using the implicit
 `ModelSerializer` class and an equivalent explicit `Serializer` class.
 """
-from django.db import DataError
+import contextlib
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import DataError, connections, models, transaction
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.settings import api_settings
 from rest_framework.utils.representation import smart_repr
 
 
@@ -30,6 +37,169 @@ def qs_filter(queryset, **kwargs):
         return queryset.none()
 
 
+def get_uniqueness_batch(serializer):
+    """
+    Returns the `UniquenessBatch` collecting the uniqueness checks for the
+    items of a `ListSerializer`, if the serializer is one of those items.
+    """
+    return getattr(getattr(serializer, 'parent', None), '_uniqueness_batch', None)
+
+
+def _normalize(value, case_insensitive=False):
+    # Related instances are compared by primary key, as in `.values_list()`.
+    if isinstance(value, models.Model):
+        return value.pk
+    if case_insensitive and isinstance(value, str):
+        return value.casefold()
+    return value
+
+
+class UniquenessBatch:
+    """
+    Collects the values checked by `UniqueValidator` and
+    `UniqueTogetherValidator` for each item of a `ListSerializer`, so that
+    each validator runs one query for all of the items, rather than one
+    query per item. Values that occur more than once within the items
+    themselves are also reported as not unique.
+
+    `index` is set by the list serializer to the index of the item that
+    is being validated.
+    """
+    # The maximum number of items checked per query. The database backend
+    # may lower this, so that each query stays within its limit of bound
+    # parameters, eg. SQLite's 999.
+    batch_size = 500
+
+    def __init__(self):
+        self.index = None
+        self.checks = {}
+
+    def add(self, validator, key, values, instance):
+        """
+        Defer a check for the current item. `key` identifies the fields
+        being checked, and `values` is a dict of field name -> value.
+
+        Returns `False` if the values can't be compared in the batch, in
+        which case the validator should check the item by itself.
+        """
+        try:
+            hash(tuple(values.values()))
+        except TypeError:
+            return False
+        checks = self.checks.setdefault((id(validator), key), (validator, key, []))[2]
+        checks.append((self.index, values, instance))
+        return True
+
+    def apply(self, errors):
+        """
+        Run the deferred checks, and add any uniqueness errors to the list of
+        errors for each item. Returns the list of errors.
+        """
+        for validator, key, checks in self.checks.values():
+            for index, error in validator.check_batch(self, key, checks):
+                if not isinstance(errors[index], dict):
+                    continue
+                for field_name, messages in error.items():
+                    errors[index].setdefault(field_name, []).extend(messages)
+        self.checks = {}
+        return errors
+
+    def get_batch_size(self, queryset, field_names, checks):
+        """
+        Return the number of checks to run per query, given that each check
+        binds one parameter for each of the fields.
+        """
+        ops = connections[queryset.db].ops
+        return max(1, min(self.batch_size, ops.bulk_batch_size(field_names, checks)))
+
+    def add_existing(self, existing, queryset, condition, field_names, case_insensitive):
+        """
+        Add the pks of the objects matching `condition` to `existing`, keyed
+        by their normalized values for the fields. Within a transaction, the
+        query runs in a savepoint, so that a database error doesn't leave the
+        transaction broken.
+        """
+        if connections[queryset.db].in_atomic_block:
+            context = transaction.atomic(using=queryset.db)
+        else:
+            context = contextlib.nullcontext()
+        with context:
+            rows = list(queryset.filter(condition).values_list('pk', *field_names))
+        for pk, *row in rows:
+            key = tuple(_normalize(value, case_insensitive) for value in row)
+            existing.setdefault(key, set()).add(pk)
+
+    def get_key(self, model, values, case_insensitive):
+        """
+        Returns the values of a check as they will be read from the database,
+        or `None` if a value isn't valid for its model field, in which case
+        it can't match an existing object.
+        """
+        key = []
+        for field_name, value in values.items():
+            value = _normalize(value)
+            try:
+                model_field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                pass
+            else:
+                try:
+                    value = model_field.to_python(value)
+                except (DjangoValidationError, TypeError, ValueError):
+                    return None
+            key.append(_normalize(value, case_insensitive))
+        return tuple(key)
+
+    def find_conflicts(self, queryset, checks, case_insensitive=False):
+        """
+        Given a queryset and a list of `(index, values, instance)` checks, run
+        one query for each batch of checks and yield the index of each check
+        that conflicts with an existing object, or with an earlier check.
+
+        Values that aren't valid for their model field are left out of the
+        query. If the query still fails, each check of the batch is run by
+        itself, as `qs_exists()` would.
+        """
+        field_names = list(checks[0][1])
+        batch_size = self.get_batch_size(queryset, field_names, checks)
+        lookup = 'iexact' if case_insensitive else 'exact'
+        seen = set()
+        for start in range(0, len(checks), batch_size):
+            batch = [
+                (index, values, instance, self.get_key(queryset.model, values, case_insensitive))
+                for index, values, instance in checks[start:start + batch_size]
+            ]
+            conditions = [
+                models.Q(**{
+                    '%s__%s' % (field_name, lookup): value
+                    for field_name, value in values.items()
+                })
+                for index, values, instance, key in batch
+                if key is not None
+            ]
+            existing = {}
+            if len(field_names) == 1 and not case_insensitive:
+                lookup_values = [key[0] for index, values, instance, key in batch if key is not None]
+                if lookup_values:
+                    conditions = [models.Q(**{'%s__in' % field_names[0]: lookup_values})]
+            if conditions:
+                try:
+                    self.add_existing(existing, queryset, reduce(or_, conditions), field_names, case_insensitive)
+                except (TypeError, ValueError, DataError):
+                    existing = {}
+                    for condition in conditions:
+                        with contextlib.suppress(TypeError, ValueError, DataError):
+                            self.add_existing(existing, queryset, condition, field_names, case_insensitive)
+
+            for index, values, instance, key in batch:
+                if key is None:
+                    continue
+                pks = existing.get(key, set())
+                if key in seen or pks - {getattr(instance, 'pk', None)}:
+                    yield index
+                seen.add(key)
+
+
 class UniqueValidator:
     """
     Validator that corresponds to `unique=True` on a model field.
@@ -67,12 +237,37 @@ class UniqueValidator:
         # Determine the existing instance, if this is an update operation.
         instance = getattr(serializer_field.parent, 'instance', None)
 
+        batch = get_uniqueness_batch(serializer_field.parent)
+        key = (field_name, serializer_field.field_name)
+        if batch is not None and self.can_batch() and batch.add(self, key, {field_name: value}, instance):
+            return
+
         queryset = self.queryset
         queryset = self.filter_queryset(value, queryset, field_name)
         queryset = self.exclude_current_instance(queryset, instance)
         if qs_exists(queryset):
             raise ValidationError(self.message, code='unique')
 
+    def can_batch(self):
+        """
+        Returns `True` if the checks for many items can be run together.
+        """
+        return (
+            self.lookup in ('exact', 'iexact') and
+            type(self).filter_queryset is UniqueValidator.filter_queryset and
+            type(self).exclude_current_instance is UniqueValidator.exclude_current_instance
+        )
+
+    def check_batch(self, batch, key, checks):
+        """
+        Yields an `(index, errors)` pair for each of the batched checks
+        that isn't unique.
+        """
+        field_name, serializer_field_name = key
+        case_insensitive = self.lookup == 'iexact'
+        for index in batch.find_conflicts(self.queryset, checks, case_insensitive):
+            yield index, {serializer_field_name: [ErrorDetail(self.message, code='unique')]}
+
     def __repr__(self):
         return '<%s(queryset=%s)>' % (
             self.__class__.__name__,
@@ -155,6 +350,11 @@ class UniqueTogetherValidator:
 
     def __call__(self, attrs, serializer):
         self.enforce_required_fields(attrs, serializer)
+
+        batch = get_uniqueness_batch(serializer)
+        if batch is not None and self.can_batch() and self.add_to_batch(batch, attrs, serializer):
+            return
+
         queryset = self.queryset
         queryset = self.filter_queryset(attrs, queryset, serializer)
         queryset = self.exclude_current_instance(attrs, queryset, serializer.instance)
@@ -168,6 +368,49 @@ class UniqueTogetherValidator:
             message = self.message.format(field_names=field_names)
             raise ValidationError(message, code='unique')
 
+    def can_batch(self):
+        """
+        Returns `True` if the checks for many items can be run together.
+        """
+        return (
+            type(self).filter_queryset is UniqueTogetherValidator.filter_queryset and
+            type(self).exclude_current_instance is UniqueTogetherValidator.exclude_current_instance
+        )
+
+    def add_to_batch(self, batch, attrs, serializer):
+        """
+        Defer the check for this item to the batch. Returns `False` if the
+        item should be checked by itself instead.
+        """
+        # Ignore validation if any field is None
+        checked_values = [
+            value for field, value in attrs.items() if field in self.fields
+        ]
+        if None in checked_values:
+            return True
+
+        sources = [
+            serializer.fields[field_name].source
+            for field_name in self.fields
+        ]
+        values = {}
+        for source in sources:
+            if source in attrs:
+                values[source] = attrs[source]
+            else:
+                values[source] = getattr(serializer.instance, source)
+        return batch.add(self, tuple(sources), values, serializer.instance)
+
+    def check_batch(self, batch, key, checks):
+        """
+        Yields an `(index, errors)` pair for each of the batched checks
+        that isn't unique.
+        """
+        field_names = ', '.join(self.fields)
+        message = self.message.format(field_names=field_names)
+        for index in batch.find_conflicts(self.queryset, checks):
+            yield index, {api_settings.NON_FIELD_ERRORS_KEY: [ErrorDetail(message, code='unique')]}
+
     def __repr__(self):
         return '<%s(queryset=%s, fields=%s)>' % (
             self.__class__.__name__,
@@ -1,23 +1,37 @@
 """
 Provides an APIView class that is the base of all views in REST framework.
 """
+import weakref
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 from django.db import connections, models
 from django.http import Http404
 from django.http.response import HttpResponseBase
+from django.template.response import SimpleTemplateResponse
 from django.utils.cache import cc_delim_re, patch_vary_headers
 from django.utils.encoding import smart_str
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import View
 
 from rest_framework import exceptions, status
+from rest_framework.compat import (
+    classproperty, iscoroutinefunction, markcoroutinefunction
+)
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.schemas import DefaultSchema
 from rest_framework.settings import api_settings
+from rest_framework.timing import RequestTimer, get_timer
 from rest_framework.utils import formatting
 
+# Shared instances of stateless policy classes, keyed by view class and then
+# by policy class. Once a view class has `POLICY_CACHE_SIZE` shared policies,
+# any others are instantiated on every request.
+_policy_cache = weakref.WeakKeyDictionary()
+POLICY_CACHE_SIZE = 32
+
 
 def get_view_name(view):
     """
@@ -112,6 +126,11 @@ class APIView(View):
     content_negotiation_class = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS
     metadata_class = api_settings.DEFAULT_METADATA_CLASS
     versioning_class = api_settings.DEFAULT_VERSIONING_CLASS
+    timing_collectors = api_settings.DEFAULT_TIMING_COLLECTORS
+
+    # Set to `True` to build policies marked as `stateless` once per view
+    # class, and share those instances between requests.
+    reuse_stateless_policies = False
 
     # Allow dependency injection of other settings to make testing easier.
     settings = api_settings
@@ -141,7 +160,43 @@ class APIView(View):
 
         # Note: session based authentication is explicitly CSRF validated,
         # all other authentication is CSRF exempt.
-        return csrf_exempt(view)
+        view = csrf_exempt(view)
+        if cls.view_is_async:
+            markcoroutinefunction(view)
+        return view
+
+    @classproperty
+    def view_is_async(cls):
+        """
+        Return `True` if the handler methods of this view are coroutines,
+        in which case requests are dispatched with `.adispatch()`.
+
+        This is read on every request, so it is computed once per view class,
+        when `.as_view()` is first called, and stored on the class.
+        """
+        try:
+            return cls.__dict__['_view_is_async']
+        except KeyError:
+            pass
+        handlers = [
+            getattr(cls, method)
+            for method in cls.http_method_names
+            if method != 'options' and hasattr(cls, method)
+        ]
+        cls._view_is_async = cls._handlers_are_async(handlers)
+        return cls._view_is_async
+
+    @classmethod
+    def _handlers_are_async(cls, handlers):
+        if not handlers:
+            return False
+        is_async = iscoroutinefunction(handlers[0])
+        if not all(iscoroutinefunction(handler) == is_async for handler in handlers[1:]):
+            raise ImproperlyConfigured(
+                '%s HTTP handlers must either be all sync or all async.'
+                % cls.__qualname__
+            )
+        return is_async
 
     @property
     def allowed_methods(self):
@@ -253,42 +308,71 @@ class APIView(View):
         if self.settings.FORMAT_SUFFIX_KWARG:
             return kwargs.get(self.settings.FORMAT_SUFFIX_KWARG)
 
+    def instantiate_policies(self, policy_classes):
+        """
+        Instantiates and returns a list of the given policy classes.
+
+        If `.reuse_stateless_policies` is set, then the policies marked as
+        `stateless` are only instantiated once for this view class. The flag
+        isn't inherited, so that a subclass that keeps state on `self` isn't
+        shared by accident. Each subclass must set it again.
+        """
+        if not self.reuse_stateless_policies:
+            return [policy() for policy in policy_classes]
+
+        # Policy classes may be overridden per action, or per instance, so
+        # instances are cached by policy class rather than by attribute.
+        class_cache = _policy_cache.setdefault(self.__class__, {})
+        policies = []
+        for policy in policy_classes:
+            if not vars(policy).get('stateless', False):
+                policies.append(policy())
+                continue
+            instance = class_cache.get(policy)
+            if instance is None:
+                instance = policy()
+                if len(class_cache) < POLICY_CACHE_SIZE:
+                    class_cache[policy] = instance
+            policies.append(instance)
+        return policies
+
     def get_renderers(self):
         """
         Instantiates and returns the list of renderers that this view can use.
         """
-        return [renderer() for renderer in self.renderer_classes]
+        return self.instantiate_policies(self.renderer_classes)
 
     def get_parsers(self):
         """
         Instantiates and returns the list of parsers that this view can use.
         """
-        return [parser() for parser in self.parser_classes]
+        return self.instantiate_policies(self.parser_classes)
 
     def get_authenticators(self):
         """
         Instantiates and returns the list of authenticators that this view can use.
         """
-        return [auth() for auth in self.authentication_classes]
+        return self.instantiate_policies(self.authentication_classes)
 
     def get_permissions(self):
         """
         Instantiates and returns the list of permissions that this view requires.
         """
-        return [permission() for permission in self.permission_classes]
+        return self.instantiate_policies(self.permission_classes)
 
     def get_throttles(self):
         """
         Instantiates and returns the list of throttles that this view uses.
         """
-        return [throttle() for throttle in self.throttle_classes]
+        return self.instantiate_policies(self.throttle_classes)
 
     def get_content_negotiator(self):
         """
         Instantiate and return the content negotiation class to use.
         """
         if not getattr(self, '_negotiator', None):
-            self._negotiator = self.content_negotiation_class()
+            policies = self.instantiate_policies([self.content_negotiation_class])
+            self._negotiator = policies[0]
         return self._negotiator
 
     def get_exception_handler(self):
@@ -370,6 +454,55 @@ class APIView(View):
             duration = max(durations, default=None)
             self.throttled(request, duration)
 
+    async def aperform_authentication(self, request):
+        """
+        Async version of `.perform_authentication()`, used by async views.
+        """
+        await request.auser()
+
+    async def acheck_permissions(self, request):
+        """
+        Async version of `.check_permissions()`, used by async views.
+        """
+        for permission in self.get_permissions():
+            if not await permission.ahas_permission(request, self):
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    code=getattr(permission, 'code', None)
+                )
+
+    async def acheck_object_permissions(self, request, obj):
+        """
+        Async version of `.check_object_permissions()`, for use in async
+        handlers.
+        """
+        for permission in self.get_permissions():
+            if not await permission.ahas_object_permission(request, self, obj):
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    code=getattr(permission, 'code', None)
+                )
+
+    async def acheck_throttles(self, request):
+        """
+        Async version of `.check_throttles()`, used by async views.
+        """
+        throttle_durations = []
+        for throttle in self.get_throttles():
+            if not await throttle.aallow_request(request, self):
+                throttle_durations.append(throttle.wait())
+
+        if throttle_durations:
+            durations = [
+                duration for duration in throttle_durations
+                if duration is not None
+            ]
+
+            duration = max(durations, default=None)
+            self.throttled(request, duration)
+
     def determine_version(self, request, *args, **kwargs):
         """
         If versioning is being used, then determine any API version for the
@@ -388,13 +521,18 @@ class APIView(View):
         """
         parser_context = self.get_parser_context(request)
 
-        return Request(
+        request = Request(
             request,
             parsers=self.get_parsers(),
             authenticators=self.get_authenticators(),
             negotiator=self.get_content_negotiator(),
             parser_context=parser_context
         )
+        if self.timing_collectors:
+            # The queries of async views run on other threads' connections,
+            # so they can't be counted.
+            request.timer = RequestTimer(count_queries=not self.view_is_async)
+        return request
 
     def initial(self, request, *args, **kwargs):
         """
@@ -411,9 +549,36 @@ class APIView(View):
         request.version, request.versioning_scheme = version, scheme
 
         # Ensure that the incoming request is permitted
-        self.perform_authentication(request)
-        self.check_permissions(request)
-        self.check_throttles(request)
+        timer = request.timer
+        with timer.phase('authentication'):
+            self.perform_authentication(request)
+        with timer.phase('permissions'):
+            self.check_permissions(request)
+        with timer.phase('throttling'):
+            self.check_throttles(request)
+
+    async def ainitial(self, request, *args, **kwargs):
+        """
+        Async version of `.initial()`, used by async views.
+        """
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        # Perform content negotiation and store the accepted info on the request
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        # Determine the API version, if versioning is in use.
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        # Ensure that the incoming request is permitted
+        timer = request.timer
+        with timer.phase('authentication'):
+            await self.aperform_authentication(request)
+        with timer.phase('permissions'):
+            await self.acheck_permissions(request)
+        with timer.phase('throttling'):
+            await self.acheck_throttles(request)
 
     def finalize_response(self, request, response, *args, **kwargs):
         """
@@ -443,8 +608,23 @@ class APIView(View):
         for key, value in self.headers.items():
             response[key] = value
 
+        if get_timer(request).enabled:
+            # Responses that are rendered later are timed up to the end of
+            # their rendering.
+            if isinstance(response, SimpleTemplateResponse):
+                response.add_post_render_callback(self.collect_timings)
+            else:
+                self.collect_timings(response)
+
         return response
 
+    def collect_timings(self, response):
+        """
+        Pass the timings of the request to each of the view's timing collectors.
+        """
+        for collector in self.timing_collectors:
+            collector(self.request, response, self)
+
     def handle_exception(self, exc):
         """
         Handle any exception that occurs, by returning an appropriate response,
@@ -487,6 +667,9 @@ class APIView(View):
         `.dispatch()` is pretty much the same as Django's regular dispatch,
         but with extra hooks for startup, finalize, and exception handling.
         """
+        if self.view_is_async:
+            return self.adispatch(request, *args, **kwargs)
+
         self.args = args
         self.kwargs = kwargs
         request = self.initialize_request(request, *args, **kwargs)
@@ -503,7 +686,40 @@ class APIView(View):
             else:
                 handler = self.http_method_not_allowed
 
-            response = handler(request, *args, **kwargs)
+            with request.timer.phase('handler'):
+                response = handler(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def adispatch(self, request, *args, **kwargs):
+        """
+        Async version of `.dispatch()`, used by views with async handlers.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers  # deprecate?
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+
+            # Get the appropriate handler method
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(),
+                                  self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            # Sync handlers, such as `.options()`, are run in a thread.
+            if not iscoroutinefunction(handler):
+                handler = sync_to_async(handler)
+            with request.timer.phase('handler'):
+                response = await handler(request, *args, **kwargs)
 
         except Exception as exc:
             response = self.handle_exception(exc)
@@ -24,6 +24,7 @@ from django.utils.decorators import classonlymethod
 from django.views.decorators.csrf import csrf_exempt
 
 from rest_framework import generics, mixins, views
+from rest_framework.compat import markcoroutinefunction
 from rest_framework.decorators import MethodMapper
 from rest_framework.reverse import reverse
 
@@ -99,8 +100,15 @@ class ViewSetMixin:
             raise TypeError("%s() received both `name` and `suffix`, which are "
                             "mutually exclusive arguments." % (cls.__name__))
 
+        # The view is async if the actions it is bound to are coroutines.
+        view_is_async = cls._handlers_are_async([
+            getattr(cls, action) for method, action in actions.items()
+            if method != 'options' and hasattr(cls, action)
+        ])
+
         def view(request, *args, **kwargs):
             self = cls(**initkwargs)
+            self.view_is_async = view_is_async
 
             if 'get' in actions and 'head' not in actions:
                 actions['head'] = actions['get']
@@ -136,7 +144,10 @@ class ViewSetMixin:
         view.cls = cls
         view.initkwargs = initkwargs
         view.actions = actions
-        return csrf_exempt(view)
+        view = csrf_exempt(view)
+        if view_is_async:
+            markcoroutinefunction(view)
+        return view
 
     def initialize_request(self, request, *args, **kwargs):
         """
@@ -0,0 +1,193 @@
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+
+from rest_framework import (
+    permissions, serializers, status, throttling, viewsets
+)
+from rest_framework.compat import iscoroutinefunction
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+from tests.models import BasicModel
+
+factory = APIRequestFactory()
+
+
+class AsyncView(APIView):
+    async def get(self, request, *args, **kwargs):
+        return Response({'method': 'GET', 'user': str(request.user)})
+
+    async def post(self, request, *args, **kwargs):
+        return Response({'method': 'POST', 'data': request.data})
+
+
+class AsyncModelView(AsyncView):
+    queryset = BasicModel.objects.none()
+    permission_classes = [permissions.DjangoModelPermissions]
+
+
+class AsyncOnlyPermission(permissions.BasePermission):
+    async def ahas_permission(self, request, view):
+        return request.query_params.get('allow') == 'yes'
+
+
+class DenyThrottle(throttling.BaseThrottle):
+    def allow_request(self, request, view):
+        return False
+
+    def wait(self):
+        return 10
+
+
+class BasicModelSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BasicModel
+        fields = ('id', 'text')
+
+
+class AsyncViewSet(viewsets.ViewSet):
+    async def list(self, request):
+        return Response({'action': self.action})
+
+
+class TestAsyncDispatch(TestCase):
+    def test_view_is_async(self):
+        assert AsyncView.view_is_async
+        assert iscoroutinefunction(AsyncView.as_view())
+        assert not APIView.view_is_async
+        assert not iscoroutinefunction(APIView.as_view())
+
+    def test_view_is_async_is_computed_once(self):
+        class SyncView(APIView):
+            def get(self, request):
+                return Response({'method': 'GET'})
+
+        view = SyncView.as_view()
+        assert SyncView.__dict__['_view_is_async'] is False
+        with mock.patch.object(SyncView, '_handlers_are_async', side_effect=AssertionError):
+            response = view(factory.get('/'))
+        assert response.data == {'method': 'GET'}
+
+        class AsyncSubclass(SyncView):
+            async def get(self, request):
+                return Response({'method': 'GET'})
+
+        assert AsyncSubclass.view_is_async
+
+    def test_get(self):
+        view = AsyncView.as_view()
+        response = async_to_sync(view)(factory.get('/'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'method': 'GET', 'user': 'AnonymousUser'}
+
+    def test_post(self):
+        view = AsyncView.as_view()
+        request = factory.post('/', {'a': 1}, format='json')
+        response = async_to_sync(view)(request)
+        assert response.data == {'method': 'POST', 'data': {'a': 1}}
+
+    def test_sync_options_handler(self):
+        view = AsyncView.as_view()
+        response = async_to_sync(view)(factory.options('/'))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['name'] == 'Async'
+
+    def test_method_not_allowed(self):
+        view = AsyncView.as_view()
+        response = async_to_sync(view)(factory.delete('/'))
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_mixed_handlers(self):
+        class MixedView(APIView):
+            async def get(self, request):
+                pass
+
+            def post(self, request):
+                pass
+
+        with pytest.raises(ImproperlyConfigured):
+            MixedView.as_view()
+
+    def test_viewset(self):
+        view = AsyncViewSet.as_view({'get': 'list'})
+        assert iscoroutinefunction(view)
+        response = async_to_sync(view)(factory.get('/'))
+        assert response.data == {'action': 'list'}
+
+
+class TestAsyncPolicies(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('user', 'user@example.com', 'password')
+
+    def test_authenticated(self):
+        view = AsyncView.as_view(permission_classes=[permissions.IsAuthenticated])
+        request = factory.get('/')
+        force_authenticate(request, self.user)
+        response = async_to_sync(view)(request)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['user'] == 'user'
+
+    def test_not_authenticated(self):
+        view = AsyncView.as_view(permission_classes=[permissions.IsAuthenticated])
+        response = async_to_sync(view)(factory.get('/'))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_sync_permission(self):
+        view = AsyncModelView.as_view()
+        request = factory.post('/', {}, format='json')
+        force_authenticate(request, self.user)
+        response = async_to_sync(view)(request)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_async_only_permission(self):
+        view = AsyncView.as_view(permission_classes=[AsyncOnlyPermission])
+        response = async_to_sync(view)(factory.get('/', {'allow': 'yes'}))
+        assert response.status_code == status.HTTP_200_OK
+        response = async_to_sync(view)(factory.get('/'))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_composed_permissions(self):
+        view = AsyncView.as_view(permission_classes=[
+            AsyncOnlyPermission | ~permissions.IsAuthenticated
+        ])
+        response = async_to_sync(view)(factory.get('/'))
+        assert response.status_code == status.HTTP_200_OK
+
+        request = factory.get('/')
+        force_authenticate(request, self.user)
+        response = async_to_sync(view)(request)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_throttle(self):
+        view = AsyncView.as_view(throttle_classes=[DenyThrottle])
+        response = async_to_sync(view)(factory.get('/'))
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response['Retry-After'] == '10'
+
+
+class TestAsyncSerializer(TestCase):
+    def test_is_valid_and_save(self):
+        serializer = BasicModelSerializer(data={'text': 'foo'})
+        assert async_to_sync(serializer.ais_valid)()
+        instance = async_to_sync(serializer.asave)()
+        assert BasicModel.objects.get().text == 'foo'
+        assert instance.text == 'foo'
+
+    def test_invalid(self):
+        serializer = BasicModelSerializer(data={})
+        with pytest.raises(serializers.ValidationError):
+            async_to_sync(serializer.ais_valid)(raise_exception=True)
+
+    def test_data(self):
+        instance = BasicModel.objects.create(text='foo')
+        serializer = BasicModelSerializer(BasicModel.objects.all(), many=True)
+
+        async def get_data():
+            return await serializer.adata
+
+        assert async_to_sync(get_data)() == [{'id': instance.id, 'text': 'foo'}]
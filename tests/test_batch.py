@@ -0,0 +1,202 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+from django.urls import include, path
+
+from rest_framework import (
+    authentication, permissions, routers, serializers, status, viewsets
+)
+from rest_framework.authtoken.models import Token
+from rest_framework.batch import BatchView
+from rest_framework.test import APIClient
+from tests.models import BasicModel
+
+
+class BasicModelSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BasicModel
+        fields = ('id', 'text')
+
+
+class BasicModelViewSet(viewsets.ModelViewSet):
+    queryset = BasicModel.objects.order_by('id')
+    serializer_class = BasicModelSerializer
+
+
+class UserViewSet(viewsets.ViewSet):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def list(self, request):
+        return HttpResponse('"%s"' % request.user, content_type='application/json')
+
+
+class TokenUserViewSet(UserViewSet):
+    authentication_classes = [authentication.TokenAuthentication]
+
+
+class SessionUserViewSet(UserViewSet):
+    authentication_classes = [authentication.SessionAuthentication]
+
+    def list(self, request):
+        authenticator = type(request.successful_authenticator).__name__
+        return HttpResponse('"%s"' % authenticator, content_type='application/json')
+
+
+class AtomicBatchView(BatchView):
+    atomic = True
+    max_requests = 3
+
+
+def plain_view(request):
+    return HttpResponse('plain')
+
+
+router = routers.DefaultRouter()
+router.include_batch_view = True
+router.register('basic', BasicModelViewSet)
+router.register('user', UserViewSet, basename='user')
+router.register('token-user', TokenUserViewSet, basename='token-user')
+router.register('session-user', SessionUserViewSet, basename='session-user')
+
+urlpatterns = [
+    path('api/', include(router.urls)),
+    path('atomic-batch/', AtomicBatchView.as_view()),
+    path('plain/', plain_view),
+]
+
+
+@override_settings(ROOT_URLCONF='tests.test_batch')
+class TestBatchView(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.instance = BasicModel.objects.create(text='foo')
+
+    def batch(self, requests, url='/api/batch/'):
+        return self.client.post(url, requests, format='json')
+
+    def test_batch(self):
+        response = self.batch([
+            {'method': 'GET', 'path': '/api/basic/%d/' % self.instance.id},
+            {'method': 'POST', 'path': '/api/basic/', 'body': {'text': 'bar'}},
+            {'method': 'GET', 'path': '/api/basic/?format=json'},
+            {'method': 'POST', 'path': '/api/basic/', 'body': {}},
+        ])
+        assert response.status_code == status.HTTP_200_OK
+        get, post, get_list, invalid = response.data
+
+        assert get['status'] == status.HTTP_200_OK
+        assert get['body'] == {'id': self.instance.id, 'text': 'foo'}
+        assert 'Allow' in get['headers']
+        assert get['headers']['Content-Type'] == 'application/json'
+
+        assert post['status'] == status.HTTP_201_CREATED
+        assert post['body']['text'] == 'bar'
+
+        assert get_list['status'] == status.HTTP_200_OK
+        assert [item['text'] for item in get_list['body']] == ['foo', 'bar']
+
+        assert invalid['status'] == status.HTTP_400_BAD_REQUEST
+        assert 'text' in invalid['body']
+
+    def test_shared_authentication(self):
+        user = User.objects.create_user('alice', 'alice@example.com', 'password')
+        self.client.force_authenticate(user)
+        response = self.batch([{'method': 'GET', 'path': '/api/user/'}])
+        assert response.data[0]['status'] == status.HTTP_200_OK
+        assert response.data[0]['body'] == 'alice'
+
+    def test_view_authentication_classes(self):
+        User.objects.create_user('alice', 'alice@example.com', 'password')
+        self.client.login(username='alice', password='password')
+        response = self.batch([
+            {'method': 'GET', 'path': '/api/session-user/'},
+            {'method': 'GET', 'path': '/api/token-user/'},
+        ])
+        session, token = response.data
+        assert session['status'] == status.HTTP_200_OK
+        assert session['body'] == 'SessionAuthentication'
+        assert token['status'] == status.HTTP_401_UNAUTHORIZED
+
+    def test_credentials_are_looked_up_once(self):
+        user = User.objects.create_user('alice', 'alice@example.com', 'password')
+        token = Token.objects.create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        authenticate_credentials = authentication.TokenAuthentication.authenticate_credentials
+        with mock.patch.object(
+            authentication.TokenAuthentication, 'authenticate_credentials',
+            autospec=True, side_effect=authenticate_credentials
+        ) as lookup:
+            response = self.batch([{'method': 'GET', 'path': '/api/token-user/'}] * 3)
+        assert [result['body'] for result in response.data] == ['alice'] * 3
+        assert lookup.call_count == 1
+
+    def test_unauthenticated(self):
+        response = self.batch([{'method': 'GET', 'path': '/api/user/'}])
+        assert response.data[0]['status'] == status.HTTP_403_FORBIDDEN
+
+    def test_invalid_paths(self):
+        response = self.batch([
+            {'method': 'GET', 'path': '/missing/'},
+            {'method': 'GET', 'path': '/plain/'},
+            {'method': 'POST', 'path': '/api/batch/', 'body': []},
+        ])
+        assert [result['status'] for result in response.data] == [404, 404, 404]
+
+    def test_invalid_batch(self):
+        response = self.batch([{'method': 'TRACE', 'path': 'basic/'}])
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.data[0]) == {'method', 'path'}
+
+        response = self.batch([])
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_max_requests(self):
+        request = {'method': 'GET', 'path': '/api/basic/'}
+        response = self.batch([request] * 4, url='/atomic-batch/')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_atomic(self):
+        response = self.batch([
+            {'method': 'POST', 'path': '/api/basic/', 'body': {'text': 'bar'}},
+            {'method': 'POST', 'path': '/api/basic/', 'body': {}},
+            {'method': 'POST', 'path': '/api/basic/', 'body': {'text': 'baz'}},
+        ], url='/atomic-batch/')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [result['status'] for result in response.data] == [201, 400, 424]
+        assert list(BasicModel.objects.values_list('text', flat=True)) == ['foo']
+
+    def test_atomic_requests(self):
+        connections.databases['default']['ATOMIC_REQUESTS'] = True
+        try:
+            response = self.batch([
+                {'method': 'POST', 'path': '/api/basic/', 'body': {'text': 'bar'}},
+                {'method': 'DELETE', 'path': '/api/basic/0/'},
+            ])
+        finally:
+            connections.databases['default']['ATOMIC_REQUESTS'] = False
+        assert [result['status'] for result in response.data] == [201, 404]
+        assert BasicModel.objects.filter(text='bar').exists()
+
+
+class TestBatchRoute(TestCase):
+    def test_not_included_by_default(self):
+        router = routers.DefaultRouter()
+        assert not [url for url in router.urls if url.name == 'api-batch']
+
+    def test_batch_prefix_collision(self):
+        router = routers.DefaultRouter()
+        router.include_batch_view = True
+        router.register('batch', BasicModelViewSet)
+        with pytest.raises(ImproperlyConfigured):
+            router.urls
+
+    def test_included(self):
+        router = routers.DefaultRouter(trailing_slash=False)
+        router.include_batch_view = True
+        batch_urls = [url for url in router.urls if url.name == 'api-batch']
+        assert str(batch_urls[0].pattern) == 'batch'
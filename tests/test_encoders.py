@@ -102,3 +102,56 @@ class JSONEncoderTests(TestCase):
         """
         foo = ReturnList(serializer=None)
         assert self.encoder.default(foo) == []
+
+
+class Money:
+    def __init__(self, amount):
+        self.amount = amount
+
+
+class LocalDate(date):
+    pass
+
+
+class JSONEncoderRegistryTests(TestCase):
+    def setUp(self):
+        class CustomJSONEncoder(JSONEncoder):
+            pass
+
+        self.encoder_class = CustomJSONEncoder
+
+    def test_register(self):
+        self.encoder_class.register(Money, lambda obj: str(obj.amount))
+        assert self.encoder_class().default(Money(5)) == '5'
+
+    def test_register_as_decorator(self):
+        @self.encoder_class.register(Money)
+        def encode_money(obj):
+            return obj.amount
+
+        assert self.encoder_class().default(Money(5)) == 5
+
+    def test_nearest_type_in_mro(self):
+        value = LocalDate(2020, 1, 2)
+        encoder = self.encoder_class()
+        assert encoder.default(value) == '2020-01-02'
+        assert encoder.default(datetime(2020, 1, 2, 3, 4, 5)) == '2020-01-02T03:04:05'
+
+        # Registering clears cached lookups.
+        self.encoder_class.register(LocalDate, lambda obj: obj.strftime('%d/%m/%Y'))
+        assert encoder.default(value) == '02/01/2020'
+        assert encoder.default(date(2020, 1, 2)) == '2020-01-02'
+
+    def test_registering_on_subclass_does_not_change_parent(self):
+        self.encoder_class.register(Money, lambda obj: obj.amount)
+        with pytest.raises(TypeError):
+            JSONEncoder().default(Money(5))
+        assert JSONEncoder.get_encoder(Money) is None
+
+    def test_registering_on_parent_changes_subclass(self):
+        class ChildJSONEncoder(self.encoder_class):
+            pass
+
+        assert ChildJSONEncoder().default(LocalDate(2020, 1, 2)) == '2020-01-02'
+        self.encoder_class.register(LocalDate, lambda obj: 'local')
+        assert ChildJSONEncoder().default(LocalDate(2020, 1, 2)) == 'local'
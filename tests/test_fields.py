@@ -1,3 +1,4 @@
+import copy
 import datetime
 import math
 import os
@@ -15,6 +16,7 @@ try:
 except ImportError:
     pytz = None
 
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import IntegerChoices, TextChoices
 from django.http import QueryDict
@@ -24,8 +26,8 @@ from django.utils.timezone import activate, deactivate, override
 import rest_framework
 from rest_framework import exceptions, serializers
 from rest_framework.fields import (
-    BuiltinSignatureError, DjangoImageField, SkipField, empty,
-    is_simple_callable
+    BuiltinSignatureError, DjangoImageField, SkipField,
+    compile_attribute_getter, empty, get_attribute, is_simple_callable
 )
 from tests.models import UUIDForeignKeyTarget
 
@@ -130,6 +132,73 @@ class TestIsSimpleCallable:
 
         assert is_simple_callable(valid)
 
+    def test_cached_result_distinguishes_bound_methods(self):
+        class Foo:
+            def valid(self):
+                pass
+
+        for _ in range(2):
+            assert not is_simple_callable(Foo.valid)
+            assert is_simple_callable(Foo().valid)
+
+
+class TestCompileAttributeGetter:
+    def test_matches_get_attribute(self):
+        class Foo:
+            def __init__(self, value):
+                self.value = value
+
+            def method(self):
+                return self
+
+        instances = [
+            Foo({'key': 'a'}),
+            {'method': lambda: Foo({'key': 'b'})},
+            Foo(Foo({'key': 'c'})),
+        ]
+        for attrs in (['value'], ['method', 'value'], ['value', 'key']):
+            getter = compile_attribute_getter(attrs)
+            for instance in instances:
+                try:
+                    expected = get_attribute(instance, attrs)
+                except (KeyError, AttributeError) as exc:
+                    with pytest.raises(type(exc)):
+                        getter(instance)
+                else:
+                    assert getter(instance) == expected
+
+    def test_empty_attrs(self):
+        instance = object()
+        assert compile_attribute_getter([])(instance) is instance
+
+    def test_object_does_not_exist(self):
+        class Foo:
+            @property
+            def related(self):
+                raise ObjectDoesNotExist()
+
+        assert compile_attribute_getter(['related', 'name'])(Foo()) is None
+
+    def test_callable_raising_attribute_error(self):
+        class Foo:
+            def method(self):
+                raise AttributeError('Oops')
+
+        with pytest.raises(ValueError) as exc_info:
+            compile_attribute_getter(['method'])(Foo())
+        assert 'Exception raised in callable attribute "method"' in str(exc_info.value)
+
+    def test_builtin_function(self):
+        with pytest.raises(BuiltinSignatureError):
+            compile_attribute_getter(['date'])(datetime.datetime.now())
+
+    def test_field_recompiles_when_source_attrs_change(self):
+        field = serializers.CharField()
+        field.bind('name', serializers.Serializer())
+        assert field.get_attribute({'name': 'a', 'other': 'b'}) == 'a'
+        field.source_attrs = ['other']
+        assert field.get_attribute({'name': 'a', 'other': 'b'}) == 'b'
+
 
 # Tests for field keyword arguments and core functionality.
 # ---------------------------------------------------------
@@ -639,6 +708,47 @@ class Test5087Regression:
         assert field.root is parent
 
 
+class TestFieldCloning:
+    def test_clone_has_independent_mutable_state(self):
+        field = serializers.CharField(max_length=10, style={'base_template': 'textarea.html'})
+        clone = copy.deepcopy(field)
+        clone.style['rows'] = 10
+        clone.validators.append(lambda value: None)
+        clone.error_messages['blank'] = 'Custom message.'
+        assert field.style == {'base_template': 'textarea.html'}
+        assert len(field.validators) == len(clone.validators) - 1
+        assert field.error_messages['blank'] != 'Custom message.'
+        assert clone.max_length == 10
+        assert clone._creation_counter > field._creation_counter
+
+    def test_clone_rebinds_child_fields(self):
+        field = serializers.ListField(child=serializers.IntegerField(min_value=1))
+        clone = copy.deepcopy(field)
+        assert clone.child is not field.child
+        assert clone.child.parent is clone
+        assert field.child.parent is field
+        assert clone.run_validation(['1', '2']) == [1, 2]
+
+    def test_clone_of_bound_field_is_unbound(self):
+        field = serializers.CharField()
+        field.bind('name', serializers.Serializer())
+        clone = copy.deepcopy(field)
+        assert clone.parent is None
+        assert clone.field_name is None
+        assert clone.label is None
+
+    def test_clone_of_serializer_rebuilds_fields(self):
+        class ExampleSerializer(serializers.Serializer):
+            name = serializers.CharField()
+
+        nested = ExampleSerializer()
+        assert list(nested.fields) == ['name']
+        clone = copy.deepcopy(nested)
+        clone.fields.pop('name')
+        assert list(nested.fields) == ['name']
+        assert 'name' in copy.deepcopy(nested).fields
+
+
 class TestTyping(TestCase):
     @pytest.mark.skipif(
         sys.version_info < (3, 7),
@@ -2568,6 +2678,139 @@ class TestSerializerMethodField:
         assert field.method_name == 'get_example_field'
 
 
+class BatchItem:
+    def __init__(self, name, children=()):
+        self.name = name
+        self.children = list(children)
+        self.first_child_reads = 0
+
+    @property
+    def first_child(self):
+        self.first_child_reads += 1
+        return self.children[0] if self.children else None
+
+
+class TestBatchedSerializerMethodField:
+    def setup_method(self):
+        self.calls = []
+        calls = self.calls
+
+        class ChildSerializer(serializers.Serializer):
+            name = serializers.CharField()
+            upper = serializers.BatchedSerializerMethodField()
+
+            def get_upper(self, objs):
+                calls.append([obj.name for obj in objs])
+                return {obj: obj.name.upper() for obj in objs}
+
+        class ParentSerializer(ChildSerializer):
+            children = ChildSerializer(many=True)
+
+        class WrapperSerializer(serializers.Serializer):
+            name = serializers.CharField()
+            child = ChildSerializer(source='first_child', allow_null=True)
+
+        self.child_serializer = ChildSerializer
+        self.parent_serializer = ParentSerializer
+        self.wrapper_serializer = WrapperSerializer
+
+    def test_single_object(self):
+        serializer = self.child_serializer(BatchItem('a'))
+        assert serializer.data == {'name': 'a', 'upper': 'A'}
+        assert self.calls == [['a']]
+
+    def test_many(self):
+        serializer = self.child_serializer([BatchItem('a'), BatchItem('b')], many=True)
+        assert serializer.data == [{'name': 'a', 'upper': 'A'}, {'name': 'b', 'upper': 'B'}]
+        assert self.calls == [['a', 'b']]
+
+    def test_nested_lists_are_batched_across_parents(self):
+        items = [
+            BatchItem('a', [BatchItem('a1'), BatchItem('a2')]),
+            BatchItem('b', [BatchItem('b1')]),
+        ]
+        serializer = self.parent_serializer(items, many=True)
+        assert serializer.data[1] == {
+            'name': 'b', 'upper': 'B', 'children': [{'name': 'b1', 'upper': 'B1'}]
+        }
+        assert sorted(self.calls) == [['a', 'b'], ['a1', 'a2', 'b1']]
+
+    def test_nested_list_in_single_object(self):
+        serializer = self.parent_serializer(BatchItem('a', [BatchItem('a1'), BatchItem('a2')]))
+        assert serializer.data['children'] == [
+            {'name': 'a1', 'upper': 'A1'}, {'name': 'a2', 'upper': 'A2'}
+        ]
+        assert sorted(self.calls) == [['a'], ['a1', 'a2']]
+
+    def test_nested_single_serializers_are_batched(self):
+        items = [BatchItem('a', [BatchItem('a1')]), BatchItem('b'), BatchItem('c', [BatchItem('c1')])]
+        serializer = self.wrapper_serializer(items, many=True)
+        assert serializer.data == [
+            {'name': 'a', 'child': {'name': 'a1', 'upper': 'A1'}},
+            {'name': 'b', 'child': None},
+            {'name': 'c', 'child': {'name': 'c1', 'upper': 'C1'}},
+        ]
+        assert self.calls == [['a1', 'c1']]
+        assert [item.first_child_reads for item in items] == [1, 1, 1]
+
+    def test_missing_objects_are_none(self):
+        class ExampleSerializer(serializers.Serializer):
+            example_field = serializers.BatchedSerializerMethodField()
+
+            def get_example_field(self, objs):
+                return {}
+
+        serializer = ExampleSerializer([BatchItem('a')], many=True)
+        assert serializer.data == [{'example_field': None}]
+
+    def test_mapping_keyed_by_pk(self):
+        class ExampleSerializer(serializers.Serializer):
+            example_field = serializers.BatchedSerializerMethodField()
+
+            def get_example_field(self, objs):
+                return {obj['pk']: obj['pk'] * 2 for obj in objs}
+
+        class Obj(dict):
+            pk = property(lambda self: self['pk'])
+
+        serializer = ExampleSerializer([Obj(pk=1), Obj(pk=2)], many=True)
+        assert serializer.data == [{'example_field': 2}, {'example_field': 4}]
+
+    def test_unhashable_objects(self):
+        class ExampleSerializer(serializers.Serializer):
+            example_field = serializers.BatchedSerializerMethodField()
+
+            def get_example_field(self, objs):
+                return [obj['value'] * 2 for obj in objs]
+
+        serializer = ExampleSerializer([{'value': 1}, {'value': 2}], many=True)
+        assert serializer.data == [{'example_field': 2}, {'example_field': 4}]
+        assert ExampleSerializer({'value': 3}).data == {'example_field': 6}
+
+    def test_wrong_number_of_values(self):
+        class ExampleSerializer(serializers.Serializer):
+            example_field = serializers.BatchedSerializerMethodField()
+
+            def get_example_field(self, objs):
+                return []
+
+        serializer = ExampleSerializer([BatchItem('a')], many=True)
+        with pytest.raises(ImproperlyConfigured):
+            serializer.data
+
+    def test_loader_is_cleared_after_errors(self):
+        class ExampleSerializer(serializers.Serializer):
+            example_field = serializers.BatchedSerializerMethodField()
+
+            def get_example_field(self, objs):
+                raise ValueError()
+
+        serializer = ExampleSerializer([BatchItem('a')], many=True)
+        with pytest.raises(ValueError):
+            serializer.data
+        assert serializer.child.fields['example_field'].batch_loader is None
+
+
 # Tests for ModelField.
 # ---------------------
 
@@ -8,6 +8,7 @@ from django.test import TestCase
 
 from rest_framework import generics, renderers, serializers, status
 from rest_framework.exceptions import ErrorDetail
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory
 from tests.models import (
@@ -173,6 +174,70 @@ class TestRootView(TestCase):
 EXPECTED_QUERIES_FOR_PUT = 2
 
 
+class StreamingRootView(RootView):
+    stream_results = True
+    stream_chunk_size = 2
+
+
+class TestStreamingListView(TestCase):
+    def setUp(self):
+        for item in ['foo', 'bar', 'baz', 'qux', 'quux']:
+            BasicModel(text=item).save()
+
+    def test_streamed_content_matches_response(self):
+        request = factory.get('/')
+        expected = RootView.as_view()(request).render().content
+        with self.assertNumQueries(0):
+            response = StreamingRootView.as_view()(factory.get('/'))
+        assert response.streaming
+        assert response['Content-Type'] == 'application/json'
+        with self.assertNumQueries(1):
+            assert b''.join(response.streaming_content) == expected
+
+    def test_chunks(self):
+        view = StreamingRootView()
+        chunks = list(view.iter_chunks(BasicModel.objects.order_by('pk')))
+        assert [[obj.text for obj in chunk] for chunk in chunks] == [['foo', 'bar'], ['baz', 'qux'], ['quux']]
+
+    def test_renderer_without_streaming_support(self):
+        class StreamingHTMLView(StreamingRootView):
+            renderer_classes = (renderers.BrowsableAPIRenderer,)
+
+        response = StreamingHTMLView.as_view()(factory.get('/', HTTP_ACCEPT='text/html'))
+        assert not response.streaming
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_renderer_with_overridden_render(self):
+        class NewlineJSONRenderer(renderers.JSONRenderer):
+            def render(self, data, accepted_media_type=None, renderer_context=None):
+                return super().render(data, accepted_media_type, renderer_context) + b'\n'
+
+        class StreamingNewlineView(StreamingRootView):
+            renderer_classes = (NewlineJSONRenderer,)
+
+        response = StreamingNewlineView.as_view()(factory.get('/'))
+        assert not response.streaming
+        assert response.render().content.endswith(b']\n')
+
+    def test_renderer_subclass_with_streaming_support(self):
+        class CompactJSONRenderer(renderers.JSONRenderer):
+            compact = True
+
+        class StreamingCompactView(StreamingRootView):
+            renderer_classes = (CompactJSONRenderer,)
+
+        response = StreamingCompactView.as_view()(factory.get('/'))
+        assert response.streaming
+
+    def test_paginated_lists_are_not_streamed(self):
+        class PaginatedStreamingView(StreamingRootView):
+            pagination_class = LimitOffsetPagination
+
+        response = PaginatedStreamingView.as_view()(factory.get('/', {'limit': 2}))
+        assert not response.streaming
+        assert len(response.data['results']) == 2
+
+
 class TestInstanceView(TestCase):
     def setUp(self):
         """
@@ -0,0 +1,147 @@
+import datetime
+import decimal
+import io
+import math
+import time
+import uuid
+
+import pytest
+from django.test import override_settings
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.compat import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.json_backends import (
+    JSONBackend, OrjsonBackend, has_non_finite_floats
+)
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import json
+
+backends = [
+    JSONBackend,
+    pytest.param(OrjsonBackend, marks=pytest.mark.skipif(orjson is None, reason='orjson is not installed')),
+]
+
+DATA = {
+    'id': 1,
+    'text': 'unicode ★     "quoted" \\ \x01',
+    'lazy': _('lazy'),
+    'nested': [{'a': None, 'b': True, 'c': False}, [], {}],
+    'decimal': decimal.Decimal('1.5'),
+    'float': 1.25,
+    'datetime': datetime.datetime(2020, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+    'naive_datetime': datetime.datetime(2020, 1, 2, 3, 4, 5),
+    'date': datetime.date(2020, 1, 2),
+    'time': datetime.time(3, 4, 5),
+    'timedelta': datetime.timedelta(seconds=90),
+    'uuid': uuid.UUID('9ae5c9ea-1b1b-4f5a-9a9c-7e0b8b1ad0b2'),
+    'bytes': b'bytes',
+    'tuple': (1, 2),
+    'generator': (idx for idx in range(3)),
+    'big_int': 2 ** 70,
+}
+
+
+@pytest.fixture(params=backends)
+def backend(request):
+    with override_settings(REST_FRAMEWORK={'JSON_BACKEND': request.param}):
+        yield request.param
+
+
+def render(renderer_context=None, **attrs):
+    renderer = JSONRenderer()
+    for key, value in attrs.items():
+        setattr(renderer, key, value)
+    data = dict(DATA, generator=(idx for idx in range(3)))
+    return renderer.render(data, renderer_context=renderer_context)
+
+
+def parse(content, **attrs):
+    parser = JSONParser()
+    for key, value in attrs.items():
+        setattr(parser, key, value)
+    return parser.parse(io.BytesIO(content))
+
+
+class TestRenderParity:
+    @pytest.mark.parametrize('options', [
+        {},
+        {'ensure_ascii': True},
+        {'compact': False},
+        {'renderer_context': {'indent': 2}},
+        {'renderer_context': {'indent': 4}},
+    ])
+    def test_matches_standard_library(self, backend, options):
+        expected = render(**options)
+        with override_settings(REST_FRAMEWORK={'JSON_BACKEND': JSONBackend}):
+            assert render(**options) == expected
+        assert b'\\u2028' in expected
+
+    def test_float_values(self, backend):
+        data = [0.1, 1e16, 1e-05, -0.0, 123456789.123]
+        assert json.loads(JSONRenderer().render(data)) == data
+
+    def test_strict_non_finite_floats(self, backend):
+        with pytest.raises(ValueError):
+            JSONRenderer().render({'value': None, 'nan': math.nan})
+
+    def test_non_strict_non_finite_floats(self, backend):
+        renderer = JSONRenderer()
+        renderer.strict = False
+        assert renderer.render([None, math.inf]) == b'[null,Infinity]'
+
+    def test_timezone_aware_time(self, backend):
+        value = datetime.time(1, tzinfo=datetime.timezone.utc)
+        with pytest.raises(ValueError):
+            JSONRenderer().render({'time': value})
+
+    def test_non_string_keys(self, backend):
+        assert JSONRenderer().render({1: 'a', None: 'b'}) == b'{"1":"a","null":"b"}'
+
+
+class TestParseParity:
+    @pytest.mark.parametrize('content', [
+        b'{"a": [1, 2.5, null, true, "\\u2605"], "b": {}}',
+        '{"text": "★"}'.encode(),
+        b'123456789012345678901234567890',
+    ])
+    def test_matches_standard_library(self, backend, content):
+        assert parse(content) == json.loads(content)
+
+    @pytest.mark.parametrize('content', [b'{"a": ', b'', b'{"a": NaN}', b'\xff'])
+    def test_errors(self, backend, content):
+        with override_settings(REST_FRAMEWORK={'JSON_BACKEND': JSONBackend}):
+            with pytest.raises(ParseError) as expected:
+                parse(content)
+        with pytest.raises(ParseError) as excinfo:
+            parse(content)
+        assert str(excinfo.value) == str(expected.value)
+
+    def test_non_strict(self, backend):
+        assert math.isnan(parse(b'{"a": NaN}', strict=False)['a'])
+
+
+def test_has_non_finite_floats():
+    assert not has_non_finite_floats({'a': [1.5, None, decimal.Decimal('1')]})
+    assert has_non_finite_floats({'a': [{'b': (math.nan,)}]})
+    assert has_non_finite_floats([decimal.Decimal('Infinity')])
+
+
+@pytest.mark.parametrize('backend_class', backends)
+def test_performance(backend_class):
+    """
+    Report the time taken to render and parse a large payload with each
+    available backend.
+    """
+    data = [
+        {'id': idx, 'name': 'name ★ %d' % idx, 'score': idx * 1.5, 'tags': ['a', 'b'], 'parent': None}
+        for idx in range(20000)
+    ]
+    backend = backend_class()
+    start = time.perf_counter()
+    content = backend.dumps(data, JSONRenderer.encoder_class, ensure_ascii=False, separators=(',', ':'))
+    parsed = backend.loads(content)
+    duration = time.perf_counter() - start
+    assert parsed == data
+    print('%s: %.3fs' % (backend_class.__name__, duration))
@@ -10,6 +10,7 @@ import decimal
 import json  # noqa
 import sys
 import tempfile
+from unittest import mock
 
 import django
 import pytest
@@ -21,10 +22,11 @@ from django.core.validators import (
 from django.db import models
 from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from rest_framework import serializers
 from rest_framework.compat import postgres_fields
+from rest_framework.utils import model_meta
 
 from .models import NestedForeignKeySource
 
@@ -1403,3 +1405,64 @@ class Issue6751Test(TestCase):
         serializer.save()
 
         self.assertEqual(instance.char_field, 'value changed by signal')
+
+
+class TestFieldsCache(TestCase):
+    def setUp(self):
+        serializers.clear_model_fields_cache()
+
+    def test_fields_are_built_once_per_class(self):
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = RegularFieldsModel
+                fields = ('auto_field', 'char_field')
+
+        get_field_info = model_meta.get_field_info
+        with mock.patch.object(model_meta, 'get_field_info', wraps=get_field_info) as mocked:
+            first = TestSerializer()
+            second = TestSerializer()
+            assert list(first.fields) == ['auto_field', 'char_field']
+            assert list(second.fields) == ['auto_field', 'char_field']
+        assert mocked.call_count == 1
+
+    def test_instances_get_independent_fields(self):
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = RegularFieldsModel
+                fields = ('auto_field', 'char_field')
+
+        first = TestSerializer()
+        first.fields['char_field'].max_length = 1
+        first.fields.pop('auto_field')
+        second = TestSerializer()
+        assert list(second.fields) == ['auto_field', 'char_field']
+        assert second.fields['char_field'].max_length == 100
+        assert second.fields['char_field'] is not first.fields['char_field']
+        assert second.fields['char_field'].parent is second
+
+    def test_cache_is_cleared_on_setting_changed(self):
+        class TestSerializer(serializers.HyperlinkedModelSerializer):
+            class Meta:
+                model = OneFieldModel
+                fields = '__all__'
+
+        assert 'url' in TestSerializer().fields
+        with override_settings(REST_FRAMEWORK={'URL_FIELD_NAME': 'link'}):
+            assert 'link' in TestSerializer().fields
+        assert 'url' in TestSerializer().fields
+
+    def test_overridden_builders_are_not_cached(self):
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = RegularFieldsModel
+                fields = ('auto_field', 'char_field')
+
+            def build_standard_field(self, field_name, model_field):
+                field_class, field_kwargs = super().build_standard_field(field_name, model_field)
+                field_kwargs['help_text'] = self.context.get('help_text')
+                return field_class, field_kwargs
+
+        first = TestSerializer(context={'help_text': 'first'})
+        second = TestSerializer(context={'help_text': 'second'})
+        assert first.fields['char_field'].help_text == 'first'
+        assert second.fields['char_field'].help_text == 'second'
@@ -1,14 +1,19 @@
+from unittest import mock
+
 import pytest
 from django.http import Http404
 from django.test import TestCase
 
+from rest_framework import exceptions, negotiation
 from rest_framework.negotiation import (
     BaseContentNegotiation, DefaultContentNegotiation
 )
+from rest_framework.parsers import BaseParser
 from rest_framework.renderers import BaseRenderer
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 from rest_framework.utils.mediatypes import _MediaType
+from rest_framework.views import APIView
 
 factory = APIRequestFactory()
 
@@ -85,6 +90,98 @@ class TestAcceptedMediaType(TestCase):
             self.negotiator.filter_renderers(renderers, format='json')
 
 
+class MockJSONParser(BaseParser):
+    media_type = 'application/json'
+
+
+class MockMultiPartParser(BaseParser):
+    media_type = 'multipart/form-data'
+
+
+class MockVersionedParser(BaseParser):
+    media_type = 'application/json; version=2'
+
+
+class NegotiationView(APIView):
+    pass
+
+
+class OtherNegotiationView(APIView):
+    pass
+
+
+class TestNegotiationCache(TestCase):
+    def setUp(self):
+        self.negotiator = DefaultContentNegotiation()
+        negotiation._renderer_cache.clear()
+        negotiation._parser_cache.clear()
+
+    def get_request(self, request, view_class=NegotiationView):
+        return Request(request, parser_context={'view': view_class()})
+
+    def test_renderer_selection_is_cached(self):
+        renderers = [MockJSONRenderer(), MockHTMLRenderer()]
+        with mock.patch.object(negotiation, '_match_renderer', wraps=negotiation._match_renderer) as match:
+            for _ in range(3):
+                request = self.get_request(factory.get('/', HTTP_ACCEPT='text/html, */*;q=0.8'))
+                renderer, media_type = self.negotiator.select_renderer(request, renderers)
+                assert renderer is renderers[1]
+                assert media_type == 'text/html'
+        assert match.call_count == 1
+
+    def test_cache_is_per_view_class(self):
+        renderers = [MockJSONRenderer()]
+        for view_class in (NegotiationView, OtherNegotiationView):
+            request = self.get_request(factory.get('/', HTTP_ACCEPT='application/json'), view_class)
+            self.negotiator.select_renderer(request, renderers)
+        assert len(negotiation._renderer_cache[NegotiationView]) == 1
+        assert len(negotiation._renderer_cache[OtherNegotiationView]) == 1
+
+    def test_cache_size(self):
+        renderers = [MockJSONRenderer()]
+        for idx in range(negotiation.NEGOTIATION_CACHE_SIZE + 10):
+            accept = 'application/json; q=0.%d' % idx
+            request = self.get_request(factory.get('/', HTTP_ACCEPT=accept), OtherNegotiationView)
+            self.negotiator.select_renderer(request, renderers)
+        request = self.get_request(factory.get('/', HTTP_ACCEPT='application/json'))
+        self.negotiator.select_renderer(request, renderers)
+        assert len(negotiation._renderer_cache[OtherNegotiationView]) <= negotiation.NEGOTIATION_CACHE_SIZE
+        assert len(negotiation._renderer_cache[NegotiationView]) == 1
+
+    def test_requests_without_a_view_are_not_cached(self):
+        request = Request(factory.get('/', HTTP_ACCEPT='application/json'))
+        self.negotiator.select_renderer(request, [MockJSONRenderer()])
+        assert not negotiation._renderer_cache
+
+    def test_cached_selection_uses_the_given_renderers(self):
+        request = self.get_request(factory.get('/', HTTP_ACCEPT='application/json'))
+        for _ in range(2):
+            renderers = [MockHTMLRenderer(), MockJSONRenderer()]
+            renderer, media_type = self.negotiator.select_renderer(request, renderers)
+            assert renderer is renderers[1]
+        renderers = [MockHTMLRenderer()]
+        with pytest.raises(exceptions.NotAcceptable):
+            self.negotiator.select_renderer(request, renderers)
+
+    def test_parser_selection_ignores_content_type_parameters(self):
+        parsers = [MockJSONParser(), MockMultiPartParser()]
+        for boundary in ('a', 'b'):
+            request = self.get_request(factory.post(
+                '/', content_type='multipart/form-data; boundary=%s' % boundary
+            ))
+            assert self.negotiator.select_parser(request, parsers) is parsers[1]
+        assert list(negotiation._parser_cache[NegotiationView]) == [
+            ('multipart/form-data', ('application/json', 'multipart/form-data'))
+        ]
+
+    def test_parser_selection_with_media_type_parameters(self):
+        parsers = [MockVersionedParser()]
+        request = self.get_request(factory.post('/', content_type='application/json; version=2'))
+        assert self.negotiator.select_parser(request, parsers) is parsers[0]
+        request = self.get_request(factory.post('/', content_type='application/json; version=1'))
+        assert self.negotiator.select_parser(request, parsers) is None
+
+
 class BaseContentNegotiationTests(TestCase):
 
     def setUp(self):
@@ -1,17 +1,20 @@
 import io
+import json
 import math
 
 import pytest
 from django import forms
+from django.core.exceptions import RequestDataTooBig
 from django.core.files.uploadhandler import (
     MemoryFileUploadHandler, TemporaryFileUploadHandler
 )
 from django.http.request import RawPostDataException
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from rest_framework.exceptions import ParseError
 from rest_framework.parsers import (
-    FileUploadParser, FormParser, JSONParser, MultiPartParser
+    FileUploadParser, FormParser, JSONParser, MultiPartParser,
+    StreamingJSONParser
 )
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
@@ -141,6 +144,99 @@ class TestJSONParser(TestCase):
         assert parser.parse(self.bytes('-Infinity')) == float('-inf')
         assert math.isnan(parser.parse(self.bytes('NaN')))
 
+    def test_charset(self):
+        parser = JSONParser()
+        stream = io.BytesIO('{"name": "caf\xe9"}'.encode('latin-1'))
+        assert parser.parse(stream, parser_context={'encoding': 'latin-1'}) == {'name': 'caf\xe9'}
+
+        stream = io.BytesIO('{"name": "caf\xe9"}'.encode('utf-16'))
+        assert parser.parse(stream, parser_context={'encoding': 'utf-16'}) == {'name': 'caf\xe9'}
+
+    def test_invalid_encoding(self):
+        with pytest.raises(ParseError):
+            JSONParser().parse(io.BytesIO(b'{"name": "caf\xe9"}'))
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=10)
+    def test_max_size(self):
+        parser = JSONParser()
+        assert parser.parse(self.bytes('[1, 2, 3]')) == [1, 2, 3]
+        assert parser.parse(self.bytes('[1, 2, 34]')) == [1, 2, 34]
+
+        stream = self.bytes('[1, 2, 3, 4]' + ' ' * 1000)
+        with pytest.raises(RequestDataTooBig):
+            parser.parse(stream)
+        # No more than one byte past the limit is read.
+        assert stream.tell() == 11
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=None)
+    def test_no_max_size(self):
+        assert JSONParser().parse(self.bytes('[%s]' % ', '.join(['1'] * 1000))) == [1] * 1000
+
+
+class TestStreamingJSONParser(TestCase):
+    data = [
+        1, -2.5e10, 'a"b\u2605', {'x': [1, {'y': None}]}, [], True, False, None,
+        12345678901234567890,
+    ]
+
+    def test_parse(self):
+        parser = StreamingJSONParser()
+        for indent in (None, 2):
+            content = json.dumps(self.data, ensure_ascii=False, indent=indent).encode()
+            # Items and numbers split across reads are parsed whole.
+            for read_size in (1, 2, 3, 64 * 1024):
+                parser.read_size = read_size
+                assert list(parser.parse(io.BytesIO(content))) == self.data
+
+        assert list(parser.parse(io.BytesIO(b' [ ] '))) == []
+
+    def test_items_are_read_incrementally(self):
+        parser = StreamingJSONParser()
+        parser.read_size = 8
+        stream = io.BytesIO(json.dumps([{'id': idx} for idx in range(100)]).encode())
+        items = parser.parse(stream)
+        assert next(items) == {'id': 0}
+        assert stream.tell() < 20
+
+    def test_charset(self):
+        parser = StreamingJSONParser()
+        parser.read_size = 3
+        stream = io.BytesIO('["caf\xe9", "\u2605"]'.encode('utf-16'))
+        assert list(parser.parse(stream, parser_context={'encoding': 'utf-16'})) == ['caf\xe9', '\u2605']
+
+    def test_errors(self):
+        parser = StreamingJSONParser()
+        parser.read_size = 2
+        for content, message in [
+            (b'{}', "Expecting JSON array: char 0"),
+            (b'', "Expecting JSON array: char 0"),
+            (b'[1 2]', "Expecting ',' delimiter: char 3"),
+            (b'[1,]', "Expecting value: char 3"),
+            (b'[1', "Expecting ',' delimiter: char 2"),
+            (b'[1] x', "Extra data: char 4"),
+        ]:
+            with pytest.raises(ParseError) as excinfo:
+                list(parser.parse(io.BytesIO(content)))
+            assert str(excinfo.value) == 'JSON parse error - ' + message
+
+    def test_float_strictness(self):
+        parser = StreamingJSONParser()
+        with pytest.raises(ParseError):
+            list(parser.parse(io.BytesIO(b'[NaN]')))
+
+        parser.strict = False
+        assert math.isnan(list(parser.parse(io.BytesIO(b'[NaN]')))[0])
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=20)
+    def test_max_item_size(self):
+        parser = StreamingJSONParser()
+        parser.read_size = 8
+        content = json.dumps(['a' * 10] * 10).encode()
+        assert list(parser.parse(io.BytesIO(content))) == ['a' * 10] * 10
+
+        with pytest.raises(RequestDataTooBig):
+            list(parser.parse(io.BytesIO(json.dumps(['a' * 100]).encode())))
+
 
 class TestPOSTAccessed(TestCase):
     def setUp(self):
@@ -1,9 +1,16 @@
 from django.contrib.auth.models import Group, User
+from django.db import connection
 from django.db.models.query import Prefetch
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import generics, serializers
 from rest_framework.test import APIRequestFactory
+from rest_framework.utils.query_plan import QueryPlan, get_query_plan
+
+from .models import (
+    ForeignKeySource, ForeignKeyTarget, NestedForeignKeySource, OneToOneTarget
+)
 
 factory = APIRequestFactory()
 
@@ -90,3 +97,237 @@ class TestPrefetchRelatedUpdates(TestCase):
         )
         with self.assertNumQueries(16):
             UserUpdateWithoutPrefetchRelated.as_view()(request, pk=self.user.pk)
+
+
+class TargetSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ForeignKeyTarget
+        fields = ('id', 'name')
+
+
+class SourceSerializer(serializers.ModelSerializer):
+    target = TargetSerializer()
+
+    class Meta:
+        model = ForeignKeySource
+        fields = ('id', 'name', 'target')
+
+
+class TargetWithSourcesSerializer(serializers.ModelSerializer):
+    sources = SourceSerializer(many=True)
+    nullable_sources = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+
+    class Meta:
+        model = ForeignKeyTarget
+        fields = ('id', 'name', 'sources', 'nullable_sources')
+
+
+class NestedSourceSerializer(serializers.ModelSerializer):
+    target_name = serializers.CharField(source='target.name')
+    target_target = serializers.PrimaryKeyRelatedField(source='target.target', read_only=True)
+    target_target_name = serializers.StringRelatedField(source='target.target')
+
+    class Meta:
+        model = NestedForeignKeySource
+        fields = ('id', 'target', 'target_name', 'target_target', 'target_target_name')
+
+
+class SourceListView(generics.ListAPIView):
+    queryset = ForeignKeySource.objects.order_by('pk')
+    serializer_class = SourceSerializer
+    auto_prefetch = True
+
+
+class TargetRetrieveView(generics.RetrieveAPIView):
+    queryset = ForeignKeyTarget.objects.all()
+    serializer_class = TargetWithSourcesSerializer
+    auto_prefetch = True
+
+
+class TestQueryPlan(TestCase):
+    def test_nested_forward_relation(self):
+        plan = get_query_plan(SourceSerializer(), ForeignKeySource)
+        assert plan == QueryPlan(select_related=['target'])
+
+    def test_nested_reverse_relations(self):
+        plan = get_query_plan(TargetWithSourcesSerializer(many=True), ForeignKeyTarget)
+        assert plan == QueryPlan(prefetch_related=['sources', 'sources__target', 'nullable_sources'])
+
+    def test_dotted_sources(self):
+        plan = get_query_plan(NestedSourceSerializer(), NestedForeignKeySource)
+        assert plan == QueryPlan(select_related=['target', 'target__target'])
+
+    def test_pk_only_relation(self):
+        class PKSourceSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = ForeignKeySource
+                fields = ('id', 'name', 'target')
+
+        plan = get_query_plan(PKSourceSerializer(), ForeignKeySource)
+        assert plan == QueryPlan()
+        assert not plan
+
+    def test_reverse_one_to_one(self):
+        class OneToOneTargetSerializer(serializers.ModelSerializer):
+            nullable_source = serializers.StringRelatedField()
+
+            class Meta:
+                model = OneToOneTarget
+                fields = ('id', 'nullable_source')
+
+        plan = get_query_plan(OneToOneTargetSerializer(), OneToOneTarget)
+        assert plan == QueryPlan(select_related=['nullable_source'])
+
+    def test_unfollowable_sources_are_skipped(self):
+        class TargetSerializer(serializers.ModelSerializer):
+            first_source = serializers.StringRelatedField()
+            method = serializers.SerializerMethodField()
+
+            class Meta:
+                model = ForeignKeyTarget
+                fields = ('id', 'first_source', 'method')
+
+            def get_method(self, obj):
+                return None
+
+        assert get_query_plan(TargetSerializer(), ForeignKeyTarget) == QueryPlan()
+
+    def test_repr(self):
+        plan = QueryPlan(select_related=['target'], prefetch_related=['sources'])
+        assert repr(plan) == "<QueryPlan select_related=['target'] prefetch_related=['sources']>"
+
+    def test_values_queryset_is_unchanged(self):
+        queryset = ForeignKeySource.objects.values('id')
+        assert QueryPlan(select_related=['target']).apply(queryset) is queryset
+
+
+class TestAutoPrefetch(TestCase):
+    def setUp(self):
+        for idx in range(3):
+            target = ForeignKeyTarget.objects.create(name='target-%d' % idx)
+            for source_idx in range(3):
+                ForeignKeySource.objects.create(name='source-%d' % source_idx, target=target)
+        self.target = target
+
+    def test_list_view(self):
+        request = factory.get('/')
+        with self.assertNumQueries(1):
+            response = SourceListView.as_view()(request)
+        assert len(response.data) == 9
+        assert response.data[0]['target'] == {'id': 1, 'name': 'target-0'}
+
+    def test_list_view_without_auto_prefetch(self):
+        view = SourceListView.as_view(auto_prefetch=False)
+        request = factory.get('/')
+        with self.assertNumQueries(10):
+            view(request)
+
+    def test_retrieve_view(self):
+        request = factory.get('/')
+        with self.assertNumQueries(3):
+            response = TargetRetrieveView.as_view()(request, pk=self.target.pk)
+        assert [source['name'] for source in response.data['sources']] == [
+            'source-0', 'source-1', 'source-2'
+        ]
+
+    def test_get_query_plan(self):
+        view = TargetRetrieveView()
+        view.request = None
+        view.format_kwarg = None
+        plan = view.get_query_plan(view.get_queryset())
+        assert plan == QueryPlan(prefetch_related=['sources', 'sources__target', 'nullable_sources'])
+
+
+class TargetNameSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ForeignKeyTarget
+        fields = ('name',)
+
+
+class SourceTargetSerializer(serializers.ModelSerializer):
+    target = TargetNameSerializer()
+
+    class Meta:
+        model = ForeignKeySource
+        fields = ('id', 'target')
+        prune_columns = True
+
+
+class PrunedSourceListView(generics.ListAPIView):
+    queryset = ForeignKeySource.objects.order_by('pk')
+    serializer_class = SourceTargetSerializer
+    auto_prefetch = True
+
+
+class TestColumnPruning(TestCase):
+    def setUp(self):
+        target = ForeignKeyTarget.objects.create(name='target')
+        ForeignKeySource.objects.create(name='source', target=target)
+
+    def test_nested_forward_relation(self):
+        plan = get_query_plan(SourceSerializer(), ForeignKeySource, prune_columns=True)
+        assert plan == QueryPlan(select_related=['target'], only=['id', 'name', 'target', 'target__id', 'target__name'])
+
+    def test_meta_option(self):
+        plan = get_query_plan(SourceTargetSerializer(many=True), ForeignKeySource)
+        assert plan.only == ['id', 'target', 'target__name']
+        assert get_query_plan(SourceTargetSerializer(), ForeignKeySource, prune_columns=False).only is None
+
+    def test_pk_only_relation(self):
+        class PKSourceSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = ForeignKeySource
+                fields = ('id', 'target')
+
+        plan = get_query_plan(PKSourceSerializer(), ForeignKeySource, prune_columns=True)
+        assert plan == QueryPlan(only=['id', 'target'])
+
+    def test_unknown_related_fields_are_loaded(self):
+        plan = get_query_plan(NestedSourceSerializer(), NestedForeignKeySource, prune_columns=True)
+        assert plan.only == ['id', 'target', 'target__name', 'target__target']
+
+    def test_unknown_fields_disable_pruning(self):
+        class MethodSourceSerializer(serializers.ModelSerializer):
+            method = serializers.SerializerMethodField()
+
+            class Meta:
+                model = ForeignKeySource
+                fields = ('id', 'method')
+
+            def get_method(self, obj):
+                return obj.name
+
+        plan = get_query_plan(MethodSourceSerializer(), ForeignKeySource, prune_columns=True)
+        assert plan.only is None
+
+    def test_prefetched_relations_are_not_pruned(self):
+        plan = get_query_plan(TargetWithSourcesSerializer(), ForeignKeyTarget, prune_columns=True)
+        assert plan.only == ['id', 'name']
+
+    def test_deferred_queryset_is_not_pruned(self):
+        queryset = ForeignKeySource.objects.defer('name')
+        plan = QueryPlan(only=['id'])
+        assert plan.apply(queryset).query.deferred_loading == queryset.query.deferred_loading
+
+    def test_existing_select_related_is_kept(self):
+        queryset = ForeignKeySource.objects.select_related('target')
+        plan = QueryPlan(only=['id'])
+        assert plan.get_only(queryset) == ['id', 'target']
+        assert plan.apply(queryset).get().target.name == 'target'
+
+    def test_list_view(self):
+        request = factory.get('/')
+        with CaptureQueriesContext(connection) as context:
+            response = PrunedSourceListView.as_view()(request)
+        assert response.data == [{'id': 1, 'target': {'name': 'target'}}]
+        assert len(context.captured_queries) == 1
+        sql = context.captured_queries[0]['sql']
+        assert '"tests_foreignkeysource"."name"' not in sql
+        assert '"tests_foreignkeytarget"."name"' in sql
+
+    def test_view_option(self):
+        view = SourceListView.as_view(prune_columns=True)
+        request = factory.get('/')
+        with CaptureQueriesContext(connection) as context:
+            view(request)
+        assert len(context.captured_queries) == 1
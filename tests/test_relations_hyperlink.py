@@ -1,7 +1,9 @@
+import pytest
 from django.test import TestCase, override_settings
 from django.urls import path
 
 from rest_framework import serializers
+from rest_framework.relations import _resolve
 from rest_framework.test import APIRequestFactory
 from tests.models import (
     ForeignKeySource, ForeignKeyTarget, ManyToManySource, ManyToManyTarget,
@@ -447,3 +449,48 @@ class HyperlinkedNullableOneToOneTests(TestCase):
             {'url': 'http://testserver/onetoonetarget/2/', 'name': 'target-2', 'nullable_source': None},
         ]
         assert serializer.data == expected
+
+
+@override_settings(ROOT_URLCONF='tests.test_relations_hyperlink')
+class HyperlinkedBatchedLookupTests(TestCase):
+    def setUp(self):
+        self.targets = [ManyToManyTarget.objects.create(name='target-%d' % idx) for idx in range(5)]
+        self.urls = ['http://testserver/manytomanytarget/%d/' % target.pk for target in self.targets]
+
+    def get_field(self):
+        field = serializers.HyperlinkedRelatedField(
+            view_name='manytomanytarget-detail', queryset=ManyToManyTarget.objects.all(), many=True
+        )
+        field.bind('targets', serializers.Serializer(context={'request': request}))
+        return field
+
+    def test_many_single_query(self):
+        with self.assertNumQueries(1):
+            assert self.get_field().run_validation(self.urls) == self.targets
+
+    def test_many_errors(self):
+        data = self.urls[:1] + ['http://testserver/manytomanytarget/999/', 'http://testserver/dummyurl/1/']
+        with self.assertNumQueries(1):
+            with pytest.raises(serializers.ValidationError) as excinfo:
+                self.get_field().run_validation(data)
+        assert excinfo.value.detail == [
+            'Invalid hyperlink - Object does not exist.',
+            'Invalid hyperlink - Incorrect URL match.',
+        ]
+
+    def test_resolve_cache(self):
+        _resolve.cache_clear()
+        self.get_field().run_validation(self.urls)
+        self.get_field().run_validation(self.urls)
+        info = _resolve.cache_info()
+        assert info.misses == 5
+        assert info.hits == 15
+
+    def test_list_serializer_batch_relations(self):
+        data = [{'name': 'source-%d' % idx, 'targets': self.urls[idx:]} for idx in range(3)]
+        serializer = ManyToManySourceSerializer(
+            data=data, many=True, batch_relations=True, context={'request': request}
+        )
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data[1]['targets'] == self.targets[1:]
@@ -1,3 +1,4 @@
+import pytest
 from django.test import TestCase
 
 from rest_framework import serializers
@@ -617,3 +618,74 @@ class OneToOnePrimaryKeyTests(TestCase):
         self.assertFalse(source.is_valid())
         self.assertIn("Invalid pk", source.errors['target'][0])
         self.assertIn("object does not exist", source.errors['target'][0])
+
+
+class PKBatchedLookupTests(TestCase):
+    def setUp(self):
+        self.targets = [ManyToManyTarget.objects.create(name='target-%d' % idx) for idx in range(5)]
+
+    def test_many_to_many_single_query(self):
+        field = serializers.PrimaryKeyRelatedField(queryset=ManyToManyTarget.objects.all(), many=True)
+        pks = [target.pk for target in self.targets]
+        with self.assertNumQueries(1):
+            assert field.run_validation([str(pk) for pk in reversed(pks)]) == list(reversed(self.targets))
+
+    def test_many_to_many_missing_pks(self):
+        field = serializers.PrimaryKeyRelatedField(queryset=ManyToManyTarget.objects.all(), many=True)
+        with self.assertNumQueries(1):
+            with pytest.raises(serializers.ValidationError) as excinfo:
+                field.run_validation([self.targets[0].pk, 998, 999])
+        assert excinfo.value.detail == [
+            'Invalid pk "998" - object does not exist.',
+            'Invalid pk "999" - object does not exist.',
+        ]
+
+    def test_many_to_many_incorrect_type(self):
+        field = serializers.PrimaryKeyRelatedField(queryset=ManyToManyTarget.objects.all(), many=True)
+        with pytest.raises(serializers.ValidationError) as excinfo:
+            field.run_validation([self.targets[0].pk, True, 'abc'])
+        assert excinfo.value.detail == [
+            'Incorrect type. Expected pk value, received bool.',
+            'Incorrect type. Expected pk value, received str.',
+        ]
+
+    def test_pk_field(self):
+        targets = [UUIDForeignKeyTarget.objects.create(name='target-%d' % idx) for idx in range(3)]
+        field = serializers.PrimaryKeyRelatedField(
+            queryset=UUIDForeignKeyTarget.objects.all(), pk_field=serializers.UUIDField(), many=True
+        )
+        with self.assertNumQueries(1):
+            assert field.run_validation([str(target.pk).upper() for target in targets]) == targets
+
+    def test_overridden_to_internal_value_is_not_batched(self):
+        class CustomRelatedField(serializers.PrimaryKeyRelatedField):
+            def to_internal_value(self, data):
+                return super().to_internal_value(data)
+
+        field = CustomRelatedField(queryset=ManyToManyTarget.objects.all(), many=True)
+        with self.assertNumQueries(2):
+            field.run_validation([self.targets[0].pk, self.targets[1].pk])
+
+    def test_list_serializer_batch_relations(self):
+        target = ForeignKeyTarget.objects.create(name='target')
+        other = ForeignKeyTarget.objects.create(name='other')
+        data = [{'name': 'source-%d' % idx, 'target': [target.pk, other.pk][idx % 2]} for idx in range(10)]
+        serializer = ForeignKeySourceSerializer(data=data, many=True, batch_relations=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        assert [item['target'] for item in serializer.validated_data[:2]] == [target, other]
+
+    def test_list_serializer_batch_relations_errors(self):
+        target = ForeignKeyTarget.objects.create(name='target')
+        data = [{'name': 'source-1', 'target': target.pk}, {'name': 'source-2', 'target': 999}]
+        serializer = ForeignKeySourceSerializer(data=data, many=True, batch_relations=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [{}, {'target': ['Invalid pk "999" - object does not exist.']}]
+
+    def test_list_serializer_many_to_many(self):
+        pks = [target.pk for target in self.targets]
+        data = [{'name': 'source-%d' % idx, 'targets': pks[idx:]} for idx in range(3)]
+        serializer = ManyToManySourceSerializer(data=data, many=True, batch_relations=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data[2]['targets'] == self.targets[2:]
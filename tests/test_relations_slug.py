@@ -1,3 +1,4 @@
+import pytest
 from django.test import TestCase
 
 from rest_framework import serializers
@@ -285,3 +286,36 @@ class SlugNullableForeignKeyTests(TestCase):
             {'id': 3, 'name': 'source-3', 'target': None}
         ]
         assert serializer.data == expected
+
+
+class SlugBatchedLookupTests(TestCase):
+    def setUp(self):
+        self.targets = [ForeignKeyTarget.objects.create(name='target-%d' % idx) for idx in range(3)]
+        for idx in range(3):
+            ForeignKeySource.objects.create(name='source-%d' % idx, target=self.targets[0])
+
+    def test_many_single_query(self):
+        field = serializers.SlugRelatedField(slug_field='name', queryset=ForeignKeySource.objects.all(), many=True)
+        with self.assertNumQueries(1):
+            sources = field.run_validation(['source-2', 'source-0'])
+        assert [source.name for source in sources] == ['source-2', 'source-0']
+
+    def test_many_missing_slugs(self):
+        field = serializers.SlugRelatedField(slug_field='name', queryset=ForeignKeySource.objects.all(), many=True)
+        with self.assertNumQueries(1):
+            with pytest.raises(serializers.ValidationError) as excinfo:
+                field.run_validation(['source-0', 'missing'])
+        assert excinfo.value.detail == ['Object with name=missing does not exist.']
+
+    def test_duplicate_slugs_are_looked_up_individually(self):
+        ForeignKeySource.objects.create(name='source-0', target=self.targets[1])
+        field = serializers.SlugRelatedField(slug_field='name', queryset=ForeignKeySource.objects.all(), many=True)
+        with pytest.raises(ForeignKeySource.MultipleObjectsReturned):
+            field.run_validation(['source-0'])
+
+    def test_list_serializer_batch_relations(self):
+        data = [{'name': 'source-%d' % idx, 'target': 'target-%d' % (idx % 3)} for idx in range(6)]
+        serializer = ForeignKeySourceSerializer(data=data, many=True, batch_relations=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+        assert [item['target'] for item in serializer.validated_data[:3]] == self.targets
@@ -1,4 +1,5 @@
 import re
+import tracemalloc
 from collections.abc import MutableMapping
 
 import pytest
@@ -475,6 +476,71 @@ class TestJSONIndentationStyles:
         assert renderer.render(data) == b'{"a": 1, "b": 2}'
 
 
+class TestJSONRenderStream:
+    data = [{'a': idx, 'b': ['\u2028', None]} for idx in range(5)]
+
+    def render_stream(self, renderer, chunks, renderer_context=None):
+        return b''.join(renderer.render_stream(chunks, renderer_context=renderer_context))
+
+    @pytest.mark.parametrize('compact', [True, False])
+    @pytest.mark.parametrize('indent', [None, 4])
+    def test_matches_render(self, compact, indent):
+        renderer = JSONRenderer()
+        renderer.compact = compact
+        context = {'indent': indent}
+        chunks = [self.data[:2], [], self.data[2:4], self.data[4:]]
+        expected = renderer.render(self.data, renderer_context=context)
+        assert self.render_stream(renderer, iter(chunks), context) == expected
+
+    @pytest.mark.parametrize('indent', [None, 4])
+    def test_empty(self, indent):
+        renderer = JSONRenderer()
+        context = {'indent': indent}
+        assert self.render_stream(renderer, [], context) == b'[]'
+        assert self.render_stream(renderer, [[], []], context) == b'[]'
+        assert renderer.render([], renderer_context=context) == b'[]'
+
+
+class TestJSONRendererChunks:
+    data = [{'id': idx, 'name': 'name \u2605 %d' % idx, 'tags': ['\u2028']} for idx in range(2500)]
+
+    @pytest.mark.parametrize('ensure_ascii', [True, False])
+    @pytest.mark.parametrize('indent', [None, 2])
+    def test_long_lists_match_json_dumps(self, ensure_ascii, indent):
+        renderer = JSONRenderer()
+        renderer.ensure_ascii = ensure_ascii
+        separators = (',', ':') if indent is None else (',', ': ')
+        expected = json.dumps(self.data, ensure_ascii=ensure_ascii, indent=indent, separators=separators)
+        expected = expected.replace('\u2028', '\\u2028').encode()
+        assert renderer.render(self.data, renderer_context={'indent': indent}) == expected
+
+    def test_subclass_wrapping_render(self):
+        class NewlineJSONRenderer(JSONRenderer):
+            def render(self, data, accepted_media_type=None, renderer_context=None):
+                return super().render(data, accepted_media_type, renderer_context) + b'\n'
+
+        data = list(range(1500))
+        expected = json.dumps(data, separators=(',', ':')).encode() + b'\n'
+        assert NewlineJSONRenderer().render(data) == expected
+
+    def test_bytes_allocated_per_render(self):
+        """
+        Rendering allocates about twice the size of the output: the
+        rendered chunks, and the joined bytestring.
+        """
+        renderer = JSONRenderer()
+        renderer.ensure_ascii = False
+        data = self.data * 4
+        renderer.render(data)
+        tracemalloc.start()
+        try:
+            ret = renderer.render(data)
+            size, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 2.5 * len(ret)
+
+
 class TestHiddenFieldHTMLFormRenderer(TestCase):
     def test_hidden_field_rendering(self):
         class TestSerializer(serializers.Serializer):
@@ -1,9 +1,13 @@
+import uuid
+
 from django.test import TestCase, override_settings
-from django.urls import NoReverseMatch, path
+from django.urls import (
+    NoReverseMatch, converters, include, path, re_path, register_converter
+)
 
-from rest_framework.reverse import reverse
+from rest_framework.reverse import URLTemplates, get_lookup_regexes, reverse
 from rest_framework.test import APIRequestFactory
-from rest_framework.versioning import BaseVersioning
+from rest_framework.versioning import BaseVersioning, URLPathVersioning
 
 factory = APIRequestFactory()
 
@@ -12,8 +16,35 @@ def null_view(request):
     pass
 
 
+class YearConverter:
+    regex = '[0-9]{4}'
+
+    def to_python(self, value):
+        return int(value)
+
+    def to_url(self, value):
+        return '%04d' % int(value)
+
+
+class EvenConverter(converters.IntConverter):
+    regex = '[0-9]*[02468]'
+
+
+register_converter(YearConverter, 'year')
+register_converter(EvenConverter, 'even')
+
+
 urlpatterns = [
     path('view', null_view, name='view'),
+    path('items/<int:pk>/', null_view, name='item'),
+    path('items/<int:pk>.<str:format>', null_view, name='item'),
+    path('items/<uuid:pk>/', null_view, name='uuid-item'),
+    path('slugs/<slug:slug>/', null_view, name='slug-item'),
+    path('years/<year:year>/', null_view, name='year'),
+    path('even/<even:pk>/', null_view, name='even'),
+    path('ns/', include(([path('items/<int:pk>/', null_view, name='item')], 'app'), namespace='ns')),
+    re_path(r'^codes/(?P<code>[0-9]{3})/$', null_view, name='code'),
+    re_path(r'^(?P<version>v[12])/items/(?P<pk>[0-9]+)/$', null_view, name='versioned-item'),
 ]
 
 
@@ -52,3 +83,83 @@ class ReverseTests(TestCase):
 
         url = reverse('view', request=request)
         assert url == 'http://testserver/view'
+
+
+@override_settings(ROOT_URLCONF='tests.test_reverse')
+class URLTemplatesTests(TestCase):
+    def assert_matches_reverse(self, templates, viewname, kwarg, values, request=None):
+        for value in values:
+            expected = reverse(viewname, kwargs={kwarg: value}, request=request)
+            assert templates.get_url(viewname, kwarg, value) == expected
+
+    def test_matches_reverse(self):
+        request = factory.get('/view')
+        templates = URLTemplates(request)
+        self.assert_matches_reverse(templates, 'item', 'pk', [1, 2, 3, 10, 11, 12, 100, 5], request)
+
+    def test_uses_template(self):
+        calls = []
+
+        def counting_reverse(*args, **kwargs):
+            calls.append(args)
+            return reverse(*args, **kwargs)
+
+        templates = URLTemplates(reverse=counting_reverse)
+        self.assert_matches_reverse(templates, 'item', 'pk', range(10, 100))
+        assert len(calls) == 2
+
+    def test_uuid(self):
+        templates = URLTemplates()
+        self.assert_matches_reverse(templates, 'uuid-item', 'pk', [uuid.uuid4() for idx in range(5)])
+
+    def test_values_that_do_not_match_the_pattern(self):
+        templates = URLTemplates()
+        self.assert_matches_reverse(templates, 'code', 'code', [123, 456, 789])
+        with self.assertRaises(NoReverseMatch):
+            templates.get_url('code', 'code', 1234)
+
+    def test_format(self):
+        templates = URLTemplates(factory.get('/view'))
+        for value in range(1, 4):
+            assert templates.get_url('item', 'pk', value) == 'http://testserver/items/%d/' % value
+            assert templates.get_url('item', 'pk', value, format='json') == 'http://testserver/items/%d.json' % value
+
+    def test_versioning_scheme(self):
+        request = factory.get('/v2/items/')
+        request.versioning_scheme = URLPathVersioning()
+        request.version = 'v2'
+        templates = URLTemplates(request)
+        self.assert_matches_reverse(templates, 'versioned-item', 'pk', [1, 2, 3, 42, 43], request)
+        assert templates.get_url('versioned-item', 'pk', 2) == 'http://testserver/v2/items/2/'
+
+    def test_value_in_url_more_than_once(self):
+        request = factory.get('/v2/items/')
+        request.versioning_scheme = URLPathVersioning()
+        request.version = 'v2'
+        templates = URLTemplates(request)
+        self.assert_matches_reverse(templates, 'versioned-item', 'pk', [2, 2, 3, 2], request)
+
+    def test_slug_values_that_do_not_match_the_converter(self):
+        templates = URLTemplates()
+        self.assert_matches_reverse(templates, 'slug-item', 'slug', ['ab', 'cd', 'ef'])
+        with self.assertRaises(NoReverseMatch):
+            templates.get_url('slug-item', 'slug', 'g~')
+
+    def test_custom_converters(self):
+        templates = URLTemplates()
+        self.assert_matches_reverse(templates, 'year', 'year', [2020, 2021, 2022])
+        self.assert_matches_reverse(templates, 'year', 'year', [999])
+        self.assert_matches_reverse(templates, 'even', 'pk', [10, 12, 14])
+        with self.assertRaises(NoReverseMatch):
+            templates.get_url('even', 'pk', 13)
+
+    def test_lookup_regexes(self):
+        assert [regex.pattern for regex in get_lookup_regexes('item', 'pk')] == ['[0-9]+']
+        assert [regex.pattern for regex in get_lookup_regexes('ns:item', 'pk')] == ['[0-9]+']
+        assert get_lookup_regexes('code', 'code') is None
+        assert get_lookup_regexes('year', 'year') is None
+        assert get_lookup_regexes('missing:item', 'pk') is None
+
+    def test_namespace(self):
+        templates = URLTemplates()
+        self.assert_matches_reverse(templates, 'ns:item', 'pk', [1, 2, 3])
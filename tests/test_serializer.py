@@ -2,6 +2,7 @@ import inspect
 import pickle
 import re
 import sys
+import timeit
 import unittest
 from collections import ChainMap
 from collections.abc import Mapping
@@ -844,3 +845,73 @@ class TestMultipleObjectsValidation(unittest.TestCase):
                 many=True,
                 partial=True,
             )
+
+
+class TestReadPlan:
+    def setup_method(self):
+        class ExampleSerializer(serializers.Serializer):
+            char = serializers.CharField()
+            integer = serializers.IntegerField()
+            password = serializers.CharField(write_only=True)
+
+        self.Serializer = ExampleSerializer
+
+    def test_plan_excludes_write_only_fields(self):
+        serializer = self.Serializer()
+        plan = serializer.get_read_plan()
+        assert [field_name for field_name, _, _ in plan] == ['char', 'integer']
+
+    def test_plan_is_built_once_for_many(self):
+        instances = [{'char': 'a', 'integer': idx, 'password': 'x'} for idx in range(3)]
+        serializer = self.Serializer(instances, many=True)
+        child = serializer.child
+        calls = []
+        get_read_plan = child.get_read_plan
+
+        def counting_get_read_plan():
+            plan = get_read_plan()
+            calls.append(plan)
+            return plan
+
+        child.get_read_plan = counting_get_read_plan
+        assert serializer.data == [
+            {'char': 'a', 'integer': 0},
+            {'char': 'a', 'integer': 1},
+            {'char': 'a', 'integer': 2},
+        ]
+        assert len(calls) == 3
+        assert all(plan is calls[0] for plan in calls)
+
+    def test_plan_is_invalidated_when_fields_change(self):
+        serializer = self.Serializer({'char': 'a', 'integer': 1})
+        serializer.get_read_plan()
+        serializer.fields.pop('integer')
+        assert serializer.data == {'char': 'a'}
+        serializer.fields['extra'] = serializers.CharField(source='char')
+        assert serializer.to_representation({'char': 'b'}) == {'char': 'b', 'extra': 'b'}
+
+    def test_plan_is_faster_than_walking_fields(self):
+        """
+        Serializing many instances with the read plan beats walking
+        `.fields` for each instance, as `.to_representation()` used to.
+        """
+        serializer = self.Serializer()
+        instances = [{'char': 'a', 'integer': idx, 'password': 'x'} for idx in range(500)]
+
+        def walk_fields(instance):
+            ret = {}
+            for field in serializer._readable_fields:
+                attribute = field.get_attribute(instance)
+                ret[field.field_name] = field.to_representation(attribute)
+            return ret
+
+        def with_plan():
+            return [serializer.to_representation(instance) for instance in instances]
+
+        def without_plan():
+            return [walk_fields(instance) for instance in instances]
+
+        assert with_plan() == without_plan()
+        planned = min(timeit.repeat(with_plan, number=5, repeat=5))
+        walked = min(timeit.repeat(without_plan, number=5, repeat=5))
+        assert planned < walked
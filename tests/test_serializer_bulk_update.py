@@ -1,9 +1,18 @@
 """
 Tests to cover bulk create and update using serializers.
 """
+import io
+
+import pytest
+from django.db import models
 from django.test import TestCase
 
 from rest_framework import serializers
+from rest_framework.parsers import StreamingJSONParser
+
+from .models import (
+    ForeignKeySource, ForeignKeyTarget, ManyToManySource, ManyToManyTarget
+)
 
 
 class BulkCreateSerializerTests(TestCase):
@@ -121,3 +130,300 @@ class BulkCreateSerializerTests(TestCase):
         expected_errors = {'non_field_errors': ['Expected a list of items but got type "dict".']}
 
         assert serializer.errors == expected_errors
+
+
+class ManyToManySourceSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ManyToManySource
+        fields = ('id', 'name', 'targets')
+        bulk_create = True
+        batch_size = 2
+
+
+class ModelBulkCreateTests(TestCase):
+    """
+    Creating multiple model instances with `.bulk_create()`.
+    """
+
+    def setUp(self):
+        self.targets = [ManyToManyTarget.objects.create(name='target-%d' % idx) for idx in range(3)]
+
+    def test_bulk_create(self):
+        data = [
+            {'name': 'source-0', 'targets': [self.targets[0].pk, self.targets[1].pk]},
+            {'name': 'source-1', 'targets': [self.targets[1].pk]},
+            {'name': 'source-2', 'targets': [self.targets[2].pk, self.targets[2].pk]},
+        ]
+        serializer = ManyToManySourceSerializer(data=data, many=True)
+        assert serializer.is_valid()
+        # Two batches each of instances and through table rows, plus the
+        # savepoint around them.
+        with self.assertNumQueries(6):
+            instances = serializer.save()
+        assert [instance.pk for instance in instances] == list(
+            ManyToManySource.objects.order_by('pk').values_list('pk', flat=True)
+        )
+        assert serializer.data == [
+            {'id': instances[0].pk, 'name': 'source-0', 'targets': [self.targets[0].pk, self.targets[1].pk]},
+            {'id': instances[1].pk, 'name': 'source-1', 'targets': [self.targets[1].pk]},
+            {'id': instances[2].pk, 'name': 'source-2', 'targets': [self.targets[2].pk]},
+        ]
+
+    def test_overridden_create_is_used(self):
+        class CustomCreateSerializer(ManyToManySourceSerializer):
+            def create(self, validated_data):
+                validated_data['name'] = validated_data['name'].upper()
+                return super().create(validated_data)
+
+        serializer = CustomCreateSerializer(data=[{'name': 'source', 'targets': [self.targets[0].pk]}], many=True)
+        assert serializer.is_valid()
+        assert not serializer.child.can_bulk_create()
+        assert serializer.save()[0].name == 'SOURCE'
+
+    def test_not_enabled(self):
+        class DefaultSerializer(ManyToManySourceSerializer):
+            class Meta(ManyToManySourceSerializer.Meta):
+                bulk_create = False
+
+        assert not DefaultSerializer().can_bulk_create()
+
+
+class Person(models.Model):
+    name = models.CharField(max_length=100)
+    friends = models.ManyToManyField('self', blank=True)
+
+
+class PersonSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Person
+        fields = ('id', 'name', 'friends')
+        bulk_create = True
+
+
+class SymmetricalBulkCreateTests(TestCase):
+    def test_mirrored_rows(self):
+        alice = Person.objects.create(name='alice')
+        serializer = PersonSerializer(data=[
+            {'name': 'bob', 'friends': [alice.pk]},
+            {'name': 'carol', 'friends': [alice.pk, alice.pk]},
+        ], many=True)
+        assert serializer.is_valid()
+        bob, carol = serializer.save()
+        assert list(alice.friends.order_by('pk')) == [bob, carol]
+        assert list(bob.friends.all()) == [alice]
+        assert list(carol.friends.all()) == [alice]
+
+    def test_related_new_instances(self):
+        dave, erin = Person.objects.bulk_create([Person(name='dave'), Person(name='erin')])
+        PersonSerializer().bulk_set_many_to_many(
+            [dave, erin], [{'friends': [erin]}, {'friends': [dave, erin]}]
+        )
+        assert Person.friends.through.objects.count() == 3
+        assert list(dave.friends.all()) == [erin]
+        assert list(erin.friends.order_by('pk')) == [dave, erin]
+
+
+class ForeignKeyTargetSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ForeignKeyTarget
+        fields = ('id', 'name')
+
+    def validate_name(self, value):
+        if value == 'invalid':
+            raise serializers.ValidationError('Invalid name.')
+        return value
+
+
+class ChunkedCreateTests(TestCase):
+    """
+    Validating and creating multiple instances a chunk at a time.
+    """
+
+    def get_serializer(self, data, **kwargs):
+        chunks = self.chunks = []
+
+        class ChunkListSerializer(serializers.ListSerializer):
+            def create(self, validated_data):
+                chunks.append([attrs['name'] for attrs in validated_data])
+                return super().create(validated_data)
+
+        kwargs.setdefault('chunk_size', 2)
+        return ChunkListSerializer(child=ForeignKeyTargetSerializer(), data=data, **kwargs)
+
+    def test_chunked_create(self):
+        data = ({'name': 'target-%d' % idx} for idx in range(5))
+        serializer = self.get_serializer(data)
+        assert serializer.is_valid()
+        assert serializer.save() == []
+        assert self.chunks == [['target-0', 'target-1'], ['target-2', 'target-3'], ['target-4']]
+        assert list(ForeignKeyTarget.objects.order_by('pk').values_list('name', flat=True)) == [
+            'target-0', 'target-1', 'target-2', 'target-3', 'target-4'
+        ]
+        assert serializer.data == []
+
+    def test_streamed_request_body(self):
+        stream = io.BytesIO(b'[{"name": "a"}, {"name": "b"}, {"name": "c"}]')
+        serializer = self.get_serializer(StreamingJSONParser().parse(stream))
+        assert serializer.is_valid()
+        serializer.save()
+        assert self.chunks == [['a', 'b'], ['c']]
+
+    def test_invalid_item_saves_nothing(self):
+        data = [{'name': 'target-0'}, {'name': 'target-1'}, {'name': 'target-2'}, {'name': 'invalid'}]
+        serializer = self.get_serializer(data)
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as excinfo:
+            serializer.save()
+        assert excinfo.value.detail == {3: {'name': ['Invalid name.']}}
+        assert self.chunks == [['target-0', 'target-1']]
+        assert not ForeignKeyTarget.objects.exists()
+
+    def test_length_checks(self):
+        data = [{'name': 'target-%d' % idx} for idx in range(5)]
+        serializer = self.get_serializer(iter(data), max_length=3)
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as excinfo:
+            serializer.save()
+        assert excinfo.value.get_codes() == {'non_field_errors': ['max_length']}
+        # No more than one chunk past the limit is read.
+        assert self.chunks == [['target-0', 'target-1']]
+
+        serializer = self.get_serializer(iter(data), min_length=6)
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as excinfo:
+            serializer.save()
+        assert excinfo.value.get_codes() == {'non_field_errors': ['min_length']}
+
+        serializer = self.get_serializer(iter([]), allow_empty=False)
+        assert serializer.is_valid()
+        with pytest.raises(serializers.ValidationError) as excinfo:
+            serializer.save()
+        assert excinfo.value.get_codes() == {'non_field_errors': ['empty']}
+        assert not ForeignKeyTarget.objects.exists()
+
+    def test_invalid_data(self):
+        serializer = self.get_serializer({'name': 'target'})
+        assert not serializer.is_valid()
+        assert serializer.errors == {'non_field_errors': ['Expected a list of items but got type "dict".']}
+
+        serializer = self.get_serializer(None)
+        assert not serializer.is_valid()
+        assert serializer.errors == {'non_field_errors': ['No data provided']}
+
+    def test_many_init(self):
+        serializer = ForeignKeyTargetSerializer(data=[], many=True, chunk_size=100)
+        assert serializer.chunk_size == 100
+
+
+class ForeignKeySourceSerializer(serializers.ModelSerializer):
+    # The default `id` field is read-only, so the items couldn't be matched.
+    id = serializers.IntegerField(required=False)
+
+    class Meta:
+        model = ForeignKeySource
+        fields = ('id', 'name', 'target')
+        bulk_update = True
+
+
+class ModelBulkUpdateTests(TestCase):
+    """
+    Updating multiple model instances, matched by their `id`.
+    """
+
+    def setUp(self):
+        self.target = ForeignKeyTarget.objects.create(name='target')
+        self.other_target = ForeignKeyTarget.objects.create(name='other')
+        self.sources = [
+            ForeignKeySource.objects.create(name='source-%d' % idx, target=self.target)
+            for idx in range(3)
+        ]
+
+    def get_queryset(self):
+        return ForeignKeySource.objects.order_by('pk')
+
+    def test_bulk_update(self):
+        data = [
+            {'id': self.sources[2].pk, 'name': 'updated-2'},
+            {'id': self.sources[0].pk, 'target': self.other_target.pk},
+            {'id': self.sources[1].pk, 'name': 'source-1'},
+        ]
+        serializer = ForeignKeySourceSerializer(self.get_queryset(), data=data, many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        # One update for both changed instances, plus the savepoints around
+        # the whole update and around the bulk update.
+        with self.assertNumQueries(5):
+            instances = serializer.save()
+        assert [instance.pk for instance in instances] == [item['id'] for item in data]
+        assert list(self.get_queryset().values_list('name', 'target')) == [
+            ('source-0', self.other_target.pk),
+            ('source-1', self.target.pk),
+            ('updated-2', self.target.pk),
+        ]
+
+    def test_unknown_and_duplicate_items_are_invalid(self):
+        data = [
+            {'id': 999, 'name': 'unknown'},
+            {'id': self.sources[0].pk, 'name': 'first'},
+            {'id': str(self.sources[0].pk), 'name': 'second'},
+        ]
+        serializer = ForeignKeySourceSerializer(self.get_queryset(), data=data, many=True, partial=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [
+            {'id': ['Object with id=999 does not exist.']},
+            {},
+            {'id': ['Object with id=%s is included more than once.' % self.sources[0].pk]},
+        ]
+
+    def test_create_and_delete(self):
+        data = [
+            {'id': self.sources[0].pk, 'name': 'updated-0', 'target': self.target.pk},
+            {'name': 'created', 'target': self.target.pk},
+        ]
+        serializer = ForeignKeySourceSerializer(
+            self.get_queryset(), data=data, many=True, allow_create=True, allow_delete=True
+        )
+        assert serializer.is_valid(), serializer.errors
+        instances = serializer.save()
+        assert [instance.name for instance in instances] == ['updated-0', 'created']
+        assert list(self.get_queryset().values_list('name', flat=True)) == ['updated-0', 'created']
+
+    def test_failed_create_rolls_back_updates(self):
+        class FailingCreateSerializer(ForeignKeySourceSerializer):
+            def create(self, validated_data):
+                raise ValueError()
+
+        data = [
+            {'id': self.sources[0].pk, 'name': 'updated-0', 'target': self.target.pk},
+            {'name': 'created', 'target': self.target.pk},
+        ]
+        serializer = FailingCreateSerializer(
+            self.get_queryset(), data=data, many=True, allow_create=True, allow_delete=True
+        )
+        assert serializer.is_valid(), serializer.errors
+        with pytest.raises(ValueError):
+            serializer.save()
+        assert list(self.get_queryset().values_list('name', flat=True)) == [
+            'source-0', 'source-1', 'source-2'
+        ]
+
+    def test_update_without_bulk_update(self):
+        class PerItemSerializer(ForeignKeySourceSerializer):
+            class Meta(ForeignKeySourceSerializer.Meta):
+                bulk_update = False
+
+        data = [{'id': source.pk, 'name': 'updated'} for source in self.sources]
+        serializer = PerItemSerializer(self.get_queryset(), data=data, many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        assert not serializer.child.can_bulk_update()
+        # One update per instance, plus the savepoint around them.
+        with self.assertNumQueries(5):
+            serializer.save()
+        assert set(self.get_queryset().values_list('name', flat=True)) == {'updated'}
+
+    def test_positional_update_is_not_supported(self):
+        serializer = ForeignKeySourceSerializer(
+            self.get_queryset(), data=[{'name': 'updated'}] * 3, many=True, partial=True
+        )
+        assert serializer.is_valid(), serializer.errors
+        with self.assertRaises(NotImplementedError):
+            serializer.save()
@@ -0,0 +1,130 @@
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import connection
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+
+from rest_framework import generics, serializers
+from rest_framework.settings import api_settings
+from rest_framework.test import APIRequestFactory
+from rest_framework.timing import NULL_TIMER, RequestTimer, server_timing
+from rest_framework.views import APIView
+from tests.models import BasicModel
+
+factory = APIRequestFactory()
+
+collected = []
+
+
+def collect(request, response, view):
+    collected.append((request.timer, response, view))
+
+
+class BasicModelSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BasicModel
+        fields = ('id', 'text')
+
+
+class TimedListView(generics.ListCreateAPIView):
+    queryset = BasicModel.objects.all()
+    serializer_class = BasicModelSerializer
+    timing_collectors = [server_timing, collect]
+
+
+class TimedView(APIView):
+    timing_collectors = [collect]
+
+    def get(self, request):
+        return HttpResponse('plain')
+
+
+class AsyncTimedView(APIView):
+    timing_collectors = [server_timing, collect]
+
+    async def get(self, request):
+        count = await sync_to_async(BasicModel.objects.count)()
+        return HttpResponse(str(count))
+
+
+class TestRequestTimer(TestCase):
+    def test_phases_are_summed(self):
+        timer = RequestTimer()
+        with timer.phase('handler'):
+            BasicModel.objects.count()
+        with timer.phase('handler'):
+            BasicModel.objects.count()
+        assert timer.durations['handler'] > 0
+        assert timer.queries == {'handler': 2}
+        assert not connection.execute_wrappers
+
+    def test_without_query_counts(self):
+        timer = RequestTimer(count_queries=False)
+        with timer.phase('handler'):
+            BasicModel.objects.count()
+        assert 'handler' in timer.durations
+        assert timer.queries == {}
+
+    def test_null_timer(self):
+        with NULL_TIMER.phase('handler'):
+            pass
+        assert not NULL_TIMER.enabled
+
+
+class TestViewTiming(TestCase):
+    def setUp(self):
+        collected.clear()
+        BasicModel.objects.create(text='foo')
+
+    def test_server_timing_header(self):
+        response = TimedListView.as_view()(factory.get('/'))
+        response.render()
+        metrics = {
+            metric.split(';')[0]: metric
+            for metric in response['Server-Timing'].split(', ')
+        }
+        assert set(metrics) == {
+            'authentication', 'permissions', 'throttling', 'handler',
+            'serialization', 'rendering'
+        }
+        assert 'desc="1 queries"' in metrics['handler']
+        assert 'desc' not in metrics['rendering']
+
+    def test_collector(self):
+        view = TimedListView.as_view()
+        response = view(factory.post('/', {'text': 'bar'}, format='json'))
+        assert not collected
+        response.render()
+        assert len(collected) == 1
+        timer, collected_response, collected_view = collected[0]
+        assert collected_response is response
+        assert isinstance(collected_view, TimedListView)
+        assert 'parsing' in timer.durations
+        assert timer.queries['handler'] == 1
+
+    def test_plain_response(self):
+        TimedView.as_view()(factory.get('/'))
+        assert len(collected) == 1
+        assert 'handler' in collected[0][0].durations
+
+    def test_async_view(self):
+        response = async_to_sync(AsyncTimedView.as_view())(factory.get('/'))
+        assert response.content == b'1'
+        timer = collected[0][0]
+        assert {'authentication', 'permissions', 'throttling', 'handler'} <= set(timer.durations)
+        assert timer.queries == {}
+        assert 'desc' not in response['Server-Timing']
+
+    def test_disabled(self):
+        response = generics.ListAPIView.as_view(
+            queryset=BasicModel.objects.all(),
+            serializer_class=BasicModelSerializer
+        )(factory.get('/'))
+        response.render()
+        assert 'Server-Timing' not in response
+        assert response.renderer_context['request'].timer is NULL_TIMER
+
+    def test_setting(self):
+        with override_settings(REST_FRAMEWORK={'DEFAULT_TIMING_COLLECTORS': [
+            'rest_framework.timing.server_timing'
+        ]}):
+            assert api_settings.DEFAULT_TIMING_COLLECTORS == [server_timing]
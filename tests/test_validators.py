@@ -1,14 +1,17 @@
+import contextlib
 import datetime
 from unittest.mock import MagicMock
 
 import pytest
-from django.db import DataError, models
+from django.db import DataError, connection, models
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.validators import (
-    BaseUniqueForValidator, UniqueTogetherValidator, UniqueValidator, qs_exists
+    BaseUniqueForValidator, UniquenessBatch, UniqueTogetherValidator,
+    UniqueValidator, qs_exists
 )
 
 
@@ -465,6 +468,122 @@ class TestUniquenessTogetherValidation(TestCase):
         assert queryset.called_with == {'race_name': 'bar', 'position': 1}
 
 
+class TestBatchedUniquenessValidation(TestCase):
+    def setUp(self):
+        UniquenessModel.objects.create(username='existing')
+        UniquenessTogetherModel.objects.create(race_name='example', position=1)
+
+    @contextlib.contextmanager
+    def assertNumSelects(self, num):
+        # Within a transaction, the batched queries run in a savepoint.
+        with CaptureQueriesContext(connection) as context:
+            yield
+        selects = [query for query in context.captured_queries if query['sql'].startswith('SELECT')]
+        assert len(selects) == num
+
+    def test_unique_field_single_query(self):
+        data = [{'username': 'user-%d' % idx} for idx in range(20)]
+        serializer = UniquenessSerializer(data=data, many=True)
+        with self.assertNumSelects(1):
+            assert serializer.is_valid(), serializer.errors
+
+    def test_unique_field_errors(self):
+        data = [{'username': 'new'}, {'username': 'existing'}, {'username': 'new'}]
+        serializer = UniquenessSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == [
+            {},
+            {'username': ['uniqueness model with this username already exists.']},
+            {'username': ['uniqueness model with this username already exists.']},
+        ]
+        assert serializer.errors[1]['username'][0].code == 'unique'
+
+    def test_unique_field_excludes_matched_instances(self):
+        other = UniquenessModel.objects.create(username='other')
+        instances = list(UniquenessModel.objects.order_by('pk'))
+        data = [{'id': instances[0].pk, 'username': 'existing'}, {'id': other.pk, 'username': 'existing'}]
+        serializer = UniquenessSerializer(instances, data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors[0] == {}
+        assert list(serializer.errors[1]) == ['username']
+
+    def test_unique_together_single_query(self):
+        data = [{'race_name': 'example', 'position': idx} for idx in range(2, 12)]
+        serializer = UniquenessTogetherSerializer(data=data, many=True)
+        with self.assertNumSelects(1):
+            assert serializer.is_valid(), serializer.errors
+
+    def test_unique_together_batch_size(self):
+        checks = [(idx, {'race_name': 'example', 'position': idx}, None) for idx in range(1500)]
+        batch = UniquenessBatch()
+        batch_size = batch.get_batch_size(UniquenessTogetherModel.objects.all(), ['race_name', 'position'], checks)
+        assert batch_size <= batch.batch_size
+        max_query_params = connection.features.max_query_params
+        if max_query_params is not None:
+            assert batch_size * 2 <= max_query_params
+
+        data = [{'race_name': 'example', 'position': idx} for idx in range(2, 1502)]
+        serializer = UniquenessTogetherSerializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+
+    def test_invalid_value_in_batch(self):
+        class CharPositionSerializer(serializers.Serializer):
+            race_name = serializers.CharField()
+            position = serializers.CharField()
+
+            class Meta:
+                validators = [UniqueTogetherValidator(
+                    queryset=UniquenessTogetherModel.objects.all(),
+                    fields=('race_name', 'position')
+                )]
+
+        data = [
+            {'race_name': 'other', 'position': 'invalid'},
+            {'race_name': 'example', 'position': '1'},
+            {'race_name': 'example', 'position': '2'},
+        ]
+        serializer = CharPositionSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        message = 'The fields race_name, position must make a unique set.'
+        assert serializer.errors == [{}, {'non_field_errors': [message]}, {}]
+
+    def test_unique_together_errors(self):
+        data = [
+            {'race_name': 'example', 'position': 1},
+            {'race_name': 'other', 'position': 1},
+            {'race_name': 'other', 'position': 1},
+        ]
+        serializer = UniquenessTogetherSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        message = 'The fields race_name, position must make a unique set.'
+        assert serializer.errors == [
+            {'non_field_errors': [message]},
+            {},
+            {'non_field_errors': [message]},
+        ]
+
+    def test_unique_together_ignores_null_values(self):
+        data = [{'race_name': 'example', 'position': None}] * 2
+        serializer = NullUniquenessTogetherSerializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+
+    def test_custom_filter_queryset_is_not_batched(self):
+        class CustomUniqueValidator(UniqueValidator):
+            def filter_queryset(self, value, queryset, field_name):
+                return super().filter_queryset(value, queryset, field_name)
+
+        class CustomSerializer(serializers.Serializer):
+            username = serializers.CharField(
+                validators=[CustomUniqueValidator(queryset=UniquenessModel.objects.all())]
+            )
+
+        data = [{'username': 'existing'}, {'username': 'new'}]
+        serializer = CustomSerializer(data=data, many=True)
+        with self.assertNumQueries(2):
+            assert not serializer.is_valid()
+        assert serializer.errors == [{'username': ['This field must be unique.']}, {}]
+
+
 class UniqueConstraintModel(models.Model):
     race_name = models.CharField(max_length=100)
     position = models.IntegerField()
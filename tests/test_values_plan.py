@@ -0,0 +1,146 @@
+from django.test import TestCase
+
+from rest_framework import generics, serializers
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils.serializer_helpers import ValuesRow
+
+from .models import (
+    ForeignKeySource, ForeignKeyTarget, NullableForeignKeySource,
+    NullableOneToOneSource, OneToOneTarget
+)
+
+factory = APIRequestFactory()
+
+
+class TargetSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ForeignKeyTarget
+        fields = ('id', 'name')
+
+
+class SourceSerializer(serializers.ModelSerializer):
+    target = TargetSerializer()
+    target_name = serializers.CharField(source='target.name')
+
+    class Meta:
+        model = ForeignKeySource
+        fields = ('id', 'name', 'target', 'target_name')
+        use_values = True
+
+
+class NullableSourceSerializer(serializers.ModelSerializer):
+    target = TargetSerializer(allow_null=True)
+    target_id = serializers.PrimaryKeyRelatedField(source='target', read_only=True)
+
+    class Meta:
+        model = NullableForeignKeySource
+        fields = ('id', 'target', 'target_id')
+        use_values = True
+
+
+class OneToOneTargetSerializer(serializers.ModelSerializer):
+    nullable_source = serializers.PrimaryKeyRelatedField(read_only=True)
+
+    class Meta:
+        model = OneToOneTarget
+        fields = ('name', 'nullable_source')
+        use_values = True
+
+
+class InstanceSourceSerializer(SourceSerializer):
+    class Meta(SourceSerializer.Meta):
+        use_values = False
+
+
+class SourceListView(generics.ListAPIView):
+    queryset = ForeignKeySource.objects.order_by('pk')
+    serializer_class = SourceSerializer
+    pagination_class = LimitOffsetPagination
+
+
+class TestValuesPlan(TestCase):
+    def setUp(self):
+        self.target = ForeignKeyTarget.objects.create(name='target')
+        for idx in range(3):
+            ForeignKeySource.objects.create(name='source-%d' % idx, target=self.target)
+
+    def test_lookups(self):
+        plan = SourceSerializer().get_values_plan()
+        assert plan.lookups == ['id', 'name', 'target', 'target__id', 'target__name']
+
+    def test_matches_instance_representation(self):
+        queryset = ForeignKeySource.objects.order_by('pk')
+        with self.assertNumQueries(1):
+            data = SourceSerializer(queryset, many=True).data
+        assert data == InstanceSourceSerializer(queryset, many=True).data
+        assert data[0] == {
+            'id': 1,
+            'name': 'source-0',
+            'target': {'id': self.target.pk, 'name': 'target'},
+            'target_name': 'target',
+        }
+
+    def test_null_relations(self):
+        NullableForeignKeySource.objects.create(name='no target')
+        NullableForeignKeySource.objects.create(name='target', target=self.target)
+        queryset = NullableForeignKeySource.objects.order_by('pk')
+        assert NullableSourceSerializer(queryset, many=True).data == [
+            {'id': 1, 'target': None, 'target_id': None},
+            {'id': 2, 'target': {'id': self.target.pk, 'name': 'target'}, 'target_id': self.target.pk},
+        ]
+
+    def test_reverse_one_to_one(self):
+        target = OneToOneTarget.objects.create(name='target')
+        OneToOneTarget.objects.create(name='other')
+        source = NullableOneToOneSource.objects.create(name='source', target=target)
+        queryset = OneToOneTarget.objects.order_by('pk')
+        assert OneToOneTargetSerializer().get_values_plan().lookups == ['name', 'nullable_source__pk']
+        assert OneToOneTargetSerializer(queryset, many=True).data == [
+            {'name': 'target', 'nullable_source': source.pk},
+            {'name': 'other', 'nullable_source': None},
+        ]
+
+    def test_unsupported_fields_fall_back(self):
+        class MethodSourceSerializer(SourceSerializer):
+            method = serializers.SerializerMethodField()
+
+            class Meta(SourceSerializer.Meta):
+                fields = ('id', 'method')
+
+            def get_method(self, obj):
+                return obj.name
+
+        serializer = MethodSourceSerializer(ForeignKeySource.objects.order_by('pk'), many=True)
+        assert serializer.child.get_values_plan() is None
+        assert serializer.data[0] == {'id': 1, 'method': 'source-0'}
+
+    def test_overridden_to_representation_falls_back(self):
+        class CustomSourceSerializer(SourceSerializer):
+            def to_representation(self, instance):
+                return {'name': instance.name.upper()}
+
+        assert CustomSourceSerializer().get_values_plan() is None
+
+    def test_not_enabled(self):
+        assert InstanceSourceSerializer().get_values_plan() is None
+
+    def test_evaluated_queryset_is_unchanged(self):
+        queryset = ForeignKeySource.objects.all()
+        list(queryset)
+        assert SourceSerializer().get_values_plan().apply(queryset) is queryset
+
+    def test_paginated_list_view(self):
+        request = factory.get('/', {'limit': 2})
+        view = SourceListView.as_view()
+        with self.assertNumQueries(2):
+            response = view(request)
+        assert response.data['count'] == 3
+        assert [item['name'] for item in response.data['results']] == ['source-0', 'source-1']
+
+    def test_view_passes_rows_to_serializer(self):
+        view = SourceListView()
+        view.request = None
+        view.format_kwarg = None
+        queryset = view.apply_values_plan(view.get_queryset())
+        assert isinstance(queryset[0], ValuesRow)
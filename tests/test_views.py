@@ -2,12 +2,12 @@ import copy
 
 from django.test import TestCase
 
-from rest_framework import status
+from rest_framework import permissions, status, throttling
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.settings import APISettings, api_settings
 from rest_framework.test import APIRequestFactory
-from rest_framework.views import APIView
+from rest_framework.views import POLICY_CACHE_SIZE, APIView, _policy_cache
 
 factory = APIRequestFactory()
 
@@ -136,3 +136,99 @@ class TestCustomSettings(TestCase):
         response = self.view(request)
         assert response.status_code == 400
         assert response.data == {'error': 'SyntaxError'}
+
+
+class StatefulPermission(permissions.BasePermission):
+    def has_permission(self, request, view):
+        self.request = request
+        return True
+
+
+class ReusedPoliciesView(APIView):
+    reuse_stateless_policies = True
+    permission_classes = [
+        permissions.IsAuthenticatedOrReadOnly,
+        permissions.AllowAny & permissions.IsAuthenticatedOrReadOnly,
+        StatefulPermission,
+    ]
+    throttle_classes = [throttling.AnonRateThrottle]
+
+    def get(self, request, *args, **kwargs):
+        return Response({'method': 'GET'})
+
+
+class TestReuseStatelessPolicies(TestCase):
+    def setUp(self):
+        _policy_cache.clear()
+
+    def get_view(self):
+        view = ReusedPoliciesView()
+        view.request = factory.get('/')
+        return view
+
+    def test_stateless_policies_are_shared(self):
+        first, second = self.get_view(), self.get_view()
+        for name in ('get_renderers', 'get_parsers', 'get_authenticators'):
+            for one, two in zip(getattr(first, name)(), getattr(second, name)()):
+                assert (one is two) == vars(type(one)).get('stateless', False)
+        assert first.get_content_negotiator() is second.get_content_negotiator()
+
+    def test_stateful_policies_are_not_shared(self):
+        first, second = self.get_view(), self.get_view()
+        first_permissions = first.get_permissions()
+        second_permissions = second.get_permissions()
+        assert first_permissions[0] is second_permissions[0]
+        assert first_permissions[1] is second_permissions[1]
+        assert first_permissions[2] is not second_permissions[2]
+        assert first.get_throttles()[0] is not second.get_throttles()[0]
+
+    def test_composed_per_request(self):
+        first, second = self.get_view(), self.get_view()
+        for view in (first, second):
+            view.permission_classes = [permissions.AllowAny | ~permissions.IsAdminUser]
+        assert first.get_permissions()[0] is second.get_permissions()[0]
+        assert len(_policy_cache[ReusedPoliciesView]) == 1
+
+    def test_cache_size(self):
+        view = self.get_view()
+        for idx in range(POLICY_CACHE_SIZE + 10):
+            view.permission_classes = [type('Permission%d' % idx, (permissions.AllowAny,), {'stateless': True})]
+            view.get_permissions()
+        assert len(_policy_cache[ReusedPoliciesView]) == POLICY_CACHE_SIZE
+
+    def test_subclasses_are_not_shared(self):
+        class MessagePermission(permissions.IsAuthenticatedOrReadOnly):
+            def has_permission(self, request, view):
+                self.message = 'Denied for %s.' % request.path
+                return super().has_permission(request, view)
+
+        class StatelessSubclass(permissions.AllowAny):
+            stateless = True
+
+        first, second = self.get_view(), self.get_view()
+        for view in (first, second):
+            view.permission_classes = [
+                MessagePermission, MessagePermission | permissions.AllowAny, StatelessSubclass
+            ]
+        first_permissions = first.get_permissions()
+        second_permissions = second.get_permissions()
+        assert first_permissions[0] is not second_permissions[0]
+        assert first_permissions[1] is not second_permissions[1]
+        assert first_permissions[2] is second_permissions[2]
+
+    def test_policies_are_not_shared_by_default(self):
+        first, second = BasicView(), BasicView()
+        assert first.get_renderers()[0] is not second.get_renderers()[0]
+
+    def test_overridden_policy_classes(self):
+        view = self.get_view()
+        view.permission_classes = [permissions.IsAdminUser]
+        assert isinstance(view.get_permissions()[0], permissions.IsAdminUser)
+        assert len(self.get_view().get_permissions()) == 3
+
+    def test_dispatch(self):
+        view = ReusedPoliciesView.as_view()
+        for _ in range(2):
+            response = view(factory.get('/'))
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data == {'method': 'GET'}